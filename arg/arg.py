@@ -1,5 +1,5 @@
 import asyncio
-import dataclasses
+import heapq
 import io
 import json
 import time
@@ -29,6 +29,119 @@ from .helpers import (
     PIL_AVAILABLE,
 )
 from .models import PlantedSeedling, PlantedPlant, ShopItemDefinition
+from .views import ConfirmView
+
+_COLOR_BLUE = discord.Color.blue()
+_COLOR_DARK_MAGENTA = discord.Color.dark_magenta()
+_COLOR_DARK_TEAL = discord.Color.dark_teal()
+_COLOR_GREEN = discord.Color.green()
+_COLOR_LIGHT_GREY = discord.Color.light_grey()
+_COLOR_ORANGE = discord.Color.orange()
+_COLOR_PURPLE = discord.Color.purple()
+_COLOR_RED = discord.Color.red()
+_COLOR_TEAL = discord.Color.teal()
+_COLOR_YELLOW = discord.Color.yellow()
+
+# Static error embeds are built once and reused, since they carry no per-invocation data.
+_ERR_BOT_TRADE_TARGET = discord.Embed(
+    title="❌ Invalid Trade Target Entity",
+    description="Automated system entities (bots) are not authorized for asset exchange.",
+    color=_COLOR_RED
+).set_footer(text="Penny - Secure Exchange System: Entity Check")
+
+_ERR_SELF_TRADE = discord.Embed(
+    title="❌ Invalid Trade Operation: Self-Target",
+    description="Self-trading protocols are not permitted.",
+    color=_COLOR_RED
+).set_footer(text="Penny - Secure Exchange System: Operation Check")
+
+_ERR_INVALID_PLOT_DESIGNATORS = discord.Embed(
+    title="❌ Invalid Parameter: Plot Designators",
+    description="Plot designators must be numerical values.",
+    color=_COLOR_RED
+)
+
+_ERR_NEGATIVE_AMOUNT = discord.Embed(
+    title="❌ Invalid Input",
+    description="Amount cannot be negative. Use a positive integer or zero.",
+    color=_COLOR_RED
+)
+
+_ERR_NEGATIVE_MASTERY = discord.Embed(
+    title="❌ Invalid Input",
+    description="Mastery level cannot be negative. Use a positive integer or zero.",
+    color=_COLOR_RED
+)
+
+_ERR_NON_POSITIVE_QUANTITY = discord.Embed(
+    title="❌ Invalid Input",
+    description="Quantity must be a positive number.",
+    color=_COLOR_RED
+)
+
+_ERR_NON_POSITIVE_STOCK_AMOUNT = discord.Embed(
+    title="❌ Invalid Input",
+    description="Amount must be a positive integer.",
+    color=_COLOR_RED
+)
+
+_ERR_NON_POSITIVE_GROWTH_DURATION = discord.Embed(
+    title="❌ Invalid Input",
+    description="Growth duration must be a positive integer.",
+    color=_COLOR_RED
+)
+
+_ERR_INVALID_PENNY_INTERVAL = discord.Embed(
+    title="❌ Invalid Interval",
+    description="The interval must be a positive number of hours that divides 24 evenly (e.g., 1, 2, 3, 4, 6, 8, 12, "
+                "24).",
+    color=_COLOR_RED
+)
+
+_ERR_DEBUG_INVALID_PLOT = discord.Embed(
+    title="❌ Invalid Plot",
+    description="Plot number must be between 1 and 12.",
+    color=_COLOR_RED
+)
+
+_ERR_CUSTOM_PLANT_MISSING_KEYS = discord.Embed(
+    title="❌ Invalid Dictionary",
+    description="The provided dictionary string is missing one or more required keys (`id`, `name`, `type`).",
+    color=_COLOR_RED
+)
+
+_ERR_CUSTOM_PLANT_JSON = discord.Embed(
+    title="❌ JSON Error",
+    description="Failed to parse the provided string as a valid JSON dictionary.",
+    color=_COLOR_RED
+)
+
+_ERR_CUSTOM_PLANT_MISMATCH = discord.Embed(
+    title="❌ Dictionary Mismatch",
+    description="The keys in the provided dictionary do not match the required fields for a plant.",
+    color=_COLOR_RED
+)
+
+_REQUIRED_PLANT_KEYS = frozenset(("id", "name", "type"))
+
+_NAME_COUNT_FMT = "**{}** x{}".format
+
+_ALMANAC_ITEMS_PER_PAGE = 5
+
+# Discover pages whose have entries and recipes add up to more components than this are rendered in a worker thread.
+_DISCOVER_RENDER_OFFLOAD_THRESHOLD = 200
+
+
+def _discover_sort_key(info: dict) -> tuple:
+    """Orders almanac discover entries: craftable first, then by closeness to craftable, then by recipe size."""
+
+    group = info['sort_group']
+    f_def = info['fusion_def']
+    if group < 2:
+        return group, info['missing_count'], len(f_def.recipe), f_def.name
+    if group == 2:
+        return group, -info['have_count'], len(f_def.recipe), f_def.name
+    return group, len(f_def.recipe), f_def.name, 0
 
 
 class ARG(commands.Cog):
@@ -49,8 +162,8 @@ class ARG(commands.Cog):
         self.cog_data_path = data_manager.bundled_data_path(self)
         self.lock_helper = LockHelper()
         self.logger = LoggingHelper(bot, self.DISCORD_LOG_CHANNEL_ID)
-        self.data_loader = DataHelper(self.cog_data_path, self.logger)
-        self.data_loader.load_all_data()
+        self.data_loader = DataHelper(self.cog_data_path, self.logger,
+                                      data_manager.cog_data_path(self) / "parse_cache")
 
         self.game_state_helper = GameStateHelper(self.config, self.logger)
 
@@ -63,7 +176,13 @@ class ARG(commands.Cog):
         self.garden_helper: Optional[GardenHelper] = None
         self.shop_helper: Optional[ShopHelper] = None
 
-        self.growth_task = self.bot.loop.create_task(self.startup_and_growth_loop())
+        self.growth_task: Optional[asyncio.Task] = None
+
+    async def cog_load(self):
+        """Loads the data files before the cog is added, so a bad catalog entry aborts the load."""
+
+        await self.data_loader.load_all_data()
+        self.growth_task = asyncio.create_task(self.startup_and_growth_loop())
 
     def cog_unload(self):
         """Cog cleanup method."""
@@ -104,7 +223,12 @@ class ARG(commands.Cog):
         await self.logger.flush_init_log_queue()
         await self.logger.log_to_discord("Growth Loop: System Online.", "INFO")
 
-        await self._load_and_initialize_helpers()
+        try:
+            await self._load_and_initialize_helpers()
+        except Exception as e:
+            await self.logger.log_to_discord(
+                f"Growth Loop: CRITICAL Failure while initializing helpers: {e}\n{traceback.format_exc()}", "CRITICAL")
+            return
 
         await self.shop_helper.refresh_penny_shop_if_needed(self.logger)
         await self.shop_helper.refresh_dave_shop_if_needed(self.logger)
@@ -117,7 +241,7 @@ class ARG(commands.Cog):
             try:
                 loop_start_time = time.monotonic()
 
-                growth_duration = self.game_state_helper.get_global_state("plant_growth_duration_minutes", 240)
+                growth_duration = self.game_state_helper.get_growth_duration_minutes()
                 base_progress = 100.0 / (growth_duration if growth_duration > 0 else 240)
 
                 all_user_ids = self.garden_helper.get_all_user_ids()
@@ -164,6 +288,23 @@ class ARG(commands.Cog):
             wait_seconds = (target_time - now).total_seconds()
             await asyncio.sleep(max(0.1, wait_seconds))
 
+    @staticmethod
+    async def _send_alongside_dm(ctx: commands.Context, embed: discord.Embed, recipient: Optional[discord.User],
+                                 dm_embed: discord.Embed):
+        """Sends the channel reply and a DM to the other party concurrently. A DM the recipient blocks is ignored."""
+
+        if recipient is None:
+            await ctx.send(embed=embed)
+            return
+
+        reply_result, dm_result = await asyncio.gather(ctx.send(embed=embed), recipient.send(embed=dm_embed),
+                                                       return_exceptions=True)
+
+        if isinstance(reply_result, BaseException):
+            raise reply_result
+        if isinstance(dm_result, BaseException) and not isinstance(dm_result, discord.Forbidden):
+            raise dm_result
+
     async def _mature_plant(self, user_id: int, plot_index: int, seedling_obj: PlantedSeedling):
         """Handles the logic for when a seedling reaches 100% growth."""
 
@@ -198,7 +339,7 @@ class ARG(commands.Cog):
             title="🌱 Plant Maturation Complete",
             description=f"Alert, {discord_user.mention}: Your **{seedling_obj.name}** in plot "
                         f"{plot_index + 1} has matured into a **{newly_matured_plant.name}**.",
-            color=discord.Color.green()
+            color=_COLOR_GREEN
         )
         embed.set_footer(text="Penny System Monitoring")
 
@@ -242,7 +383,7 @@ class ARG(commands.Cog):
                     title="⚠️ Target Profile Advisory",
                     description=(f"User {target_user.mention} is currently engaged in a pending action.\n"
                                  f"Their profile data may be subject to imminent change."),
-                    color=discord.Color.orange()
+                    color=_COLOR_ORANGE
                 )
                 await ctx.send(embed=profile_lock_embed)
 
@@ -261,7 +402,8 @@ class ARG(commands.Cog):
                 bg_def = self.background_helper.get_background_by_id(active_bg_id)
                 bg_filename = f"{bg_def.image_file}.png" if bg_def else "garden.png"
 
-                unlocked_slots = {i + 1 for i in range(12) if self.garden_helper.is_slot_unlocked(profile, i + 1)}
+                unlocked_mask = self.garden_helper.get_unlocked_slot_mask(profile.user_id)
+                unlocked_slots = {i + 1 for i in self.garden_helper.iter_slot_indices(unlocked_mask)}
                 garden_image_file = await self.image_helper.generate_garden_image(profile, unlocked_slots,
                                                                                   background_filename=bg_filename)
             except Exception as e:
@@ -271,7 +413,7 @@ class ARG(commands.Cog):
                                delete_after=10)
                 display_text_garden = True
 
-        embed = discord.Embed(color=discord.Color.blue())
+        embed = discord.Embed(color=_COLOR_BLUE)
         embed.set_author(name=f"{target_user.display_name}: Zen Garden Dossier",
                          icon_url=target_user.display_avatar.url)
 
@@ -346,7 +488,7 @@ class ARG(commands.Cog):
                 description=f"User {ctx.author.mention}, system records indicate your daily solar energy stipend of "
                             f"1000 {self.CURRENCY_EMOJI} has already been collected for {current_date_est}.\n "
                             f"Next available collection cycle begins: <t:{unix_ts}:R>.",
-                color=discord.Color.red()
+                color=_COLOR_RED
             )
             embed.set_footer(text="Penny - Financial Systems Interface")
             await ctx.send(embed=embed)
@@ -361,7 +503,7 @@ class ARG(commands.Cog):
             description=f"User {ctx.author.mention}, your daily stipend of **1000** {self.CURRENCY_EMOJI} has been "
                         f"successfully credited to your account.\n "
                         f"Your current solar balance is now **{profile.balance:,}** {self.CURRENCY_EMOJI}.",
-            color=discord.Color.green()
+            color=_COLOR_GREEN
         )
         embed.set_footer(text="Penny - Financial Systems Interface")
         await ctx.send(embed=embed)
@@ -377,7 +519,7 @@ class ARG(commands.Cog):
                                   description=f"User {ctx.author.mention}, please specify target plot numbers for "
                                               f"seedling cultivation.\nSyntax: `{ctx.prefix}plant <plot_num_1> ["
                                               f"plot_num_2] ...`\nExample: `{ctx.prefix}plant 1 2 3`",
-                                  color=discord.Color.orange())
+                                  color=_COLOR_ORANGE)
             await ctx.send(embed=embed)
             return
 
@@ -399,8 +541,8 @@ class ARG(commands.Cog):
                 valid_slots_to_plant.append(slot_num_1based)
 
         if not valid_slots_to_plant:
-            desc = "Cultivation protocol aborted:\n\n" + "\n".join([f"• {msg}" for msg in error_messages])
-            embed = discord.Embed(title="❌ Cultivation Protocol Error", description=desc, color=discord.Color.red())
+            desc = "Cultivation protocol aborted:\n\n" + "\n".join(f"• {msg}" for msg in error_messages)
+            embed = discord.Embed(title="❌ Cultivation Protocol Error", description=desc, color=_COLOR_RED)
             await ctx.send(embed=embed)
             return
 
@@ -412,7 +554,7 @@ class ARG(commands.Cog):
                                               f"**{actual_cost:,}** {self.CURRENCY_EMOJI}.\n"
                                               f"Your available balance: "
                                               f"**{profile.balance:,}** {self.CURRENCY_EMOJI}.",
-                                  color=discord.Color.red())
+                                  color=_COLOR_RED)
             await ctx.send(embed=embed)
             return
 
@@ -432,9 +574,9 @@ class ARG(commands.Cog):
 
         if error_messages:
             desc += "\n\n**Advisory:** Some plots were not processed:\n" + "\n".join(
-                [f"• {msg}" for msg in error_messages])
+                f"• {msg}" for msg in error_messages)
 
-        embed = discord.Embed(title="🌱 Seedling Cultivation Initiated", description=desc, color=discord.Color.green())
+        embed = discord.Embed(title="🌱 Seedling Cultivation Initiated", description=desc, color=_COLOR_GREEN)
         await ctx.send(embed=embed)
 
     @commands.command(name="sell")
@@ -449,7 +591,7 @@ class ARG(commands.Cog):
                                               f"to be "f"liquidated from your garden plots.\n"
                                               f"Syntax: `{ctx.prefix}sell <plot_num_1> [plot_num_2] ...`\n"
                                               f"Example: `{ctx.prefix}sell 1 2 3`",
-                                  color=discord.Color.orange())
+                                  color=_COLOR_ORANGE)
             embed.set_footer(text="Penny - Command Syntax Adherence Module")
             await ctx.send(embed=embed)
             return
@@ -468,9 +610,9 @@ class ARG(commands.Cog):
         if not sold_plants_details and not mastery_gained and not time_mastery_gained:
             desc = "The asset liquidation process yielded no successful transactions.\n\n"
             if error_messages:
-                desc += "Analysis of encountered issues:\n" + "\n".join([f"• {msg}" for msg in error_messages])
+                desc += "Analysis of encountered issues:\n" + "\n".join(f"• {msg}" for msg in error_messages)
             embed = discord.Embed(title="❌ Liquidation Process Inconclusive", description=desc,
-                                  color=discord.Color.red())
+                                  color=_COLOR_RED)
             embed.set_footer(text="Penny - Financial Operations Interface")
             await ctx.send(embed=embed)
             return
@@ -492,7 +634,7 @@ class ARG(commands.Cog):
         desc = f"User {ctx.author.mention}, asset liquidation protocol executed successfully.\n\n"
 
         if sold_plants_details:
-            desc += "**Liquidated Assets & Yields:**\n" + "\n".join([f"• {detail}" for detail in sold_plants_details])
+            desc += "**Liquidated Assets & Yields:**\n" + "\n".join(f"• {detail}" for detail in sold_plants_details)
 
         if mastery_gained > 0:
             desc += f"\n\n**Your Sun Mastery has increased by {mastery_gained} to a new level of " \
@@ -509,9 +651,9 @@ class ARG(commands.Cog):
 
         if error_messages:
             desc += "\n\n**System Advisory:** Note that some assets could not be liquidated due to the following" \
-                    "issues:\n" + "\n".join([f"• {msg}" for msg in error_messages])
+                    "issues:\n" + "\n".join(f"• {msg}" for msg in error_messages)
 
-        embed = discord.Embed(title="💰 Asset Liquidation Complete", description=desc, color=discord.Color.green())
+        embed = discord.Embed(title="💰 Asset Liquidation Complete", description=desc, color=_COLOR_GREEN)
         embed.set_footer(text="Penny - Financial Operations Interface")
         await ctx.send(embed=embed)
 
@@ -526,7 +668,7 @@ class ARG(commands.Cog):
                 title="⚠️ Insufficient Parameters for Plot Clearing",
                 description=f"User {ctx.author.mention}, please specify target plot numbers for clearing.\nSyntax: "
                             f"`{ctx.prefix}shovel <plot_num_1> [plot_num_2] ...`\nExample: `{ctx.prefix}shovel 1 2 3`",
-                color=discord.Color.orange()
+                color=_COLOR_ORANGE
             )
             embed.set_footer(text="Penny - Command Syntax Adherence Module")
             await ctx.send(embed=embed)
@@ -563,9 +705,9 @@ class ARG(commands.Cog):
         if not cleared_slots_details:
             desc = "The plot clearing operation yielded no changes.\n\n"
             if error_messages:
-                desc += "Analysis of encountered issues:\n" + "\n".join([f"• {msg}" for msg in error_messages])
+                desc += "Analysis of encountered issues:\n" + "\n".join(f"• {msg}" for msg in error_messages)
             embed = discord.Embed(title="❌ Plot Clearing Operation Inconclusive", description=desc,
-                                  color=discord.Color.red())
+                                  color=_COLOR_RED)
             embed.set_footer(text="Penny - Garden Maintenance Subroutine")
             await ctx.send(embed=embed)
             return
@@ -574,13 +716,13 @@ class ARG(commands.Cog):
             self.garden_helper.set_garden_plot(ctx.author.id, plot_idx, None)
 
         desc = f"User {ctx.author.mention}, plot clearing operation has been successfully executed.\n\n"
-        desc += "**Plots Cleared of Occupants:**\n" + "\n".join([f"• {detail}" for detail in cleared_slots_details])
+        desc += "**Plots Cleared of Occupants:**\n" + "\n".join(f"• {detail}" for detail in cleared_slots_details)
 
         if error_messages:
             desc += "\n\n**System Advisory:** Some plots could not be cleared:\n" + "\n".join(
-                [f"• {msg}" for msg in error_messages])
+                f"• {msg}" for msg in error_messages)
 
-        embed = discord.Embed(title="🛠️ Plot Clearing Operation Complete", description=desc, color=discord.Color.blue())
+        embed = discord.Embed(title="🛠️ Plot Clearing Operation Complete", description=desc, color=_COLOR_BLUE)
         embed.set_footer(text="Penny - Garden Maintenance Subroutine")
         await ctx.send(embed=embed)
 
@@ -590,6 +732,9 @@ class ARG(commands.Cog):
     async def reorder_command(self, ctx: commands.Context, *new_order_str: str):
         """Reconfigure the physical arrangement of plants within unlocked garden plots."""
 
+        mention = ctx.author.mention
+        prefix = ctx.prefix
+
         profile = self.garden_helper.get_user_profile_view(ctx.author.id)
         garden = profile.garden
         num_garden_slots = len(garden)
@@ -597,14 +742,14 @@ class ARG(commands.Cog):
         if not new_order_str:
             embed = discord.Embed(title="⚠️ Insufficient Parameters for Garden Reconfiguration",
                                   description=(
-                                      f"User {ctx.author.mention}, to reconfigure your garden, please provide the "
+                                      f"User {mention}, to reconfigure your garden, please provide the "
                                       f"desired new sequence of your current plot occupants. Specify the *current* plot"
                                       f"numbers (1-12) in the new order you want them for your **unlocked** plots.\n\n "
-                                      f"**Syntax:** `{ctx.prefix}reorder <current_plot_num_for_new_pos1> "
+                                      f"**Syntax:** `{prefix}reorder <current_plot_num_for_new_pos1> "
                                       f"<current_plot_num_for_new_pos2> ...`\n "
                                       f"**Example (if plots 1-6 are unlocked):** To swap plants in plot 1 and 2, and "
-                                      f"keep 3-6 the same: `{ctx.prefix}reorder 2 1 3 4 5 6`"),
-                                  color=discord.Color.orange())
+                                      f"keep 3-6 the same: `{prefix}reorder 2 1 3 4 5 6`"),
+                                  color=_COLOR_ORANGE)
             embed.set_footer(text="Penny - Command Syntax Adherence Module")
             await ctx.send(embed=embed)
             return
@@ -613,33 +758,33 @@ class ARG(commands.Cog):
             new_order_original_slots_1_indexed = [int(slot) for slot in new_order_str]
         except ValueError:
             embed = discord.Embed(title="❌ Invalid Plot Designators for Reconfiguration",
-                                  description=f"User {ctx.author.mention}, plot designators must be numerical values "
+                                  description=f"User {mention}, plot designators must be numerical values "
                                               f"corresponding to your current garden plots (e.g., 1, 2, 3...).",
-                                  color=discord.Color.red())
+                                  color=_COLOR_RED)
             embed.set_footer(text="Penny - Input Validation Error")
             await ctx.send(embed=embed)
             return
 
-        unlocked_slot_indices_0based = sorted(
-            [i for i in range(num_garden_slots) if self.garden_helper.is_slot_unlocked(profile, i + 1)])
+        unlocked_mask = self.garden_helper.get_unlocked_slot_mask(ctx.author.id)
+        unlocked_slot_indices_0based = list(self.garden_helper.iter_slot_indices(unlocked_mask))
         num_unlocked_slots = len(unlocked_slot_indices_0based)
 
         if len(new_order_original_slots_1_indexed) != num_unlocked_slots:
             embed = discord.Embed(title="❌ Plot Sequence Count Mismatch for Reconfiguration",
                                   description=(
-                                      f"User {ctx.author.mention}, the number of plot designators provided"
+                                      f"User {mention}, the number of plot designators provided"
                                       f"({len(new_order_original_slots_1_indexed)}) "
                                       f"does not match your current number of unlocked plots ({num_unlocked_slots}).\n"
                                       f"Please list the current plot numbers of items from your **{num_unlocked_slots}"
                                       f"unlocked plots only**, in the new sequence."),
-                                  color=discord.Color.red())
+                                  color=_COLOR_RED)
             embed.set_footer(text="Penny - Input Validation Error")
             await ctx.send(embed=embed)
             return
 
         errors: List[str] = []
         source_slots_for_new_order_0_indexed: List[int] = []
-        seen_original_slots_0_indexed_in_input: set[int] = set()
+        seen_mask = 0
 
         for original_slot_1_indexed in new_order_original_slots_1_indexed:
             original_slot_0_indexed = original_slot_1_indexed - 1
@@ -647,30 +792,34 @@ class ARG(commands.Cog):
             if not (0 <= original_slot_0_indexed < num_garden_slots):
                 errors.append(
                     f"Specified original plot `{original_slot_1_indexed}` is out of range (1-{num_garden_slots}).")
-            elif original_slot_0_indexed not in unlocked_slot_indices_0based:
+                continue
+
+            slot_bit = 1 << original_slot_0_indexed
+
+            if not unlocked_mask & slot_bit:
                 errors.append(
                     f"Specified original plot `{original_slot_1_indexed}` is locked. Only contents of unlocked plots "
                     f"can be reordered.")
-            elif original_slot_0_indexed in seen_original_slots_0_indexed_in_input:
+            elif seen_mask & slot_bit:
                 errors.append(
                     f"Original plot `{original_slot_1_indexed}` specified multiple times. Each unlocked plot's "
                     f"content must be sourced once.")
             else:
-                seen_original_slots_0_indexed_in_input.add(original_slot_0_indexed)
+                seen_mask |= slot_bit
                 source_slots_for_new_order_0_indexed.append(original_slot_0_indexed)
 
         for unlocked_idx_0based in unlocked_slot_indices_0based:
-            if unlocked_idx_0based not in seen_original_slots_0_indexed_in_input:
+            if not seen_mask & (1 << unlocked_idx_0based):
                 errors.append(
                     f"The content of your unlocked plot `{unlocked_idx_0based + 1}` was not included in your reorder "
                     f"sequence.")
 
         if errors:
-            error_list_str = "\n".join([f"• {e}" for e in errors])
+            error_list_str = "\n".join(f"• {e}" for e in errors)
             embed = discord.Embed(title="❌ Reconfiguration Logic Error Detected",
-                                  description=(f"User {ctx.author.mention}, garden reconfiguration failed:\n\n"
+                                  description=(f"User {mention}, garden reconfiguration failed:\n\n"
                                                f"{error_list_str}"),
-                                  color=discord.Color.red())
+                                  color=_COLOR_RED)
             embed.set_footer(text="Penny - Spatial Arrangement Subroutine Error")
             await ctx.send(embed=embed)
             return
@@ -684,9 +833,9 @@ class ARG(commands.Cog):
         self.garden_helper.set_full_garden(ctx.author.id, new_full_garden_state)
 
         embed = discord.Embed(title="✅ Garden Matrix Reconfigured Successfully",
-                              description=f"User {ctx.author.mention}, your Zen Garden plot arrangement has been "
-                                          f"updated. Verify with `{ctx.prefix}profile`.",
-                              color=discord.Color.green())
+                              description=f"User {mention}, your Zen Garden plot arrangement has been "
+                                          f"updated. Verify with `{prefix}profile`.",
+                              color=_COLOR_GREEN)
         embed.set_footer(text="Penny - Spatial Arrangement Subroutine")
         await ctx.send(embed=embed)
 
@@ -728,7 +877,7 @@ class ARG(commands.Cog):
         embed = discord.Embed(
             title=f"📊 Zen Garden User Rankings (Page {page}/{total_pages})",
             description="\n".join(lb_lines),
-            color=discord.Color.green()
+            color=_COLOR_GREEN
         )
         embed.set_footer(text=f"Use {ctx.prefix}leaderboard [page_num] to navigate.")
         await ctx.send(embed=embed)
@@ -742,7 +891,7 @@ class ARG(commands.Cog):
         embed = discord.Embed(title="⚙️ Penny's Zen Garden - Command Manifest",
                               description=f"Greetings, User {ctx.author.mention}! Welcome to the Zen Garden "
                                           f"interface. Below is a list of available commands.",
-                              color=discord.Color.teal())
+                              color=_COLOR_TEAL)
 
         if bot_avatar_url := getattr(self.bot.user, 'display_avatar', None):
             embed.set_thumbnail(url=bot_avatar_url.url)
@@ -787,7 +936,7 @@ class ARG(commands.Cog):
             f"▫️ `{prefix}gardenhelp` - Display this command manifest."
         ))
 
-        current_growth_duration = self.game_state_helper.get_global_state("plant_growth_duration_minutes")
+        current_growth_duration = self.game_state_helper.get_growth_duration_minutes()
         hours, minutes = divmod(current_growth_duration, 60)
         duration_str = f"{hours} hour{'s' if hours != 1 else ''}" if hours > 0 else ""
         if minutes > 0:
@@ -801,6 +950,9 @@ class ARG(commands.Cog):
     async def ruxshop_command(self, ctx: commands.Context, page: int = 1):
         """Access Rux's Bazaar for upgrades and rare goods."""
 
+        mention = ctx.author.mention
+        prefix = ctx.prefix
+
         profile = self.garden_helper.get_user_profile_view(ctx.author.id)
         user_inventory = profile.inventory
 
@@ -808,7 +960,7 @@ class ARG(commands.Cog):
             embed = discord.Embed(title="🛒 Rux's Bazaar",
                                   description="The Bazaar is... empty. Rux must be on a supply run. Try again later, "
                                               "buddy.",
-                                  color=discord.Color.orange())
+                                  color=_COLOR_ORANGE)
             embed.set_footer(text="Penny - Inventory Systems Offline")
             await ctx.send(embed=embed)
             return
@@ -827,12 +979,10 @@ class ARG(commands.Cog):
             if is_owned and not is_limited:
                 continue
 
-            if any(req not in user_inventory for req in item_details.requirements):
+            if is_limited and not is_owned and self.game_state_helper.get_rux_stock(item_id) <= 0:
                 continue
 
-            stock = self.game_state_helper.get_rux_stock(item_id)
-
-            if is_limited and stock <= 0 and not is_owned:
+            if item_details.requirements and not all(req in user_inventory for req in item_details.requirements):
                 continue
 
             eligible_items_for_display.append((item_id, item_details))
@@ -869,15 +1019,15 @@ class ARG(commands.Cog):
 
         embed = discord.Embed(
             title="🛒 Rux's Bazaar",
-            description=f"Hey, {ctx.author.mention}.\n\n"
+            description=f"Hey, {mention}.\n\n"
                         f"**Your Current Solar Energy Balance:** {profile.balance:,} "
                         f"{self.CURRENCY_EMOJI}\n\n"
                         f"**Available Items for Procurement:**\n{shop_content}",
-            color=discord.Color.teal()
+            color=_COLOR_TEAL
         )
-        footer_text = f"To procure an item: {ctx.prefix}ruxbuy <item_id>"
+        footer_text = f"To procure an item: {prefix}ruxbuy <item_id>"
         if len(eligible_items_for_display) > 5:
-            footer_text += f"  •  Use {ctx.prefix}ruxshop [page_num] to navigate."
+            footer_text += f"  •  Use {prefix}ruxshop [page_num] to navigate."
         embed.set_footer(text=footer_text)
         await ctx.send(embed=embed)
 
@@ -897,7 +1047,7 @@ class ARG(commands.Cog):
             embed = discord.Embed(title="❌ Item Not in Bazaar",
                                   description=f"Rux says: '{item_id_to_buy}'? Never heard of it. Check your spelling "
                                               f"or use `{ctx.prefix}ruxshop` to see what I've got.",
-                                  color=discord.Color.red())
+                                  color=_COLOR_RED)
             await ctx.send(embed=embed)
             return
 
@@ -906,7 +1056,7 @@ class ARG(commands.Cog):
             embed = discord.Embed(title="❌ Already Acquired",
                                   description=f"Rux says: You've already got the **{item_name}**. I don't do returns "
                                               f"or duplicates!",
-                                  color=discord.Color.red())
+                                  color=_COLOR_RED)
             await ctx.send(embed=embed)
             return
 
@@ -916,7 +1066,7 @@ class ARG(commands.Cog):
                                   description=f"Rux says: To get the **{item_name}**, you need **{cost:,}** "
                                               f"{self.CURRENCY_EMOJI}. You only have **{profile.balance:,}** "
                                               f"{self.CURRENCY_EMOJI}.",
-                                  color=discord.Color.red())
+                                  color=_COLOR_RED)
             await ctx.send(embed=embed)
             return
 
@@ -927,7 +1077,7 @@ class ARG(commands.Cog):
             embed = discord.Embed(title="❌ Prerequisites Not Met",
                                   description=f"Rux says: You can't buy the **{item_name}** yet. You need to get these "
                                               f"first: {', '.join(missing_reqs_names)}.",
-                                  color=discord.Color.red())
+                                  color=_COLOR_RED)
             await ctx.send(embed=embed)
             return
 
@@ -936,12 +1086,11 @@ class ARG(commands.Cog):
                 embed = discord.Embed(title="❌ Item Out of Stock",
                                       description=f"Rux says: The **{item_name}** is all sold out! Should've been "
                                                   f"quicker, pal.",
-                                      color=discord.Color.red())
+                                      color=_COLOR_RED)
                 await ctx.send(embed=embed)
                 return
 
-        self.garden_helper.remove_balance(ctx.author.id, cost)
-        self.garden_helper.add_item_to_inventory(ctx.author.id, actual_item_key)
+        self.garden_helper.apply_purchase(ctx.author.id, cost, item_id=actual_item_key)
 
         success_desc = f"Rux says: A deal's a deal! The **{item_name}** is all yours, pal.\n\n"
         profile = self.garden_helper.get_user_profile_view(ctx.author.id)
@@ -953,7 +1102,7 @@ class ARG(commands.Cog):
             self.game_state_helper.set_rux_stock(actual_item_key, new_stock)
             success_desc += f"\nThis was a limited item. Stock remaining: **{new_stock}**."
 
-        embed = discord.Embed(title="🛒 Deal's a Deal!", description=success_desc, color=discord.Color.green())
+        embed = discord.Embed(title="🛒 Deal's a Deal!", description=success_desc, color=_COLOR_GREEN)
         embed.set_footer(text="Penny - Procurement Division")
         await ctx.send(embed=embed)
 
@@ -962,14 +1111,16 @@ class ARG(commands.Cog):
     async def pennyshop_command(self, ctx: commands.Context):
         """Displays the current stock of Penny's exclusive treasures."""
 
+        prefix = ctx.prefix
+
         current_stock = self.game_state_helper.get_global_state("treasure_shop_stock")
-        next_refresh = self.shop_helper.get_next_penny_refresh_time(datetime.now(TimeHelper.EST))
+        next_refresh = self.shop_helper.get_cached_next_penny_refresh_time()
 
         embed = discord.Embed(
             title="💎 Penny's Treasures 💎",
             description=f"A curated collection of rare and invaluable artifacts. Stock is limited and rotates "
                         f"periodically.\nNext refresh: <t:{int(next_refresh.timestamp())}:R>",
-            color=discord.Color.purple()
+            color=_COLOR_PURPLE
         )
 
         if not current_stock:
@@ -991,7 +1142,7 @@ class ARG(commands.Cog):
                 embed.add_field(name="Current Wares", value="\n\n".join(display_items[:midpoint]), inline=True)
                 embed.add_field(name="\u200b", value="\n\n".join(display_items[midpoint:]), inline=True)
 
-        embed.set_footer(text=f"Use {ctx.prefix}pennybuy <item_id> to purchase")
+        embed.set_footer(text=f"Use {prefix}pennybuy <item_id> to purchase")
         await ctx.send(embed=embed)
 
     @commands.command(name="pennybuy")
@@ -1013,7 +1164,7 @@ class ARG(commands.Cog):
         if not item_to_buy:
             embed = discord.Embed(title="❌ Item Not Available",
                                   description=f"The item `{item_id}` is not currently available in Penny's Treasures.",
-                                  color=discord.Color.red())
+                                  color=_COLOR_RED)
             await ctx.send(embed=embed)
             return
 
@@ -1023,12 +1174,11 @@ class ARG(commands.Cog):
                                   description=f"You require **{price:,}** {self.CURRENCY_EMOJI} to procure this "
                                               f"treasure, but your available balance is only "
                                               f"**{profile.balance:,}**.",
-                                  color=discord.Color.red())
+                                  color=_COLOR_RED)
             await ctx.send(embed=embed)
             return
 
-        self.garden_helper.remove_balance(ctx.author.id, price)
-        self.garden_helper.add_item_to_inventory(ctx.author.id, item_to_buy["id"])
+        self.garden_helper.apply_purchase(ctx.author.id, price, item_id=item_to_buy["id"])
 
         current_penny_stock = self.game_state_helper.get_global_state("treasure_shop_stock", [])
 
@@ -1044,7 +1194,7 @@ class ARG(commands.Cog):
             description=f"You have successfully acquired the **{item_to_buy.get('name')}** for **{price:,}** "
                         f"{self.CURRENCY_EMOJI}.\nYour new balance is **{profile.balance:,}** "
                         f"{self.CURRENCY_EMOJI}.",
-            color=discord.Color.green()
+            color=_COLOR_GREEN
         )
         await ctx.send(embed=embed)
 
@@ -1055,8 +1205,7 @@ class ARG(commands.Cog):
 
         stock = self.game_state_helper.get_global_state("dave_shop_stock")
         last_refresh_ts = self.game_state_helper.get_global_state("last_dave_shop_refresh")
-        next_refresh = (datetime.fromtimestamp(last_refresh_ts, tz=TimeHelper.EST) + timedelta(hours=1)).replace(
-            minute=0, second=0, microsecond=0)
+        next_refresh = self.shop_helper.get_next_dave_refresh_time(last_refresh_ts)
 
         embed = discord.Embed(
             title="🌱 Crazy Dave's Twiddydinkies",
@@ -1108,74 +1257,76 @@ class ARG(commands.Cog):
             await ctx.send(embed=discord.Embed(title="❌ Item Not Found",
                                                description=f"Dave says: I don't have any `{item_id}`! Are you sure "
                                                            f"that's not a taco?",
-                                               color=discord.Color.red()))
+                                               color=_COLOR_RED))
             return
 
+        buy_id = item_to_buy.get("id")
+        buy_name = item_to_buy.get("name")
+        item_type = item_to_buy.get("type")
+        price = item_to_buy.get("price", 9999999)
+
         if item_to_buy.get("stock", 0) <= 0:
             await ctx.send(embed=discord.Embed(title="❌ Out of Stock",
-                                               description=f"Dave says: All the **{item_to_buy.get('name')}** are "
+                                               description=f"Dave says: All the **{buy_name}** are "
                                                            f"gone! You gotta be quicker than that, neighbor!",
-                                               color=discord.Color.red()))
+                                               color=_COLOR_RED))
             return
 
-        price = item_to_buy.get("price", 9999999)
-
         if profile.balance < price:
             await ctx.send(embed=discord.Embed(title="❌ Insufficient Funds",
                                                description=f"You need **{price:,}** {self.CURRENCY_EMOJI} for this "
                                                            f"twiddydinky! You only have {profile.balance:,}.",
-                                               color=discord.Color.red()))
+                                               color=_COLOR_RED))
             return
 
-        item_type = item_to_buy.get("type")
-
         if item_type in ["plant", "seedling"]:
-            first_empty_slot = next((i for i, s in enumerate(profile.garden) if
-                                     self.garden_helper.is_slot_unlocked(profile, i + 1) and s is None), -1)
+            unlocked_mask = self.garden_helper.get_unlocked_slot_mask(ctx.author.id)
+            first_empty_slot = next((i for i in self.garden_helper.iter_slot_indices(unlocked_mask) if
+                                     profile.garden[i] is None), -1)
 
             if first_empty_slot == -1:
                 await ctx.send(embed=discord.Embed(title="❌ Garden Full",
                                                    description="Dave says: Your garden is full, neighbor! You need to make some space first!",
-                                                   color=discord.Color.red()))
+                                                   color=_COLOR_RED))
                 return
             
             if item_type == "plant":
-                plant_def = self.plant_helper.get_base_plant_by_id(item_to_buy["id"])
+                plant_def = self.plant_helper.get_base_plant_by_id(buy_id)
                 if not plant_def:
                     await ctx.send(embed=discord.Embed(title="❌ Plant Definition Missing",
-                                                       description=f"Dave says: I found the item, but my almanac is missing the page for **{item_to_buy['name']}**! This is a bug.",
-                                                       color=discord.Color.red()))
+                                                       description=f"Dave says: I found the item, but my almanac is missing the page for **{buy_name}**! This is a bug.",
+                                                       color=_COLOR_RED))
                     return 
                 
-                self.garden_helper.remove_balance(ctx.author.id, price)
                 plant_to_add = PlantedPlant(id=plant_def.id, name=plant_def.name, type=plant_def.type)
-                self.garden_helper.set_garden_plot(ctx.author.id, first_empty_slot, plant_to_add)
+                self.garden_helper.apply_purchase(ctx.author.id, price, plot_index_0based=first_empty_slot,
+                                                  slot_item=plant_to_add)
 
             elif item_type == "seedling":
-                seedling_def = self.plant_helper.get_seedling_by_id(item_to_buy["id"])
+                seedling_def = self.plant_helper.get_seedling_by_id(buy_id)
                 if not seedling_def:
                     await ctx.send(embed=discord.Embed(title="❌ Seedling Definition Missing",
                                                        description=f"Dave says: I found the item, but I forgot what kind of seed it is! This is a bug.",
-                                                       color=discord.Color.red()))
+                                                       color=_COLOR_RED))
                     return
                 
-                self.garden_helper.remove_balance(ctx.author.id, price)
-                self.garden_helper.plant_seedling(ctx.author.id, first_empty_slot, item_to_buy["id"], ctx.channel.id)
+                seedling_to_add = PlantedSeedling(id=buy_id, notification_channel_id=ctx.channel.id)
+                self.garden_helper.apply_purchase(ctx.author.id, price, plot_index_0based=first_empty_slot,
+                                                  slot_item=seedling_to_add)
 
         elif item_type == "material":
-            if item_to_buy["id"] not in self.data_loader.materials_data:
+            if buy_id not in self.data_loader.materials_data:
                 await ctx.send(embed=discord.Embed(title="❌ Material Definition Missing",
                                                    description=f"Dave says: I found something shiny, but I don't know what it is! This is a bug.",
-                                                   color=discord.Color.red()))
+                                                   color=_COLOR_RED))
                 return
             
-            self.garden_helper.remove_balance(ctx.author.id, price)
-            self.garden_helper.add_item_to_inventory(ctx.author.id, item_to_buy["id"])
+            self.garden_helper.apply_purchase(ctx.author.id, price, item_id=buy_id)
 
         else:
             await ctx.send(embed=discord.Embed(title="❌ Unknown Item Type",
-                                               description=f"Dave says: The **{item_to_buy['name']}** is a what now? I'm not sure how to give this to you! (Invalid item type in config).",
-                                               color=discord.Color.red()))
+                                               description=f"Dave says: The **{buy_name}** is a what now? I'm not sure how to give this to you! (Invalid item type in config).",
+                                               color=_COLOR_RED))
             return
 
         current_dave_stock = self.game_state_helper.get_global_state("dave_shop_stock", [])
@@ -1187,9 +1338,9 @@ class ARG(commands.Cog):
 
         await ctx.send(embed=discord.Embed(
             title="✅ Purchase Successful!",
-            description=f"You have successfully purchased **{item_to_buy.get('name')}** for **{price:,}** "
+            description=f"You have successfully purchased **{buy_name}** for **{price:,}** "
                         f"{self.CURRENCY_EMOJI}.",
-            color=discord.Color.green()
+            color=_COLOR_GREEN
         ))
 
     @commands.command(name="storage")
@@ -1206,7 +1357,7 @@ class ARG(commands.Cog):
                 title="🔒 Storage Shed Inaccessible",
                 description=f"{user_display} not currently possess a Storage Shed. It can be acquired from the "
                             f"`{ctx.prefix}ruxshop`.",
-                color=discord.Color.orange()
+                color=_COLOR_ORANGE
             )
             embed.set_footer(text="Penny - Asset Management Systems")
             await ctx.send(embed=embed)
@@ -1218,7 +1369,7 @@ class ARG(commands.Cog):
             title=f"📦 {target_user.display_name}'s Storage Shed Inventory",
             description=f"Displaying current botanical asset storage for {target_user.mention}.\nCapacity: "
                         f"**{occupied_slots}/{capacity}** slots utilized.",
-            color=discord.Color.dark_teal()
+            color=_COLOR_DARK_TEAL
         )
 
         if occupied_slots == 0:
@@ -1251,7 +1402,7 @@ class ARG(commands.Cog):
                 title="🔒 Storage Shed Inaccessible",
                 description=f"User {ctx.author.mention}, you do not currently possess a Storage Shed. "
                             f"It can be acquired from `{ctx.prefix}ruxshop`.",
-                color=discord.Color.orange()
+                color=_COLOR_ORANGE
             )
             await ctx.send(embed=embed)
             return
@@ -1261,53 +1412,33 @@ class ARG(commands.Cog):
                 title="⚠️ Insufficient Parameters for Storage Transfer",
                 description=f"User {ctx.author.mention}, please specify the garden plot numbers containing the plants "
                             f"you wish to move to storage.\nSyntax: `{ctx.prefix}store <plot_num_1> [plot_num_2] ...`",
-                color=discord.Color.orange()
+                color=_COLOR_ORANGE
             )
             await ctx.send(embed=embed)
             return
 
-        moved_plants_summary = []
-        error_messages = []
-
-        plots_to_actually_store = []
-        for plot_num in set(plot_numbers):
-            plot_idx_0based = plot_num - 1
-
-            if not (0 <= plot_idx_0based < 12):
-                error_messages.append(f"Plot {plot_num}: Invalid designation (must be 1-12).")
-                continue
-
-            plant = profile.garden[plot_idx_0based]
-            if not isinstance(plant, PlantedPlant):
-                error_messages.append(f"Plot {plot_num}: Is empty or contains a non-storable seedling.")
-                continue
-
-            plots_to_actually_store.append(plot_idx_0based)
-
-        for plot_idx in plots_to_actually_store:
-            success, message = self.garden_helper.store_plant(ctx.author.id, plot_idx)
-
-            if success:
-                moved_plants_summary.append(message)
-            else:
-                error_messages.append(f"Plot {plot_idx + 1}: Failed to store. Reason: {message}")
+        moved_plants_summary, error_messages = self.garden_helper.store_plants(
+            ctx.author.id, {plot_num - 1 for plot_num in plot_numbers})
 
         if not moved_plants_summary:
-            desc = "No plants were successfully moved to storage."
+            desc_parts = ["No plants were successfully moved to storage."]
             if error_messages:
-                desc += "\n\n**Issues Encountered:**\n" + "\n".join([f"• {msg}" for msg in error_messages])
-            await ctx.send(
-                embed=discord.Embed(title="❌ Storage Transfer Failed", description=desc, color=discord.Color.red()))
+                desc_parts.append("\n\n**Issues Encountered:**\n")
+                desc_parts.append("\n".join(f"• {msg}" for msg in error_messages))
+            await ctx.send(embed=discord.Embed(title="❌ Storage Transfer Failed", description="".join(desc_parts),
+                                               color=_COLOR_RED))
             return
 
-        desc = f"User {ctx.author.mention}, asset transfer to storage successful.\n\n**Transfer Details:**\n"
-        desc += "\n".join([f"• {summary}" for summary in moved_plants_summary])
+        desc_parts = [f"User {ctx.author.mention}, asset transfer to storage successful.\n\n**Transfer Details:**\n",
+                      "\n".join(f"• {summary}" for summary in moved_plants_summary)]
 
         if error_messages:
-            desc += "\n\n**System Advisory:** Some plants could not be stored due to the following issues:\n" + \
-                    "\n".join([f"• {msg}" for msg in error_messages])
+            desc_parts.append("\n\n**System Advisory:** Some plants could not be stored due to the following issues:\n")
+            desc_parts.append("\n".join(f"• {msg}" for msg in error_messages))
+
+        desc = "".join(desc_parts)
 
-        embed = discord.Embed(title="✅ Plants Moved to Storage", description=desc, color=discord.Color.green())
+        embed = discord.Embed(title="✅ Plants Moved to Storage", description=desc, color=_COLOR_GREEN)
         embed.set_footer(text="Penny - Asset Management Systems")
         await ctx.send(embed=embed)
 
@@ -1323,7 +1454,7 @@ class ARG(commands.Cog):
             embed = discord.Embed(
                 title="🔒 Storage Shed Inaccessible",
                 description=f"User {ctx.author.mention}, you do not currently possess a Storage Shed.",
-                color=discord.Color.orange()
+                color=_COLOR_ORANGE
             )
             await ctx.send(embed=embed)
             return
@@ -1333,56 +1464,33 @@ class ARG(commands.Cog):
                 title="⚠️ Insufficient Parameters for Storage Retrieval",
                 description=f"User {ctx.author.mention}, please specify the storage space numbers of the plants you "
                             f"wish to retrieve.\nSyntax: `{ctx.prefix}unstore <space_num_1> ...`",
-                color=discord.Color.orange()
+                color=_COLOR_ORANGE
             )
             await ctx.send(embed=embed)
             return
 
-        retrieved_plants_summary = []
-        error_messages = []
-
-        storage_capacity = self.garden_helper.get_storage_capacity(profile)
-
-        slots_to_unstore = []
-
-        for slot_num in set(storage_space_numbers):
-            slot_idx_0based = slot_num - 1
-
-            if not (0 <= slot_idx_0based < storage_capacity):
-                error_messages.append(
-                    f"Storage Slot {slot_num}: Invalid or inaccessible (Capacity: {storage_capacity}).")
-                continue
-
-            if profile.storage_shed[slot_idx_0based] is None:
-                error_messages.append(f"Storage Slot {slot_num}: Is empty.")
-                continue
-
-            slots_to_unstore.append(slot_idx_0based)
-
-        for slot_idx in slots_to_unstore:
-            success, message = self.garden_helper.unstore_plant(ctx.author.id, slot_idx)
-
-            if success:
-                retrieved_plants_summary.append(message)
-            else:
-                error_messages.append(f"Storage Slot {slot_idx + 1}: Failed to retrieve. Reason: {message}")
+        retrieved_plants_summary, error_messages = self.garden_helper.unstore_plants(
+            ctx.author.id, {slot_num - 1 for slot_num in storage_space_numbers})
 
         if not retrieved_plants_summary:
-            desc = "No plants were successfully retrieved from storage."
+            desc_parts = ["No plants were successfully retrieved from storage."]
             if error_messages:
-                desc += "\n\n**Issues Encountered:**\n" + "\n".join([f"• {msg}" for msg in error_messages])
-            await ctx.send(
-                embed=discord.Embed(title="❌ Storage Retrieval Failed", description=desc, color=discord.Color.red()))
+                desc_parts.append("\n\n**Issues Encountered:**\n")
+                desc_parts.append("\n".join(f"• {msg}" for msg in error_messages))
+            await ctx.send(embed=discord.Embed(title="❌ Storage Retrieval Failed", description="".join(desc_parts),
+                                               color=_COLOR_RED))
             return
 
-        desc = f"User {ctx.author.mention}, asset retrieval from storage successful.\n\n**Retrieval Details:**\n"
-        desc += "\n".join([f"• {summary}" for summary in retrieved_plants_summary])
+        desc_parts = [f"User {ctx.author.mention}, asset retrieval from storage successful.\n\n**Retrieval Details:**\n",
+                      "\n".join(f"• {summary}" for summary in retrieved_plants_summary)]
 
         if error_messages:
-            desc += "\n\n**System Advisory:** Some plants could not be retrieved due to the following issues:\n" + \
-                    "\n".join([f"• {msg}" for msg in error_messages])
+            desc_parts.append("\n\n**System Advisory:** Some plants could not be retrieved due to the following issues:\n")
+            desc_parts.append("\n".join(f"• {msg}" for msg in error_messages))
+
+        desc = "".join(desc_parts)
 
-        embed = discord.Embed(title="✅ Plants Retrieved from Storage", description=desc, color=discord.Color.green())
+        embed = discord.Embed(title="✅ Plants Retrieved from Storage", description=desc, color=_COLOR_GREEN)
         embed.set_footer(text="Penny - Asset Management Systems")
         await ctx.send(embed=embed)
 
@@ -1396,44 +1504,50 @@ class ARG(commands.Cog):
         sender = ctx.author
 
         if recipient.bot:
-            embed = discord.Embed(title="❌ Invalid Trade Target Entity",
-                                  description="Automated system entities (bots) are not authorized for asset exchange.",
-                                  color=discord.Color.red())
-            embed.set_footer(text="Penny - Secure Exchange System: Entity Check")
-            await ctx.send(embed=embed)
+            await ctx.send(embed=_ERR_BOT_TRADE_TARGET)
             return
 
         if sender.id == recipient.id:
-            embed = discord.Embed(title="❌ Invalid Trade Operation: Self-Target",
-                                  description="Self-trading protocols are not permitted.", color=discord.Color.red())
-            embed.set_footer(text="Penny - Secure Exchange System: Operation Check")
-            await ctx.send(embed=embed)
+            await ctx.send(embed=_ERR_SELF_TRADE)
             return
 
         if self.lock_helper.get_user_lock(recipient.id):
             embed = discord.Embed(title="❌ Target User Currently Engaged",
                                   description=f"User {recipient.mention} is currently involved in another system "
                                               f"operation and cannot trade at this time.",
-                                  color=discord.Color.orange())
+                                  color=_COLOR_ORANGE)
             await ctx.send(embed=embed)
             return
 
+        if self.trade_helper.is_dm_blocked(recipient.id):
+            await ctx.send(embed=discord.Embed(title="❌ Transmission Failure",
+                                               description=f"A recent DM to {recipient.mention} failed, so this "
+                                                           f"proposal was skipped. Trade cancelled.",
+                                               color=_COLOR_RED))
+            return
+
         if money_to_give < 0 or not want_slots_input:
             embed = discord.Embed(title="❌ Missing or Invalid Parameters",
                                   description=f"User {ctx.author.mention}, please specify a non-negative sun amount "
                                               f"and the plot number(s) you wish to acquire.\nSyntax: "
                                               f"`{ctx.prefix}trade @User <sun> <plot1> ...`",
-                                  color=discord.Color.red())
+                                  color=_COLOR_RED)
             embed.set_footer(text="Penny - Secure Exchange System: Command Syntax")
             await ctx.send(embed=embed)
             return
 
         try:
-            want_slots_0_indexed = sorted(list(set([int(s) - 1 for s in want_slots_input])))
+            want_slots_0_indexed = sorted({int(s) - 1 for s in want_slots_input})
         except ValueError:
-            await ctx.send(embed=discord.Embed(title="❌ Invalid Parameter: Plot Designators",
-                                               description="Plot designators must be numerical values.",
-                                               color=discord.Color.red()))
+            await ctx.send(embed=_ERR_INVALID_PLOT_DESIGNATORS)
+            return
+
+        lowest_slot, highest_slot = want_slots_0_indexed[0], want_slots_0_indexed[-1]
+        if lowest_slot < 0 or highest_slot >= 12:
+            invalid_slot = lowest_slot if lowest_slot < 0 else highest_slot
+            await ctx.send(embed=discord.Embed(title="❌ Invalid Target Asset",
+                                               description=f"Plot {invalid_slot + 1} is an invalid plot number.",
+                                               color=_COLOR_RED))
             return
 
         sender_profile = self.garden_helper.get_user_profile_view(sender.id)
@@ -1441,45 +1555,47 @@ class ARG(commands.Cog):
             await ctx.send(embed=discord.Embed(title="❌ Insufficient Solar Reserves",
                                                description=f"Your proposal to offer {money_to_give:,} "
                                                            f"{self.CURRENCY_EMOJI} exceeds your current balance of {sender_profile.balance:,}.",
-                                               color=discord.Color.red()))
+                                               color=_COLOR_RED))
             return
 
         recipient_profile = self.garden_helper.get_user_profile_view(recipient.id)
-        plants_to_receive_info = []
+
+        want_mask = 0
         for r_slot_idx in want_slots_0_indexed:
-            if not (0 <= r_slot_idx < 12):
-                await ctx.send(embed=discord.Embed(title="❌ Invalid Target Asset",
-                                                   description=f"Plot {r_slot_idx + 1} is an invalid plot number.",
-                                                   color=discord.Color.red()))
-                return
+            want_mask |= 1 << r_slot_idx
 
-            if not self.garden_helper.is_slot_unlocked(recipient_profile, r_slot_idx + 1):
-                await ctx.send(embed=discord.Embed(title="❌ Invalid Target Asset",
-                                                   description=f"Plot {r_slot_idx + 1} is locked for "
-                                                               f"{recipient.mention}.",
-                                                   color=discord.Color.red()))
-                return
+        locked_want_mask = want_mask & ~self.garden_helper.get_unlocked_slot_mask(recipient.id)
+        if locked_want_mask:
+            locked_slot = (locked_want_mask & -locked_want_mask).bit_length() - 1
+            await ctx.send(embed=discord.Embed(title="❌ Invalid Target Asset",
+                                               description=f"Plot {locked_slot + 1} is locked for "
+                                                           f"{recipient.mention}.",
+                                               color=_COLOR_RED))
+            return
 
+        plants_to_receive_info = []
+        for r_slot_idx in want_slots_0_indexed:
             plant = recipient_profile.garden[r_slot_idx]
 
             if not isinstance(plant, PlantedPlant):
                 await ctx.send(embed=discord.Embed(title="❌ Invalid Target Asset",
                                                    description=f"The item in {recipient.mention}'s plot "
                                                                f"{r_slot_idx + 1} is not a mature, tradable plant.",
-                                                   color=discord.Color.red()))
+                                                   color=_COLOR_RED))
                 return
 
-            plants_to_receive_info.append({"r_slot_index": r_slot_idx, "plant_data": dataclasses.asdict(plant)})
+            plants_to_receive_info.append({"r_slot_index": r_slot_idx, "plant_data": plant.to_dict()})
 
-        free_sender_plots = sum(1 for i, p in enumerate(sender_profile.garden) if
-                                p is None and self.garden_helper.is_slot_unlocked(sender_profile, i + 1))
+        sender_unlocked_mask = self.garden_helper.get_unlocked_slot_mask(sender.id)
+        free_sender_plots = sum(1 for i in self.garden_helper.iter_slot_indices(sender_unlocked_mask) if
+                                sender_profile.garden[i] is None)
 
         if free_sender_plots < len(plants_to_receive_info):
             await ctx.send(embed=discord.Embed(title="❌ Insufficient Garden Capacity",
                                                description=f"You need {len(plants_to_receive_info)} empty garden "
                                                            f"plot(s) to receive these plants, but you "
                                                            f"only have {free_sender_plots}.",
-                                               color=discord.Color.red()))
+                                               color=_COLOR_RED))
             return
 
         trade_id = f"TR{int(time.time()) % 10000:04d}"
@@ -1492,7 +1608,7 @@ class ARG(commands.Cog):
         self.trade_helper.propose_trade(sender, recipient, trade_details)
 
         plant_names_str = "\n".join(
-            [f"    • **{p['plant_data']['name']}** from plot {p['r_slot_index'] + 1}" for p in plants_to_receive_info])
+            f"    • **{p['plant_data']['name']}** from plot {p['r_slot_index'] + 1}" for p in plants_to_receive_info)
 
         offer_desc = (f"User {sender.mention} has proposed an asset exchange with you.\n\n"
                       f"**Proposal:**\n"
@@ -1503,7 +1619,7 @@ class ARG(commands.Cog):
                       f"This proposal will automatically expire in **60 seconds**.")
 
         dm_embed = discord.Embed(title="🛰️ Incoming Asset Exchange Proposal", description=offer_desc,
-                                 color=discord.Color.teal())
+                                 color=_COLOR_TEAL)
         dm_embed.set_footer(text=f"Trade Proposal ID: {trade_id}")
 
         try:
@@ -1511,22 +1627,23 @@ class ARG(commands.Cog):
             await ctx.send(embed=discord.Embed(title="✅ Proposal Transmitted",
                                                description=f"Your proposal (`{trade_id}`) has been sent to "
                                                            f"{recipient.mention}. They have 60 seconds to respond.",
-                                               color=discord.Color.green()))
+                                               color=_COLOR_GREEN))
         except discord.Forbidden:
             self.trade_helper.resolve_trade(trade_id)
+            self.trade_helper.mark_dm_blocked(recipient.id)
             await ctx.send(embed=discord.Embed(title="❌ Transmission Failure",
                                                description=f"Could not DM {recipient.mention}. Their DMs may be "
                                                            f"disabled. Trade cancelled.",
-                                               color=discord.Color.red()))
+                                               color=_COLOR_RED))
             return
 
-        await asyncio.sleep(60.0)
+        await self.trade_helper.wait_for_resolution(trade_id, timeout=60.0)
 
         if self.trade_helper.resolve_trade(trade_id):
             timeout_embed = discord.Embed(title="⏰ Asset Exchange Proposal Expired",
                                           description=f"The proposal (`{trade_id}`) between {sender.mention} and "
                                                       f"{recipient.mention} has expired due to no response.",
-                                          color=discord.Color.light_grey())
+                                          color=_COLOR_LIGHT_GREY)
             for user in [sender, recipient]:
                 try:
                     await user.send(embed=timeout_embed)
@@ -1543,18 +1660,11 @@ class ARG(commands.Cog):
         sender = ctx.author
 
         if recipient.bot:
-            embed = discord.Embed(title="❌ Invalid Trade Target Entity",
-                                  description="Automated system entities (bots) are not authorized for asset exchange.",
-                                  color=discord.Color.red())
-            embed.set_footer(text="Penny - Secure Exchange System: Entity Check")
-            await ctx.send(embed=embed)
+            await ctx.send(embed=_ERR_BOT_TRADE_TARGET)
             return
 
         if sender.id == recipient.id:
-            embed = discord.Embed(title="❌ Invalid Trade Operation: Self-Target",
-                                  description="Self-trading protocols are not permitted.", color=discord.Color.red())
-            embed.set_footer(text="Penny - Secure Exchange System: Operation Check")
-            await ctx.send(embed=embed)
+            await ctx.send(embed=_ERR_SELF_TRADE)
             return
 
         if not item_ids:
@@ -1562,21 +1672,28 @@ class ARG(commands.Cog):
                                                description=f"Please specify the ID(s) of the Material(s) you wish to "
                                                            f"acquire.\nSyntax: `{ctx.prefix}tradeitem @user <sun> "
                                                            f"<item_id_1> ...`",
-                                               color=discord.Color.red()))
+                                               color=_COLOR_RED))
             return
 
         if self.lock_helper.get_user_lock(recipient.id):
             embed = discord.Embed(title="❌ Target User Currently Engaged",
                                   description=f"User {recipient.mention} is currently involved in another system "
                                               f"operation and cannot trade at this time.",
-                                  color=discord.Color.orange())
+                                  color=_COLOR_ORANGE)
             await ctx.send(embed=embed)
             return
 
+        if self.trade_helper.is_dm_blocked(recipient.id):
+            await ctx.send(embed=discord.Embed(title="❌ Transmission Failure",
+                                               description=f"A recent DM to {recipient.mention} failed, so this "
+                                                           f"proposal was skipped. Trade cancelled.",
+                                               color=_COLOR_RED))
+            return
+
         if sun_offered < 0:
             await ctx.send(embed=discord.Embed(title=f"❌ Invalid Parameter",
                                                description=f"The sun offered must be a non-negative amount.",
-                                               color=discord.Color.red()))
+                                               color=_COLOR_RED))
             return
 
         sender_profile = self.garden_helper.get_user_profile_view(sender.id)
@@ -1584,7 +1701,7 @@ class ARG(commands.Cog):
             await ctx.send(embed=discord.Embed(title="❌ Insufficient Solar Reserves",
                                                description=f"Your proposal to offer {sun_offered:,} "
                                                            f"{self.CURRENCY_EMOJI} exceeds your current balance.",
-                                               color=discord.Color.red()))
+                                               color=_COLOR_RED))
             return
 
         recipient_profile = self.garden_helper.get_user_profile_view(recipient.id)
@@ -1592,7 +1709,7 @@ class ARG(commands.Cog):
 
         requested_items_counter = Counter()
         errors = []
-        mat_id_map = {k.lower(): k for k in self.data_loader.materials_data.keys()}
+        mat_id_map = self.data_loader.materials_id_lower_map
 
         for item_input in item_ids:
             item_lower = item_input.lower()
@@ -1605,24 +1722,25 @@ class ARG(commands.Cog):
         if errors:
             await ctx.send(embed=discord.Embed(title="❌ Invalid Item Request",
                                                description="The following issues were found:\n" + "\n".join(
-                                                   f"• {e}" for e in errors), color=discord.Color.red()))
+                                                   f"• {e}" for e in errors), color=_COLOR_RED))
             return
 
         validated_items_info = []
         for item_id, count in requested_items_counter.items():
             item_name = self.data_loader.materials_data.get(item_id, item_id)
 
-            if recipient_inv_counter.get(item_id, 0) < count:
+            held_count = recipient_inv_counter.get(item_id, 0)
+
+            if held_count < count:
                 errors.append(
-                    f"Recipient has {recipient_inv_counter.get(item_id, 0)} of **{item_name}**, but you requested "
-                    f"{count}.")
+                    f"Recipient has {held_count} of **{item_name}**, but you requested {count}.")
                 continue
             validated_items_info.append({"id": item_id, "name": item_name, "count": count})
 
         if errors:
             await ctx.send(embed=discord.Embed(title="❌ Proposal Validation Failed",
                                                description="Your trade could not be sent:\n" + "\n".join(
-                                                   f"• {e}" for e in errors), color=discord.Color.red()))
+                                                   f"• {e}" for e in errors), color=_COLOR_RED))
             return
 
         trade_id = f"TI{int(time.time()) % 10000:04d}"
@@ -1634,7 +1752,7 @@ class ARG(commands.Cog):
 
         self.trade_helper.propose_trade(sender, recipient, trade_details)
 
-        items_for_msg = "\n".join([f"    • **{item['name']}** x{item['count']}" for item in validated_items_info])
+        items_for_msg = "\n".join(f"    • **{item['name']}** x{item['count']}" for item in validated_items_info)
         offer_desc = (f"User {sender.mention} has proposed a Material exchange with you.\n\n"
                       f"**Proposal:**\n"
                       f"  ➢ **{sender.display_name}** offers: **{sun_offered:,}** {self.CURRENCY_EMOJI}\n"
@@ -1644,7 +1762,7 @@ class ARG(commands.Cog):
                       f"This proposal will automatically expire in **60 seconds**.")
 
         dm_embed = discord.Embed(title="💎 Incoming Material Exchange Proposal", description=offer_desc,
-                                 color=discord.Color.purple())
+                                 color=_COLOR_PURPLE)
         dm_embed.set_footer(text=f"Trade Proposal ID: {trade_id}")
 
         try:
@@ -1652,22 +1770,23 @@ class ARG(commands.Cog):
             await ctx.send(embed=discord.Embed(title="✅ Proposal Transmitted",
                                                description=f"Your Material exchange proposal (`{trade_id}`) has been "
                                                            f"sent to {recipient.mention}.",
-                                               color=discord.Color.green()))
+                                               color=_COLOR_GREEN))
         except discord.Forbidden:
             self.trade_helper.resolve_trade(trade_id)
+            self.trade_helper.mark_dm_blocked(recipient.id)
             await ctx.send(embed=discord.Embed(title="❌ Transmission Failure",
                                                description=f"Unable to DM {recipient.mention}. Trade cancelled.",
-                                               color=discord.Color.red()))
+                                               color=_COLOR_RED))
             return
 
-        await asyncio.sleep(60)
+        await self.trade_helper.wait_for_resolution(trade_id, timeout=60.0)
         if expired_trade := self.trade_helper.resolve_trade(trade_id):
             sender = self.bot.get_user(expired_trade["sender_id"])
             recipient = self.bot.get_user(expired_trade["recipient_id"])
             timeout_embed = discord.Embed(title="⏰ Material Exchange Proposal Expired",
                                           description=f"The proposal (`{trade_id}`) between {sender.mention} and "
                                                       f"{recipient.mention} has expired.",
-                                          color=discord.Color.light_grey())
+                                          color=_COLOR_LIGHT_GREY)
 
             for user in [sender, recipient]:
                 if user:
@@ -1681,26 +1800,18 @@ class ARG(commands.Cog):
     async def accept_command(self, ctx: commands.Context, trade_id: str):
         """Confirm and execute a pending asset exchange proposal you received."""
 
-        trade_peek = self.trade_helper.pending_trades.get(trade_id)
+        status, trade = self.trade_helper.try_resolve_trade(trade_id, ctx.author.id)
 
-        if not trade_peek:
+        if status == "not_found":
             embed = discord.Embed(title="❌ Invalid Proposal Identifier",
                                   description=f"The ID (`{trade_id}`) does not correspond to an active proposal.",
-                                  color=discord.Color.red())
+                                  color=_COLOR_RED)
             await ctx.send(embed=embed)
             return
 
-        if trade_peek.get("recipient_id") != ctx.author.id:
+        if status == "not_yours":
             embed = discord.Embed(title="❌ Unauthorized Action", description="This proposal is not addressed to you.",
-                                  color=discord.Color.red())
-            await ctx.send(embed=embed)
-            return
-
-        trade = self.trade_helper.resolve_trade(trade_id)
-        if not trade:
-            embed = discord.Embed(title="❌ Proposal No Longer Active",
-                                  description="This proposal has just expired or was cancelled.",
-                                  color=discord.Color.orange())
+                                  color=_COLOR_RED)
             await ctx.send(embed=embed)
             return
 
@@ -1715,8 +1826,8 @@ class ARG(commands.Cog):
         changes = None
 
         if trade_type == "plant":
-            sender_unlocked_slots = {i + 1 for i in range(12) if
-                                     self.garden_helper.is_slot_unlocked(sender_profile, i + 1)}
+            sender_unlocked_mask = self.garden_helper.get_unlocked_slot_mask(sender_profile.user_id)
+            sender_unlocked_slots = {i + 1 for i in self.garden_helper.iter_slot_indices(sender_unlocked_mask)}
             success, message, changes = self.trade_helper.execute_plant_trade(
                 trade_data=trade,
                 sender_profile=sender_profile,
@@ -1733,97 +1844,59 @@ class ARG(commands.Cog):
         sender = self.bot.get_user(sender_id)
 
         if success and changes:
-            for update in changes.get("balance_updates", []):
-                if update["amount"] > 0:
-                    self.garden_helper.add_balance(update["user_id"], update["amount"])
-                else:
-                    self.garden_helper.remove_balance(update["user_id"], -update["amount"])
-
-            for move in changes.get("plant_moves", []):
-                self.garden_helper.set_garden_plot(move["from_user_id"], move["from_plot_idx"], None)
-                self.garden_helper.set_garden_plot(move["to_user_id"], move["to_plot_idx"], move["plant_data"])
-
-            for transfer in changes.get("item_transfers", []):
-                self.garden_helper.remove_item_from_inventory(transfer["from_user_id"], transfer["item_id"],
-                                                                    transfer["quantity"])
-                self.garden_helper.add_item_to_inventory(transfer["to_user_id"], transfer["item_id"],
-                                                               transfer["quantity"])
+            self.garden_helper.apply_trade_changes(changes)
 
             embed_acceptor = discord.Embed(title="✅ Asset Exchange Confirmed & Executed",
                                            description=f"You accepted proposal `{trade_id}` from "
                                                        f"{sender.mention if sender else 'the other user'}."
                                                        f"\n**Details:** {message}",
-                                           color=discord.Color.green())
-            await ctx.send(embed=embed_acceptor)
-            if sender:
-                try:
-                    embed_sender = discord.Embed(title="✅ Proposal Accepted",
-                                                 description=f"Your proposal (`{trade_id}`) with {ctx.author.mention} "
-                                                             f"was accepted and executed.",
-                                                 color=discord.Color.green())
-                    await sender.send(embed=embed_sender)
-                except discord.Forbidden:
-                    pass
+                                           color=_COLOR_GREEN)
+            embed_sender = discord.Embed(title="✅ Proposal Accepted",
+                                         description=f"Your proposal (`{trade_id}`) with {ctx.author.mention} "
+                                                     f"was accepted and executed.",
+                                         color=_COLOR_GREEN)
+            await self._send_alongside_dm(ctx, embed_acceptor, sender, embed_sender)
         else:
             embed_acceptor = discord.Embed(title="❌ Asset Exchange Failed During Final Execution",
                                            description=f"While finalizing proposal `{trade_id}`, an error occurred: "
                                                        f"**{message}**\n\nNo assets were exchanged.",
-                                           color=discord.Color.red())
-            await ctx.send(embed=embed_acceptor)
-            if sender:
-                try:
-                    embed_sender = discord.Embed(title="❌ Proposal Execution Failed",
-                                                 description=f"Your proposal (`{trade_id}`) with {ctx.author.mention} "
-                                                             f"failed final validation: **{message}**",
-                                                 color=discord.Color.red())
-                    await sender.send(embed=embed_sender)
-                except discord.Forbidden:
-                    pass
+                                           color=_COLOR_RED)
+            embed_sender = discord.Embed(title="❌ Proposal Execution Failed",
+                                         description=f"Your proposal (`{trade_id}`) with {ctx.author.mention} "
+                                                     f"failed final validation: **{message}**",
+                                         color=_COLOR_RED)
+            await self._send_alongside_dm(ctx, embed_acceptor, sender, embed_sender)
 
     @commands.command(name="decline")
     @is_cog_ready()
     async def decline_command(self, ctx: commands.Context, trade_id: str):
         """Reject a pending asset exchange proposal or cancel one you initiated."""
 
-        trade_peek = self.trade_helper.pending_trades.get(trade_id)
+        status, trade = self.trade_helper.try_resolve_trade(trade_id, ctx.author.id, allow_sender=True)
 
-        if not trade_peek:
+        if status == "not_found":
             await ctx.send(embed=discord.Embed(title="❌ Invalid Proposal Identifier",
                                                description=f"The ID (`{trade_id}`) is invalid or does not involve you.",
-                                               color=discord.Color.red()))
+                                               color=_COLOR_RED))
             return
 
-        is_sender = trade_peek.get("sender_id") == ctx.author.id
-        is_recipient = trade_peek.get("recipient_id") == ctx.author.id
-
-        if not (is_sender or is_recipient):
+        if status == "not_yours":
             await ctx.send(
                 embed=discord.Embed(title="❌ Unauthorized Action", description="This proposal does not involve you.",
-                                    color=discord.Color.red()))
-            return
-
-        trade = self.trade_helper.resolve_trade(trade_id)
-        if not trade:
-            await ctx.send(
-                embed=discord.Embed(title="❌ Proposal Not Active", description="This proposal is no longer pending.",
-                                    color=discord.Color.orange()))
+                                    color=_COLOR_RED))
             return
 
+        is_sender = trade["sender_id"] == ctx.author.id
         action = "cancelled" if is_sender else "declined"
         other_party_id = trade["recipient_id"] if is_sender else trade["sender_id"]
         other_party = self.bot.get_user(other_party_id)
 
         action_title = f"❌ Asset Exchange Proposal {action.capitalize()}"
         action_desc = f"User {ctx.author.mention} has successfully **{action}** asset exchange proposal (`{trade_id}`)."
-        await ctx.send(embed=discord.Embed(title=action_title, description=action_desc, color=discord.Color.red()))
-
-        if other_party:
-            try:
-                other_party_desc = f"Asset exchange proposal (`{trade_id}`) with {ctx.author.mention} was **{action}**."
-                await other_party.send(
-                    embed=discord.Embed(title=action_title, description=other_party_desc, color=discord.Color.red()))
-            except discord.Forbidden:
-                pass
+        other_party_desc = f"Asset exchange proposal (`{trade_id}`) with {ctx.author.mention} was **{action}**."
+        await self._send_alongside_dm(
+            ctx, discord.Embed(title=action_title, description=action_desc, color=_COLOR_RED), other_party,
+            discord.Embed(title=action_title, description=other_party_desc, color=_COLOR_RED))
 
     @commands.command(name="fuse")
     @is_cog_ready()
@@ -1835,7 +1908,7 @@ class ARG(commands.Cog):
             embed = discord.Embed(title="⚠️ Insufficient Components for Fusion",
                                   description=f"User {ctx.author.mention}, fusion protocol requires a minimum of two "
                                               f"components.\nSyntax: `{ctx.prefix}fuse <plot_num_1> <item_id_1> ...`",
-                                  color=discord.Color.orange())
+                                  color=_COLOR_ORANGE)
             embed.set_footer(text="Penny - Fusion Systems Interface")
             await ctx.send(embed=embed)
             return
@@ -1847,51 +1920,49 @@ class ARG(commands.Cog):
         requested_items_counter = Counter()
         errors = []
 
-        plot_args = [cmd_arg for cmd_arg in args if cmd_arg.isdigit()]
-        if len(plot_args) != len(set(plot_args)):
-            errors.append("Duplicate plots were mentioned. Each plot can only be used once per fusion attempt.")
-
-        processed_plots = set()
-
-        mat_id_map = {name.lower(): mat_id for mat_id, name in self.data_loader.materials_data.items()}
-        mat_id_map.update({mat_id.lower(): mat_id for mat_id in self.data_loader.materials_data.keys()})
-
+        plot_nums = []
+        material_tokens = []
         for cmd_arg in args:
             if cmd_arg.isdigit():
-                plot_num = int(cmd_arg)
+                plot_nums.append(int(cmd_arg))
+            else:
+                material_tokens.append(cmd_arg)
 
-                if first_plot_mentioned is None:
-                    first_plot_mentioned = plot_num
+        unique_plot_nums = list(dict.fromkeys(plot_nums))
+        if len(unique_plot_nums) != len(plot_nums):
+            errors.append("Duplicate plots were mentioned. Each plot can only be used once per fusion attempt.")
 
-                if plot_num in processed_plots:
-                    continue
+        if plot_nums:
+            first_plot_mentioned = plot_nums[0]
 
-                processed_plots.add(plot_num)
+        unlocked_mask = self.garden_helper.get_unlocked_slot_mask(ctx.author.id)
+        garden = profile.garden
+        for plot_num in unique_plot_nums:
+            if not (1 <= plot_num <= 12):
+                errors.append(f"Plot {plot_num}: Invalid number.")
+            elif not unlocked_mask & (1 << (plot_num - 1)):
+                errors.append(f"Plot {plot_num}: Locked.")
+            elif isinstance(plant := garden[plot_num - 1], PlantedPlant):
+                validated_plots_info.append({"data": plant, "slot_1based": plot_num})
+            else:
+                errors.append(f"Plot {plot_num}: Is empty or has a non-fusable seedling.")
 
-                if not (1 <= plot_num <= 12):
-                    errors.append(f"Plot {plot_num}: Invalid number.")
-                elif not self.garden_helper.is_slot_unlocked(profile, plot_num):
-                    errors.append(f"Plot {plot_num}: Locked.")
-                else:
-                    plant = profile.garden[plot_num - 1]
-                    if isinstance(plant, PlantedPlant):
-                        validated_plots_info.append({"data": plant, "slot_1based": plot_num})
-                    else:
-                        errors.append(f"Plot {plot_num}: Is empty or has a non-fusable seedling.")
+        mat_id_map = self.data_loader.material_lookup_map
+        for cmd_arg in material_tokens:
+            if canonical_id := mat_id_map.get(cmd_arg.lower()):
+                requested_items_counter[canonical_id] += 1
             else:
-                arg_lower = cmd_arg.lower()
-                canonical_id = mat_id_map.get(arg_lower)
-                if canonical_id:
-                    requested_items_counter[canonical_id] += 1
-                else:
-                    errors.append(f"'{cmd_arg}' is not a valid plot number or fusable material.")
+                errors.append(f"'{cmd_arg}' is not a valid plot number or fusable material.")
+
+        materials_data = self.data_loader.materials_data
+        requested_item_names = {item_id: materials_data.get(item_id, item_id) for item_id in requested_items_counter}
 
+        inventory = profile.inventory
         for item_id, count in requested_items_counter.items():
-            if profile.inventory.get(item_id, 0) < count:
-                item_name = self.data_loader.materials_data.get(item_id, item_id)
-                errors.append(
-                    f"You need {count}x **{item_name}** but only have "
-                    f"{profile.inventory.get(item_id, 0)}.")
+            held_count = inventory.get(item_id, 0)
+
+            if held_count < count:
+                errors.append(f"You need {count}x **{requested_item_names[item_id]}** but only have {held_count}.")
 
         if first_plot_mentioned is None:
             errors.append("Fusion requires at least one plant from a plot to determine the result's location.")
@@ -1900,84 +1971,88 @@ class ARG(commands.Cog):
             await ctx.send(embed=discord.Embed(title="❌ Fusion Input Error",
                                                description="Fusion protocol aborted due to input failures:\n\n"
                                                            + "\n".join(f"• {e}" for e in errors),
-                                               color=discord.Color.red()))
+                                               color=_COLOR_RED))
             return
 
         base_components = []
         deconstruction_errors = []
         for plot_info in validated_plots_info:
-            components, errors = self.fusion_helper.deconstruct_plant(dataclasses.asdict(plot_info["data"]))
+            components, errors = self.fusion_helper.deconstruct_plant(plot_info["data"].to_dict())
             base_components.extend(components)
             deconstruction_errors.extend(errors)
 
         for item_id, count in requested_items_counter.items():
-            item_name = self.data_loader.materials_data.get(item_id, item_id)
-            base_components.extend([item_name] * count)
+            base_components.extend([requested_item_names[item_id]] * count)
 
         if deconstruction_errors:
             await ctx.send(embed=discord.Embed(title="❌ Fusion Deconstruction Error",
                                                description="Errors occurred during component analysis:\n\n" + "\n".join(
-                                                   f"• {e}" for e in deconstruction_errors), color=discord.Color.red()))
+                                                   f"• {e}" for e in deconstruction_errors), color=_COLOR_RED))
             return
 
         fusion_result_data = self.fusion_helper.find_fusion_match(base_components)
 
         consumed_list_str = [f"**{p['data'].name}** (Plot {p['slot_1based']})" for p in validated_plots_info]
         consumed_list_str.extend(
-            [f"**{self.data_loader.materials_data.get(item_id, item_id)}** x{count}" for item_id, count in
-             requested_items_counter.items()])
+            f"**{requested_item_names[item_id]}** x{count}" for item_id, count in requested_items_counter.items())
 
         if not fusion_result_data:
             desc = f"The combination of components from {', '.join(consumed_list_str)} does not match any known " \
                    f"fusion recipe."
             await ctx.send(embed=discord.Embed(title="🚫 No Matching Fusion Recipe Found", description=desc,
-                                               color=discord.Color.orange()))
+                                               color=_COLOR_ORANGE))
             return
 
         result_plant_name = fusion_result_data.name
         fusion_visibility = fusion_result_data.visibility
-        is_new = fusion_result_data.id not in profile.discovered_fusions and fusion_visibility != "invisible"
+        is_new = fusion_result_data.id not in profile.discovered_fusions_set and fusion_visibility != "invisible"
         output_slot = first_plot_mentioned
 
+        self.image_helper.warm_plant_image(fusion_result_data.id)
+
         lock_message = f"Awaiting confirmation to fuse components into a **{result_plant_name}**."
         self.lock_helper.add_lock(ctx.author.id, "fusion", lock_message)
 
         confirm_desc = (f"User {ctx.author.mention}, the following components will be consumed:\n"
                         f"  • {', '.join(consumed_list_str)}\n\n"
                         f"This combination will create: **{result_plant_name}{' [NEW]' if is_new else ''}**\n\n"
-                        f"The result will be placed in plot **{output_slot}**. Proceed? (yes/no)")
+                        f"The result will be placed in plot **{output_slot}**. Proceed?")
 
         embed = discord.Embed(title="🧬 Fusion Confirmation Required", description=confirm_desc,
-                              color=discord.Color.teal())
-        await ctx.send(embed=embed)
+                              color=_COLOR_TEAL)
+        view = ConfirmView(ctx.author.id, timeout=60.0)
 
         try:
-            msg = await self.bot.wait_for("message", timeout=60.0,
-                                          check=lambda m: m.author == ctx.author and m.channel == ctx.channel
-                                          and m.content.lower() in ["yes", "y", "no", "n"])
+            view.message = await ctx.send(embed=embed, view=view)
+            timed_out = await view.wait()
+
+            if timed_out:
+                await ctx.send(embed=discord.Embed(title="⏰ Fusion Timed Out",
+                                                   description="Confirmation not received. The operation has been "
+                                                               "automatically cancelled.",
+                                                   color=_COLOR_LIGHT_GREY))
+                return
 
-            if msg.content.lower() in ["no", "n"]:
+            if not view.value:
                 await ctx.send(embed=discord.Embed(title="🚫 Fusion Cancelled",
                                                    description="Fusion protocol has been cancelled by user directive.",
-                                                   color=discord.Color.light_grey()))
+                                                   color=_COLOR_LIGHT_GREY))
                 return
-        except asyncio.TimeoutError:
-            await ctx.send(embed=discord.Embed(title="⏰ Fusion Timed Out",
-                                               description="Confirmation not received. The operation has been "
-                                                           "automatically cancelled.",
-                                               color=discord.Color.light_grey()))
-            return
         finally:
             self.lock_helper.remove_lock_for_user(ctx.author.id)
 
-        for item_id, count in requested_items_counter.items():
-            self.garden_helper.remove_item_from_inventory(ctx.author.id, item_id, count)
+        new_plant = PlantedPlant(id = fusion_result_data.id, name = result_plant_name, type = fusion_result_data.type)
 
-        for plot_info in validated_plots_info:
-            self.garden_helper.set_garden_plot(ctx.author.id, plot_info["slot_1based"] - 1, None)
+        plot_updates = {plot_info["slot_1based"] - 1: None for plot_info in validated_plots_info}
+        plot_updates[output_slot - 1] = new_plant
+        inventory_delta = {item_id: -count for item_id, count in requested_items_counter.items()}
 
-        new_plant = PlantedPlant(id = fusion_result_data.id, name = result_plant_name, type = fusion_result_data.type)
-        self.garden_helper.set_garden_plot(ctx.author.id, output_slot - 1, new_plant)
+        if not self.garden_helper.apply_garden_changes(ctx.author.id, plot_updates, inventory_delta):
+            await ctx.send(embed=discord.Embed(title="❌ Fusion Aborted",
+                                               description="Your materials changed while awaiting confirmation. "
+                                                           "No components were consumed.",
+                                               color=_COLOR_RED))
+            return
 
         bonus_text = ""
         if is_new:
@@ -1989,11 +2064,16 @@ class ARG(commands.Cog):
                              f"{self.CURRENCY_EMOJI}!"
 
         unlock_text = ""
-        profile = self.garden_helper.get_user_profile_view(ctx.author.id)
         if fusion_visibility != "invisible":
-            newly_unlocked_bgs = self.background_helper.check_for_unlocks(
-                profile.discovered_fusions, profile.unlocked_backgrounds
-            )
+            discovered_after = profile.discovered_fusions_set | {fusion_result_data.id}
+            if is_new:
+                newly_unlocked_bgs = self.background_helper.check_for_unlocks_incremental(
+                    fusion_result_data.id, discovered_after, profile.unlocked_backgrounds_set
+                )
+            else:
+                newly_unlocked_bgs = self.background_helper.check_for_unlocks(
+                    discovered_after, profile.unlocked_backgrounds_set
+                )
             if newly_unlocked_bgs:
                 unlocked_names = []
                 for bg in newly_unlocked_bgs:
@@ -2005,10 +2085,10 @@ class ARG(commands.Cog):
         success_desc = f"Fusion successful! A **{result_plant_name}** has been cultivated in plot {output_slot}." \
                        + bonus_text + unlock_text
         success_embed = discord.Embed(title="✅ Fusion Protocol Complete", description=success_desc,
-                                      color=discord.Color.green())
+                                      color=_COLOR_GREEN)
         success_embed.set_footer(text="Penny - Fusion Systems Interface")
 
-        image_file_to_send = self.image_helper.get_image_file_for_plant(fusion_result_data.id)
+        image_file_to_send = await self.image_helper.get_image_file_for_plant_async(fusion_result_data.id)
         if image_file_to_send:
             success_embed.set_image(url=f"attachment://{image_file_to_send.filename}")
 
@@ -2022,25 +2102,24 @@ class ARG(commands.Cog):
         if ctx.invoked_subcommand is not None:
             return
 
-        is_list_intent = (
-                not full_args or
-                any(":" in cmd_arg for cmd_arg in full_args.split()) or
-                (full_args and full_args.strip().split()[-1].isdigit())
-        )
+        tokens = full_args.split()
+        is_list_intent = not tokens or tokens[-1].isdigit() or any(":" in token for token in tokens)
 
         if is_list_intent:
             profile = self.garden_helper.get_user_profile_view(ctx.author.id)
-            discovered_ids = set(profile.discovered_fusions)
+            discovered_ids = profile.discovered_fusions_set
 
-            discovered_fusions_to_display = [f for f in self.fusion_helper.visible_fusions if f.id in discovered_ids]
+            visible_by_id = self.fusion_helper.visible_fusions_by_id
+            hidden_by_id = self.fusion_helper.hidden_fusions_by_id
+            discovered_fusions_to_display = []
             for fid in discovered_ids:
-                if hidden_fusion := self.fusion_helper.hidden_fusions_by_id.get(fid):
-                    discovered_fusions_to_display.append(hidden_fusion)
+                if fusion_def := visible_by_id.get(fid) or hidden_by_id.get(fid):
+                    discovered_fusions_to_display.append(fusion_def)
 
             if not discovered_fusions_to_display:
                 await ctx.send(embed=discord.Embed(title=f"🔬 {ctx.author.display_name}'s Almanac",
                                                    description="You have not discovered any fusions yet.",
-                                                   color=discord.Color.purple()))
+                                                   color=_COLOR_PURPLE))
                 return
 
             parsed_args = self.fusion_helper.parse_almanac_args(full_args)
@@ -2051,22 +2130,22 @@ class ARG(commands.Cog):
             if not filtered_fusions:
                 await ctx.send(embed=discord.Embed(title="ℹ️ Almanac Search",
                                                    description="No discovered fusions match your specified filters.",
-                                                   color=discord.Color.purple()))
+                                                   color=_COLOR_PURPLE))
                 return
 
             total_visible_fusions = len(self.fusion_helper.visible_fusions)
-            discovered_hidden_count = sum(1 for fid in discovered_ids if fid in self.fusion_helper.hidden_fusions_by_id)
+            discovered_hidden_count = sum(1 for fid in discovered_ids if fid in hidden_by_id)
             total_almanac_fusions = total_visible_fusions + discovered_hidden_count
 
             items_per_page = 10
             total_pages = max(1, (len(filtered_fusions) + items_per_page - 1) // items_per_page)
             page = max(1, min(page, total_pages))
-            page_entries = sorted(filtered_fusions, key=lambda x: x.name)[
-                           (page - 1) * items_per_page: page * items_per_page]
+            page_entries = heapq.nsmallest(page * items_per_page, filtered_fusions, key=lambda x: x.name)[
+                           (page - 1) * items_per_page:]
 
             title = f"🔬 {ctx.author.display_name}'s Almanac ({len(discovered_ids)}/{total_almanac_fusions}) " \
                     f"(Page {page}/{total_pages})"
-            embed = discord.Embed(title=title, color=discord.Color.purple())
+            embed = discord.Embed(title=title, color=_COLOR_PURPLE)
 
             display_lines = []
             for i, f in enumerate(page_entries, start=(page - 1) * items_per_page + 1):
@@ -2086,34 +2165,34 @@ class ARG(commands.Cog):
         """Shows detailed info for a specific discovered fusion."""
 
         profile = self.garden_helper.get_user_profile_view(ctx.author.id)
-        discovered_ids = set(profile.discovered_fusions)
+        discovered_ids = profile.discovered_fusions_set
 
         fusion_def = self.fusion_helper.find_defined_fusion(fusion_query)
 
         if not fusion_def or fusion_def.visibility == "invisible":
             embed = discord.Embed(title="ℹ️ Recipe Unknown",
                                   description=f"The fusion recipe for **'{fusion_query}'** could not be found.",
-                                  color=discord.Color.purple())
+                                  color=_COLOR_PURPLE)
             await ctx.send(embed=embed)
             return
 
         if fusion_def.visibility == "hidden" and fusion_def.id not in discovered_ids:
             embed = discord.Embed(title="ℹ️ Recipe Unknown",
                                   description=f"The fusion recipe for **'{fusion_query}'** could not be found.",
-                                  color=discord.Color.purple())
+                                  color=_COLOR_PURPLE)
             await ctx.send(embed=embed)
             return
 
         if fusion_def.id not in discovered_ids:
             embed = discord.Embed(title="ℹ️ Fusion Not Discovered",
                                   description=f"You have not discovered **{fusion_def.name}** yet. ",
-                                  color=discord.Color.purple())
+                                  color=_COLOR_PURPLE)
             await ctx.send(embed=embed)
             return
 
         embed = discord.Embed(title=f"🌿 Almanac Entry: {fusion_def.name}",
                               description=f"Detailed schematics for **{fusion_def.name}** from your almanac.",
-                              color=discord.Color.purple())
+                              color=_COLOR_PURPLE)
         embed.add_field(name="Asset ID", value=f"`{fusion_def.id}`", inline=True)
         embed.add_field(name="Classification Tier", value=f"`{fusion_def.type}`", inline=True)
         embed.add_field(name="Fusion Recipe",
@@ -2132,28 +2211,34 @@ class ARG(commands.Cog):
         """Lists all fusions you can make right now."""
 
         profile = self.garden_helper.get_user_profile_view(ctx.author.id)
-        discovered_ids = set(profile.discovered_fusions)
+        discovered_ids = profile.discovered_fusions_set
         parsed_args = self.fusion_helper.parse_almanac_args(full_args)
         filters, page = parsed_args['filters'], parsed_args['page']
 
         user_assets = self.fusion_helper.get_user_whole_assets_with_source(profile)
+        have_component_set = self.fusion_helper.get_component_name_set(user_assets)
 
         all_craftable_fusions = []
         for fusion_def in self.fusion_helper.visible_fusions:
+            if not fusion_def.recipe_set <= have_component_set:
+                continue
+
+            recipe_counter = self.fusion_helper.recipe_counters_by_id[fusion_def.id]
+
             plan, _ = self.fusion_helper.find_crafting_plan(
-                recipe_counter=Counter(fusion_def.recipe),
+                recipe_counter=recipe_counter,
                 user_assets=user_assets,
                 fusion_id_to_check=fusion_def.id
             )
 
             if plan is not None:
-                have_assets_list = [asset['name'] for asset in plan]
+                have_counter = Counter(asset['name'] for asset in plan)
 
                 info = {
                     "fusion_def": fusion_def,
                     "plan": plan,
                     "is_new": fusion_def.id not in discovered_ids,
-                    "have_list": have_assets_list
+                    "have_counter": have_counter
                 }
                 all_craftable_fusions.append(info)
         
@@ -2162,23 +2247,25 @@ class ARG(commands.Cog):
         filtered_fusions = self.fusion_helper.apply_almanac_filters(craftable_fusion_def, filters, discovered_ids, 
                                                                     plans_by_fusion_id=plans_by_fusion_id)
         
-        filtered_results_info = [info for info in all_craftable_fusions if info['fusion_def'] in filtered_fusions]
+        filtered_ids = {f.id for f in filtered_fusions}
+
+        filtered_results_info = [info for info in all_craftable_fusions if info['fusion_def'].id in filtered_ids]
 
         if not filtered_results_info:
             desc = "You cannot make any fusions that match your filters with your current assets."
             await ctx.send(
-                embed=discord.Embed(title="✅ Available Fusions", description=desc, color=discord.Color.purple()))
+                embed=discord.Embed(title="✅ Available Fusions", description=desc, color=_COLOR_PURPLE))
             return
 
-        items_per_page = 5
         sorted_entries = sorted(filtered_results_info,
                                 key=lambda f: (not f['is_new'], len(f['fusion_def'].recipe), f['fusion_def'].name))
 
-        total_pages = max(1, (len(sorted_entries) + items_per_page - 1) // items_per_page)
+        total_pages = max(1, (len(sorted_entries) + _ALMANAC_ITEMS_PER_PAGE - 1) // _ALMANAC_ITEMS_PER_PAGE)
         page = max(1, min(page, total_pages))
-        page_entries = sorted_entries[(page - 1) * items_per_page: page * items_per_page]
+        start_index = (page - 1) * _ALMANAC_ITEMS_PER_PAGE
+        page_entries = sorted_entries[start_index: start_index + _ALMANAC_ITEMS_PER_PAGE]
 
-        embed = discord.Embed(title=f"✅ Available Fusions (Page {page}/{total_pages})", color=discord.Color.purple())
+        embed = discord.Embed(title=f"✅ Available Fusions (Page {page}/{total_pages})", color=_COLOR_PURPLE)
 
         for info in page_entries:
             f = info['fusion_def']
@@ -2187,15 +2274,15 @@ class ARG(commands.Cog):
             storage_tag = " 📦" if storage_items_in_plan else ""
             recipe_str = self.fusion_helper.format_recipe_string(f.recipe)
 
-            have_list = info.get('have_list', [])
+            have_counter = info['have_counter']
             have_str = ", ".join(
-                [f"**{name}** x{count}" for name, count in Counter(have_list).items()]) if have_list else "None"
+                [_NAME_COUNT_FMT(name, count) for name, count in have_counter.items()]) if have_counter else "None"
 
             if not storage_tag:
                 fuse_args = [str(a['index'] + 1) if a['source'] == 'garden' else a['id'] for a in info.get('plan', [])]
                 command_str = f"`{ctx.prefix}fuse {' '.join(fuse_args)}`"
             else:
-                unstore_indices = sorted([str(asset['index'] + 1) for asset in storage_items_in_plan])
+                unstore_indices = [str(i) for i in sorted(asset['index'] + 1 for asset in storage_items_in_plan)]
                 command_str = f"`{ctx.prefix}unstore {' '.join(unstore_indices)}`"
 
             value_str = f"Recipe: {recipe_str}\nHave: {have_str}\n{command_str}"
@@ -2206,12 +2293,56 @@ class ARG(commands.Cog):
                  f"discovered:<bool> storage:<bool>")
         await ctx.send(embed=embed)
 
+    def _build_discover_embed(self, page_entries: List[dict], prefix: str, page: int,
+                              total_pages: int) -> discord.Embed:
+        """Renders one page of almanac discover results. Only reads static fusion data, so it may run off-loop."""
+
+        embed = discord.Embed(title=f"🌱 Potential Discoveries (Page {page}/{total_pages})",
+                              color=_COLOR_PURPLE)
+
+        for info in page_entries:
+            f = info['fusion_def']
+            value_lines = []
+            recipe_str = self.fusion_helper.format_recipe_string(f.recipe)
+            have_counter = info['have_counter']
+            have_str = ", ".join([_NAME_COUNT_FMT(name, count) for name, count in have_counter.items()])
+            if info['plan'] is not None:
+                storage_items_in_plan = [asset for asset in info['plan'] if asset.get("source") == "storage"]
+                storage_tag = " 📦" if storage_items_in_plan else ""
+
+                if not storage_tag:
+                    fuse_args = [str(a['index'] + 1) if a['source'] == 'garden' else a['id'] for a in info['plan']]
+                    command_str = f"`{prefix}fuse {' '.join(fuse_args)}`"
+                else:
+                    unstore_indices = [str(i) for i in sorted(asset['index'] + 1 for asset in storage_items_in_plan)]
+                    command_str = f"`{prefix}unstore {' '.join(unstore_indices)}`"
+
+                value_lines.append(f"✅ **Ready to Fuse!**{storage_tag}\nRecipe: {recipe_str}\nHave: {have_str}\n"
+                                   f"{command_str}")
+            else:
+                value_lines.append(f"Recipe: {recipe_str}")
+
+                if have_str:
+                    value_lines.append(f"Have: {have_str}")
+
+                positive_needs = [_NAME_COUNT_FMT(name, count) for name, count in info['need_counter'].items() if
+                                  count > 0]
+                if positive_needs:
+                    value_lines.append(f"Need: {', '.join(positive_needs)}")
+
+            embed.add_field(name=f"▫️ {f.name}", value="\n".join(value_lines) or " ", inline=False)
+
+        embed.set_footer(
+            text=f"Use {prefix}almanac discover [filters] [page]. Filters: name:<str> contains:<str> tier:<#> "
+                 f"storage:<bool> missing:<#>")
+        return embed
+
     @almanac_command.command(name="discover")
     async def almanac_discover_command(self, ctx: commands.Context, *, full_args: str = ""):
         """Lists potential discoveries using at least one of your plants or materials."""
 
         profile = self.garden_helper.get_user_profile_view(ctx.author.id)
-        discovered_ids = set(profile.discovered_fusions)
+        discovered_ids = profile.discovered_fusions_set
         parsed_args = self.fusion_helper.parse_almanac_args(full_args)
         filters, page = parsed_args['filters'], parsed_args['page']
 
@@ -2225,39 +2356,53 @@ class ARG(commands.Cog):
         valid_user_assets = self.fusion_helper.get_valid_crafting_components(user_assets)
         sorted_user_assets = sorted(
             valid_user_assets,
-            key=lambda x: len(self.fusion_helper.deconstruct_plant(x)[0]),
+            key=lambda x: len(self.fusion_helper.deconstruct_plant_cached(x)[0]),
             reverse=True
         )
+        user_component_counters = [
+            (asset['name'], Counter(self.fusion_helper.deconstruct_plant_cached(asset)[0]))
+            for asset in sorted_user_assets
+        ]
+        have_component_set = set().union(*(counter.keys() for _, counter in user_component_counters))
 
         for fusion_def in self.fusion_helper.visible_fusions:
             if fusion_def.id in discovered_ids:
                 continue
 
-            recipe_counter = Counter(fusion_def.recipe)
+            recipe_counter = self.fusion_helper.recipe_counters_by_id[fusion_def.id]
+            if recipe_counter and fusion_def.recipe_set.isdisjoint(have_component_set):
+                potential_fusions.append({
+                    "fusion_def": fusion_def,
+                    "plan": None,
+                    "need_counter": recipe_counter.copy(),
+                    "missing_count": sum(recipe_counter.values()),
+                    "have_counter": Counter(),
+                    "have_count": 0,
+                    "sort_group": 3
+                })
+                continue
+
             plan, needed = self.fusion_helper.find_crafting_plan(
                 recipe_counter=recipe_counter,
                 user_assets=user_assets,
                 fusion_id_to_check=fusion_def.id
             )
 
-            have_assets_list = []
+            have_counter = Counter()
             if plan is not None:
-                have_assets_list = [p.get('name', 'Unknown') for p in plan]
+                have_counter.update(p.get('name', 'Unknown') for p in plan)
                 sort_group = 0
             else:
                 temp_needed = recipe_counter.copy()
 
-                for asset in sorted_user_assets:
-                    asset_components, _ = self.fusion_helper.deconstruct_plant(asset)
-                    asset_counter = Counter(asset_components)
-
+                for asset_name, asset_counter in user_component_counters:
                     if all(temp_needed.get(item, 0) >= count for item, count in asset_counter.items()):
                         temp_needed -= asset_counter
-                        have_assets_list.append(asset['name'])
+                        have_counter[asset_name] += 1
 
                 sort_group = 3
-                if have_assets_list:
-                    if any(comp not in material_names for comp in have_assets_list):
+                if have_counter:
+                    if any(comp not in material_names for comp in have_counter):
                         sort_group = 1
                     else:
                         sort_group = 2
@@ -2266,105 +2411,54 @@ class ARG(commands.Cog):
                 "fusion_def": fusion_def,
                 "plan" : plan,
                 "need_counter": needed,
-                "have_list": have_assets_list,
+                "missing_count": sum(needed.values()),
+                "have_counter": have_counter,
+                "have_count": sum(have_counter.values()),
                 "sort_group": sort_group
             }
 
             potential_fusions.append(info)
 
         missing_filter_value = None
-        temp_filters = list(filters)
-        for f in temp_filters:
-            if f['key'] == 'missing':
-                try:
-                    missing_filter_value = int(f['value'])
-                except ValueError:
-                    pass
-                filters.remove(f)
-        
+        definition_filters = []
+        for f in filters:
+            if f['key'] != 'missing':
+                definition_filters.append(f)
+                continue
+            try:
+                missing_filter_value = int(f['value'])
+            except ValueError:
+                pass
+
         potential_fusions_def = [info['fusion_def'] for info in potential_fusions]
-        filtered_fusions = self.fusion_helper.apply_almanac_filters(potential_fusions_def, filters, discovered_ids)
+        filtered_fusions = self.fusion_helper.apply_almanac_filters(potential_fusions_def, definition_filters,
+                                                                    discovered_ids)
         filtered_ids = {f.id for f in filtered_fusions}
 
         filtered_results = [info for info in potential_fusions if info['fusion_def'].id in filtered_ids]
 
         if missing_filter_value is not None:
-            filtered_results = [f for f in filtered_results if
-                                sum(f.get('need_counter', Counter()).values()) == missing_filter_value]
+            filtered_results = [f for f in filtered_results if f['missing_count'] == missing_filter_value]
 
         if not filtered_results:
             await ctx.send(embed=discord.Embed(title="🌱 Potential Discoveries",
                                                description="No undiscovered recipes match your criteria.",
-                                               color=discord.Color.purple()))
-            return
-
-        def sort_key(info):
-            group = info.get('sort_group', 3)
-            f_def = info['fusion_def']
-            if group < 2:
-                key1 = sum(info.get('need_counter', Counter()).values())
-                key2 = len(f_def.recipe)
-                key3 = f_def.name
-                return group, key1, key2, key3
-            elif group == 2:
-                key1 = -len(info.get('have_list', []))
-                key2 = len(f_def.recipe)
-                key3 = f_def.name
-                return group, key1, key2, key3
-            else: 
-                key1 = len(f_def.recipe)
-                key2 = f_def.name
-                key3 = 0
-                return group, key1, key2, key3
-
-        sorted_entries = sorted(filtered_results, key=sort_key)
-
-        items_per_page = 5
-        total_pages = max(1, (len(sorted_entries) + items_per_page - 1) // items_per_page)
-        page = max(1, min(page, total_pages))
-        page_entries = sorted_entries[(page - 1) * items_per_page: page * items_per_page]
-
-        embed = discord.Embed(title=f"🌱 Potential Discoveries (Page {page}/{total_pages})",
-                              color=discord.Color.purple())
-
-        for info in page_entries:
-            f = info['fusion_def']
-            value_lines = []
-            if info['plan'] is not None:
-                recipe_str = self.fusion_helper.format_recipe_string(f.recipe)
-                have_str = ", ".join(
-                    [f"**{name}** x{count}" for name, count in Counter(info.get('have_list', [])).items()])
-                storage_items_in_plan = [asset for asset in info.get("plan", []) if asset.get("source") == "storage"]
-                storage_tag = " 📦" if storage_items_in_plan else ""
-                header = f"✅ **Ready to Fuse!**{storage_tag}\nRecipe: {recipe_str}\nHave: {have_str}"
-
-                if not storage_tag:
-                    fuse_args = [str(a['index'] + 1) if a['source'] == 'garden' else a['id'] for a in info['plan']]
-                    command_str = f"`{ctx.prefix}fuse {' '.join(fuse_args)}`"
-                    value_lines.append(f"{header}\n{command_str}")
-                else:
-                    unstore_indices = sorted([str(asset['index'] + 1) for asset in storage_items_in_plan])
-                    command_str = f"`{ctx.prefix}unstore {' '.join(unstore_indices)}`"
-                    value_lines.append(f"{header}\n{command_str}")
-            else:
-                recipe_str = self.fusion_helper.format_recipe_string(f.recipe)
-                value_lines.append(f"Recipe: {recipe_str}")
-
-                have_list = info.get('have_list', [])
-                if have_list:
-                    have_str = ", ".join([f"**{name}** x{count}" for name, count in Counter(have_list).items()])
-                    value_lines.append(f"Have: {have_str}")
+                                               color=_COLOR_PURPLE))
+            return
 
-                need_counter = info.get('need_counter', Counter())
-                if any(count > 0 for count in need_counter.values()):
-                    need_str = ", ".join([f"**{name}** x{count}" for name, count in need_counter.items() if count > 0])
-                    value_lines.append(f"Need: {need_str}")
+        sorted_entries = sorted(filtered_results, key=_discover_sort_key)
 
-            embed.add_field(name=f"▫️ {f.name}", value="\n".join(value_lines) or " ", inline=False)
+        total_pages = max(1, (len(sorted_entries) + _ALMANAC_ITEMS_PER_PAGE - 1) // _ALMANAC_ITEMS_PER_PAGE)
+        page = max(1, min(page, total_pages))
+        start_index = (page - 1) * _ALMANAC_ITEMS_PER_PAGE
+        page_entries = sorted_entries[start_index: start_index + _ALMANAC_ITEMS_PER_PAGE]
 
-        embed.set_footer(
-            text=f"Use {ctx.prefix}almanac discover [filters] [page]. Filters: name:<str> contains:<str> tier:<#> "
-                 f"storage:<bool> missing:<#>")
+        render_args = (page_entries, ctx.prefix, page, total_pages)
+        render_size = sum(len(info['have_counter']) + len(info['fusion_def'].recipe) for info in page_entries)
+        if render_size > _DISCOVER_RENDER_OFFLOAD_THRESHOLD:
+            embed = await asyncio.to_thread(self._build_discover_embed, *render_args)
+        else:
+            embed = self._build_discover_embed(*render_args)
         await ctx.send(embed=embed)
 
     @commands.group(name="background", invoke_without_command=True)
@@ -2382,21 +2476,20 @@ class ARG(commands.Cog):
         """Displays all the garden backgrounds you have unlocked."""
 
         profile = self.garden_helper.get_user_profile_view(ctx.author.id)
-        unlocked_ids = profile.unlocked_backgrounds
+        unlocked_ids = profile.unlocked_backgrounds_set
         active_id = profile.active_background
 
         embed = discord.Embed(
             title=f"🖼️ {ctx.author.display_name}'s Unlocked Backgrounds",
             description=f"You have unlocked **{len(unlocked_ids)}** background(s). Use `{ctx.prefix}bg set <name>` to "
                         f"change your active background.",
-            color=discord.Color.dark_magenta()
+            color=_COLOR_DARK_MAGENTA
         )
 
         display_lines = []
-        for bg_def in self.background_helper.all_backgrounds:
-            if bg_def.id in unlocked_ids:
-                is_active = "✅" if bg_def.id == active_id else "▫️"
-                display_lines.append(f"{is_active} **{bg_def.name}**")
+        for bg_def in self.background_helper.get_backgrounds_in_catalog_order(unlocked_ids):
+            is_active = "✅" if bg_def.id == active_id else "▫️"
+            display_lines.append(f"{is_active} **{bg_def.name}**")
 
         embed.add_field(name="Available Backgrounds", value="\n".join(display_lines) or "None unlocked.")
         await ctx.send(embed=embed)
@@ -2406,25 +2499,21 @@ class ARG(commands.Cog):
         """Sets your active garden background."""
 
         profile = self.garden_helper.get_user_profile_view(ctx.author.id)
-        unlocked_ids = profile.unlocked_backgrounds
+        unlocked_ids = profile.unlocked_backgrounds_set
 
-        target_bg = None
-        for bg_def in self.background_helper.all_backgrounds:
-            if bg_def.name.lower() == background_name.lower():
-                target_bg = bg_def
-                break
+        target_bg = self.background_helper.get_background_by_name(background_name)
 
         if not target_bg:
             await ctx.send(embed=discord.Embed(title="❌ Background Not Found",
                                                description=f"No background named '{background_name}' exists.",
-                                               color=discord.Color.red()))
+                                               color=_COLOR_RED))
             return
 
         if target_bg.id not in unlocked_ids:
             await ctx.send(embed=discord.Embed(title="❌ Background Locked",
                                                description=f"You have not unlocked the **{target_bg.name}** "
                                                            f"background yet.",
-                                               color=discord.Color.red()))
+                                               color=_COLOR_RED))
             return
 
         self.garden_helper.set_active_background(ctx.author.id, target_bg.id)
@@ -2433,7 +2522,7 @@ class ARG(commands.Cog):
             title="✅ Background Set!",
             description=f"Your active garden background has been set to **{target_bg.name}**. Your profile will now "
                         f"reflect this change.",
-            color=discord.Color.green()
+            color=_COLOR_GREEN
         )
         await ctx.send(embed=embed)
     
@@ -2449,26 +2538,23 @@ class ARG(commands.Cog):
         """Sets a user's balance to a specific amount."""
 
         if amount < 0:
-            await ctx.send(embed=discord.Embed(title="❌ Invalid Input",
-                                               description="Amount cannot be negative. Use a positive integer or zero.",
-                                               color=discord.Color.red()))
+            await ctx.send(embed=_ERR_NEGATIVE_AMOUNT)
             return
 
         profile = self.garden_helper.get_user_profile_view(target_user.id)
         original_balance = profile.balance
 
-        self.garden_helper.set_balance(target_user.id, amount)
-        profile = self.garden_helper.get_user_profile_view(target_user.id)
+        new_balance = self.garden_helper.set_balance(target_user.id, amount)
 
         embed = discord.Embed(
             title="⚙️ Debug: Solar Energy Set Protocol",
             description=f"Successfully set the solar energy balance for User {target_user.mention}.",
-            color=discord.Color.orange()
+            color=_COLOR_ORANGE
         )
         embed.add_field(name="Target User", value=target_user.mention, inline=True)
         embed.add_field(name="Set Amount", value=f"{amount:,}", inline=True)
         embed.add_field(name="Original Balance", value=f"{original_balance:,} {self.CURRENCY_EMOJI}", inline=False)
-        embed.add_field(name="New Balance", value=f"{profile.balance:,} {self.CURRENCY_EMOJI}", inline=False)
+        embed.add_field(name="New Balance", value=f"{new_balance:,} {self.CURRENCY_EMOJI}", inline=False)
         embed.set_footer(text="Penny - Administrative Financial Override Systems")
         await ctx.send(embed=embed)
 
@@ -2477,29 +2563,25 @@ class ARG(commands.Cog):
         """Sets a user's Sun Mastery level."""
 
         if level < 0:
-            await ctx.send(embed=discord.Embed(title="❌ Invalid Input",
-                                               description="Mastery level cannot be negative. Use a positive integer "
-                                                           "or zero.",
-                                               color=discord.Color.red()))
+            await ctx.send(embed=_ERR_NEGATIVE_MASTERY)
             return
 
         profile = self.garden_helper.get_user_profile_view(target_user.id)
         original_mastery = profile.sun_mastery
 
-        self.garden_helper.set_sun_mastery(target_user.id, level)
-        profile = self.garden_helper.get_user_profile_view(target_user.id)
+        new_mastery = self.garden_helper.set_sun_mastery(target_user.id, level)
 
         sun_mastery_bonus = 1 + (0.1 * level)
 
         embed = discord.Embed(
             title="⚙️ Debug: Sun Mastery Level Set Protocol",
             description=f"Successfully set the Sun Mastery level for User {target_user.mention}.",
-            color=discord.Color.orange()
+            color=_COLOR_ORANGE
         )
         embed.add_field(name="Target User", value=target_user.mention, inline=True)
         embed.add_field(name="Set Level", value=f"{level}", inline=True)
         embed.add_field(name="Original Sun Mastery", value=f"{original_mastery}", inline=False)
-        embed.add_field(name="New Sun Mastery", value=f"{profile.sun_mastery} ({sun_mastery_bonus:.2f}x sell boost)",
+        embed.add_field(name="New Sun Mastery", value=f"{new_mastery} ({sun_mastery_bonus:.2f}x sell boost)",
                         inline=False)
         embed.set_footer(text="Penny - Administrative Stat Override Systems")
         await ctx.send(embed=embed)
@@ -2509,30 +2591,26 @@ class ARG(commands.Cog):
         """Sets a user's Time Mastery level."""
 
         if level < 0:
-            await ctx.send(embed=discord.Embed(title="❌ Invalid Input",
-                                               description="Mastery level cannot be negative. Use a positive integer "
-                                                           "or zero.",
-                                               color=discord.Color.red()))
+            await ctx.send(embed=_ERR_NEGATIVE_MASTERY)
             return
 
         profile = self.garden_helper.get_user_profile_view(target_user.id)
         original_mastery = profile.time_mastery
 
-        self.garden_helper.set_time_mastery(target_user.id, level)
-        profile = self.garden_helper.get_user_profile_view(target_user.id)
+        new_mastery = self.garden_helper.set_time_mastery(target_user.id, level)
 
         time_mastery_bonus = 1 + (0.1 * level)
 
         embed = discord.Embed(
             title="⚙️ Debug: Time Mastery Level Set Protocol",
             description=f"Successfully set the Time Mastery level for User {target_user.mention}.",
-            color=discord.Color.orange()
+            color=_COLOR_ORANGE
         )
         embed.add_field(name="Target User", value=target_user.mention, inline=True)
         embed.add_field(name="Set Level", value=f"{level}", inline=True)
         embed.add_field(name="Original Time Mastery", value=f"{original_mastery}", inline=False)
         embed.add_field(name="New Time Mastery",
-                        value=f"{profile.time_mastery} ({time_mastery_bonus:.2f}x growth boost)", inline=False)
+                        value=f"{new_mastery} ({time_mastery_bonus:.2f}x growth boost)", inline=False)
         embed.set_footer(text="Penny - Administrative Stat Override Systems")
         await ctx.send(embed=embed)
 
@@ -2542,19 +2620,16 @@ class ARG(commands.Cog):
         """Adds an item to a user's inventory by ID."""
 
         if quantity <= 0:
-            await ctx.send(
-                embed=discord.Embed(title="❌ Invalid Input", description="Quantity must be a positive number.",
-                                    color=discord.Color.red()))
+            await ctx.send(embed=_ERR_NON_POSITIVE_QUANTITY)
             return
 
-        all_items = self.shop_helper.get_all_item_definitions()
-        actual_item_key = next((k for k, v in all_items.items() if k.lower() == item_id.lower()), None)
-        item_details = all_items.get(actual_item_key)
+        actual_item_key = self.shop_helper.resolve_item_id(item_id)
+        item_details = self.shop_helper.get_all_item_definitions().get(actual_item_key)
 
         if not actual_item_key or not item_details:
             await ctx.send(embed=discord.Embed(title="❌ Item Not Found",
                                                description=f"The ID `{item_id}` does not correspond to any known item.",
-                                               color=discord.Color.red()))
+                                               color=_COLOR_RED))
             return
 
         self.garden_helper.add_item_to_inventory(target_user.id, actual_item_key, quantity)
@@ -2564,7 +2639,7 @@ class ARG(commands.Cog):
             title="⚙️ Debug: Item Addition Protocol",
             description=f"Successfully added **{item_name}** (`{actual_item_key}`) x{quantity} to "
                         f"{target_user.mention}'s inventory.",
-            color=discord.Color.green()
+            color=_COLOR_GREEN
         )
         embed.set_footer(text="Penny - Administrative Inventory Override Systems")
         await ctx.send(embed=embed)
@@ -2574,23 +2649,22 @@ class ARG(commands.Cog):
         """Removes one or more instances of an item from a user's inventory."""
 
         if quantity <= 0:
-            await ctx.send(
-                embed=discord.Embed(title="❌ Invalid Input", description="Quantity must be a positive number.",
-                                    color=discord.Color.red()))
+            await ctx.send(embed=_ERR_NON_POSITIVE_QUANTITY)
             return
             
         profile = self.garden_helper.get_user_profile_view(target_user.id)
         inventory = profile.inventory
 
-        item_id_lower = item_id.lower()
-        actual_item_key = next((k for k in inventory if k.lower() == item_id_lower), None)
+        actual_item_key = item_id if item_id in inventory else self.shop_helper.resolve_item_id(item_id)
+        if actual_item_key not in inventory:
+            actual_item_key = next((k for k in inventory if k.lower() == item_id.lower()), None)
 
         if actual_item_key:
             if inventory.get(actual_item_key, 0) < quantity:
                 await ctx.send(embed=discord.Embed(
                     title="⚙️ Debug: Insufficient Quantity",
                     description=f"User only has {inventory.get(actual_item_key, 0)} of this item. Cannot remove {quantity}.",
-                    color=discord.Color.yellow()
+                    color=_COLOR_YELLOW
                 ))
                 return
 
@@ -2604,19 +2678,43 @@ class ARG(commands.Cog):
                 title="⚙️ Debug: Item Removal Protocol",
                 description=f"Successfully removed **{item_name}** (`{actual_item_key}`) x{quantity} from "
                             f"{target_user.mention}'s inventory.",
-                color=discord.Color.orange()
+                color=_COLOR_ORANGE
             )
         else:
             embed = discord.Embed(
                 title="⚙️ Debug: Item Not Found in Inventory",
                 description=f"Item with ID `{item_id}` not found in {target_user.mention}'s inventory. No changes "
                             f"were made.",
-                color=discord.Color.yellow()
+                color=_COLOR_YELLOW
             )
 
         embed.set_footer(text="Penny - Administrative Inventory Override Systems")
         await ctx.send(embed=embed)
 
+    async def _validate_debug_plot(self, ctx: commands.Context, target_user: discord.Member,
+                                   plot_number: int) -> bool:
+        """Checks that a debug target plot exists, is unlocked and is empty, reporting the first failure."""
+
+        if not (1 <= plot_number <= 12):
+            await ctx.send(embed=_ERR_DEBUG_INVALID_PLOT)
+            return False
+
+        if not self.garden_helper.get_unlocked_slot_mask(target_user.id) & (1 << (plot_number - 1)):
+            await ctx.send(embed=discord.Embed(title="❌ Plot Locked",
+                                               description=f"Plot {plot_number} is locked for user "
+                                                           f"{target_user.mention}.",
+                                               color=_COLOR_RED))
+            return False
+
+        if self.garden_helper.get_user_profile_view(target_user.id).garden[plot_number - 1] is not None:
+            await ctx.send(embed=discord.Embed(title="❌ Plot Occupied",
+                                               description=f"Plot {plot_number} for user {target_user.mention} is "
+                                                           f"already occupied.",
+                                               color=_COLOR_RED))
+            return False
+
+        return True
+
     @cmd_debug_group.group(name="addplant")
     async def debug_addplant_group(self, ctx: commands.Context):
         """Base command for adding plants to a user's garden."""
@@ -2632,31 +2730,13 @@ class ARG(commands.Cog):
             await ctx.send(embed=discord.Embed(title="❌ Plant Not Found",
                                                description=f"The ID `{plant_id}` does not correspond to any known base "
                                                            f"plant.",
-                                               color=discord.Color.red()))
+                                               color=_COLOR_RED))
             return
 
-        profile = self.garden_helper.get_user_profile_view(target_user.id)
-        plot_index = plot_number - 1
-
-        if not (0 <= plot_index < 12):
-            await ctx.send(
-                embed=discord.Embed(title="❌ Invalid Plot", description="Plot number must be between 1 and 12.",
-                                    color=discord.Color.red()))
+        if not await self._validate_debug_plot(ctx, target_user, plot_number):
             return
 
-        if not self.garden_helper.is_slot_unlocked(profile, plot_number):
-            await ctx.send(embed=discord.Embed(title="❌ Plot Locked",
-                                               description=f"Plot {plot_number} is locked for user "
-                                                           f"{target_user.mention}.",
-                                               color=discord.Color.red()))
-            return
-
-        if profile.garden[plot_index] is not None:
-            await ctx.send(embed=discord.Embed(title="❌ Plot Occupied",
-                                               description=f"Plot {plot_number} for user {target_user.mention} is "
-                                                           f"already occupied.",
-                                               color=discord.Color.red()))
-            return
+        plot_index = plot_number - 1
 
         new_plant = PlantedPlant(
             id=plant_definition.id,
@@ -2670,7 +2750,7 @@ class ARG(commands.Cog):
             title="⚙️ Debug: Base Plant Added",
             description=f"Successfully added **{new_plant.name}** to plot {plot_number} for "
                         f"{target_user.mention}.",
-            color=discord.Color.green()
+            color=_COLOR_GREEN
         )
         embed.set_footer(text="Penny - Administrative Override Systems")
         await ctx.send(embed=embed)
@@ -2685,31 +2765,13 @@ class ARG(commands.Cog):
             await ctx.send(embed=discord.Embed(title="❌ Fusion Not Found",
                                                description=f"The ID `{fusion_id}` does not correspond to any known "
                                                            f"fusion.",
-                                               color=discord.Color.red()))
+                                               color=_COLOR_RED))
             return
 
-        profile = self.garden_helper.get_user_profile_view(target_user.id)
-        plot_index = plot_number - 1
-
-        if not (0 <= plot_index < 12):
-            await ctx.send(
-                embed=discord.Embed(title="❌ Invalid Plot", description="Plot number must be between 1 and 12.",
-                                    color=discord.Color.red()))
-            return
-
-        if not self.garden_helper.is_slot_unlocked(profile, plot_number):
-            await ctx.send(embed=discord.Embed(title="❌ Plot Locked",
-                                               description=f"Plot {plot_number} is locked for user "
-                                                           f"{target_user.mention}.",
-                                               color=discord.Color.red()))
+        if not await self._validate_debug_plot(ctx, target_user, plot_number):
             return
 
-        if profile.garden[plot_index] is not None:
-            await ctx.send(embed=discord.Embed(title="❌ Plot Occupied",
-                                               description=f"Plot {plot_number} for user {target_user.mention} is "
-                                                           f"already occupied.",
-                                               color=discord.Color.red()))
-            return
+        plot_index = plot_number - 1
 
         new_plant = PlantedPlant(
             id=fusion_definition.id,
@@ -2722,7 +2784,7 @@ class ARG(commands.Cog):
             title="⚙️ Debug: Fusion Plant Added",
             description=f"Successfully added **{new_plant.name}** to plot {plot_number} for "
                         f"{target_user.mention}.",
-            color=discord.Color.green()
+            color=_COLOR_GREEN
         )
         embed.set_footer(text="Penny - Administrative Override Systems")
         await ctx.send(embed=embed)
@@ -2732,56 +2794,30 @@ class ARG(commands.Cog):
                                     custom_plant_dict_str: str):
         """Adds a custom plant object (from dict) to a user's garden."""
 
+        if not await self._validate_debug_plot(ctx, target_user, plot_number):
+            return
+
+        plot_index = plot_number - 1
+
         try:
             custom_plant_obj = json.loads(custom_plant_dict_str)
             if not isinstance(custom_plant_obj, dict):
                 raise ValueError("Input must be a valid JSON dictionary.")
 
-            if not all(k in custom_plant_obj for k in ["id", "name", "type"]):
-                await ctx.send(embed=discord.Embed(title="❌ Invalid Dictionary",
-                                                   description="The provided dictionary string is missing one or more "
-                                                               "required keys (`id`, `name`, `type`).",
-                                                   color=discord.Color.red()))
+            if not _REQUIRED_PLANT_KEYS.issubset(custom_plant_obj):
+                await ctx.send(embed=_ERR_CUSTOM_PLANT_MISSING_KEYS)
                 return
         except json.JSONDecodeError:
-            await ctx.send(embed=discord.Embed(title="❌ JSON Error",
-                                               description="Failed to parse the provided string as a valid JSON "
-                                                           "dictionary.",
-                                               color=discord.Color.red()))
+            await ctx.send(embed=_ERR_CUSTOM_PLANT_JSON)
             return
         except ValueError as e:
-            await ctx.send(embed=discord.Embed(title="❌ Value Error", description=str(e), color=discord.Color.red()))
-            return
-
-        profile = self.garden_helper.get_user_profile_view(target_user.id)
-        plot_index = plot_number - 1
-
-        if not (0 <= plot_index < 12):
-            await ctx.send(
-                embed=discord.Embed(title="❌ Invalid Plot", description="Plot number must be between 1 and 12.",
-                                    color=discord.Color.red()))
-            return
-
-        if not self.garden_helper.is_slot_unlocked(profile, plot_number):
-            await ctx.send(embed=discord.Embed(title="❌ Plot Locked",
-                                               description=f"Plot {plot_number} is locked for user "
-                                                           f"{target_user.mention}.",
-                                               color=discord.Color.red()))
-            return
-
-        if profile.garden[plot_index] is not None:
-            await ctx.send(embed=discord.Embed(title="❌ Plot Occupied",
-                                               description=f"Plot {plot_number} for user {target_user.mention} is "
-                                                           f"already occupied.",
-                                               color=discord.Color.red()))
+            await ctx.send(embed=discord.Embed(title="❌ Value Error", description=str(e), color=_COLOR_RED))
             return
 
         try:
             custom_plant_to_add = PlantedPlant(**custom_plant_obj)
         except TypeError:
-            await ctx.send(embed=discord.Embed(title="❌ Dictionary Mismatch",
-                                               description="The keys in the provided dictionary do not match the required fields for a plant.",
-                                               color=discord.Color.red()))
+            await ctx.send(embed=_ERR_CUSTOM_PLANT_MISMATCH)
             return
 
         self.garden_helper.set_garden_plot(target_user.id, plot_index, custom_plant_to_add)
@@ -2790,7 +2826,7 @@ class ARG(commands.Cog):
             title="⚙️ Debug: Custom Plant Added",
             description=f"Successfully added custom plant **{custom_plant_to_add.name}** to plot {plot_number} "
                         f"for {target_user.mention}.",
-            color=discord.Color.green()
+            color=_COLOR_GREEN
         )
         embed.add_field(name="Data Added", value=f"```json\n{json.dumps(custom_plant_obj, indent=2)}\n```")
         embed.set_footer(text="Penny - Administrative Override Systems")
@@ -2800,31 +2836,29 @@ class ARG(commands.Cog):
     async def debug_speed_command(self, ctx: commands.Context, minutes: Optional[int] = None):
         """Sets or displays the global plant growth duration in minutes."""
 
-        current_duration = self.game_state_helper.get_global_state("plant_growth_duration_minutes")
+        current_duration = self.game_state_helper.get_growth_duration_minutes()
 
         if minutes is None:
             embed = discord.Embed(
                 title="⚙️ Debug: Plant Growth Speed Setting",
                 description=f"The current global plant growth duration is set to **{current_duration} minutes**.",
-                color=discord.Color.blue()
+                color=_COLOR_BLUE
             )
             embed.set_footer(text=f"Use {ctx.prefix}debug speed <minutes> to change it")
             await ctx.send(embed=embed)
             return
 
         if minutes <= 0:
-            await ctx.send(
-                embed=discord.Embed(title="❌ Invalid Input", description="Growth duration must be a positive integer.",
-                                    color=discord.Color.red()))
+            await ctx.send(embed=_ERR_NON_POSITIVE_GROWTH_DURATION)
             return
 
-        self.game_state_helper.set_global_state("plant_growth_duration_minutes", minutes)
+        self.game_state_helper.set_growth_duration_minutes(minutes)
 
         embed = discord.Embed(
             title="✅ Debug: Plant Growth Speed Updated",
             description=f"Global plant growth duration has been updated from {current_duration} minutes to "
                         f"**{minutes} minutes**.",
-            color=discord.Color.green()
+            color=_COLOR_GREEN
         )
         embed.set_footer(text="Penny - Administrative Growth Cycle Configuration")
         await ctx.send(embed=embed)
@@ -2837,14 +2871,12 @@ class ARG(commands.Cog):
         if not item_details or item_details.category != "limited":
             embed = discord.Embed(title="❌ Invalid Item",
                                   description=f"'{item_id}' is not a valid, limited-stock item in rux_shop.json.",
-                                  color=discord.Color.red())
+                                  color=_COLOR_RED)
             await ctx.send(embed=embed)
             return
 
         if amount <= 0:
-            await ctx.send(
-                embed=discord.Embed(title="❌ Invalid Input", description="Amount must be a positive integer.",
-                                    color=discord.Color.red()))
+            await ctx.send(embed=_ERR_NON_POSITIVE_STOCK_AMOUNT)
             return
 
         current_stock = self.game_state_helper.get_rux_stock(item_id)
@@ -2854,7 +2886,7 @@ class ARG(commands.Cog):
         embed = discord.Embed(
             title="⚙️ Debug: Stock Replenishment Protocol",
             description=f"Successfully replenished stock for **{item_details.name}** (`{item_id}`).",
-            color=discord.Color.green()
+            color=_COLOR_GREEN
         )
         embed.add_field(name="Amount Added", value=f"+{amount}", inline=True)
         embed.add_field(name="Previous Stock", value=f"{current_stock}", inline=True)
@@ -2868,7 +2900,7 @@ class ARG(commands.Cog):
 
         await ctx.send(embed=discord.Embed(title="⚙️ Debug: Penny's Shop Refresh",
                                            description="Forcing an immediate refresh of Penny's Treasures stock...",
-                                           color=discord.Color.orange()))
+                                           color=_COLOR_ORANGE))
 
         await self.shop_helper.refresh_penny_shop_if_needed(self.logger, force=True)
 
@@ -2876,42 +2908,36 @@ class ARG(commands.Cog):
         await ctx.send(embed=discord.Embed(title="✅ Debug: Penny's Shop Refreshed",
                                            description="Penny's Treasures stock has been successfully refreshed with "
                                                        "new items.",
-                                           color=discord.Color.green()))
+                                           color=_COLOR_GREEN))
 
     @cmd_debug_group.command(name="pennyshoprefresh")
     async def debug_pennyshoprefresh_command(self, ctx: commands.Context, interval_hours: Optional[int] = None):
         """Sets or displays the Penny's Shop refresh interval in hours."""
 
-        current_interval = self.game_state_helper.get_global_state("treasure_shop_refresh_interval_hours", 1)
+        current_interval = self.game_state_helper.get_penny_refresh_interval_hours()
 
         if interval_hours is None:
             embed = discord.Embed(
                 title="⚙️ Debug: Penny's Shop Refresh Interval",
                 description=f"The current refresh interval for Penny's Treasures is **{current_interval} hours**.\n"
                             f"Valid intervals are positive numbers that divide 24 evenly (1, 2, 3, 4, 6, 8, 12, 24).",
-                color=discord.Color.blue()
+                color=_COLOR_BLUE
             )
             embed.set_footer(text=f"Use {ctx.prefix}debug pennyshoprefresh <hours> to change it")
             await ctx.send(embed=embed)
             return
 
         if interval_hours <= 0 or 24 % interval_hours != 0:
-            embed = discord.Embed(
-                title="❌ Invalid Interval",
-                description="The interval must be a positive number of hours that divides 24 evenly (e.g., 1, 2, 3, 4, "
-                            "6, 8, 12, 24).",
-                color=discord.Color.red()
-            )
-            await ctx.send(embed=embed)
+            await ctx.send(embed=_ERR_INVALID_PENNY_INTERVAL)
             return
 
-        self.game_state_helper.set_global_state("treasure_shop_refresh_interval_hours", interval_hours)
+        self.game_state_helper.set_penny_refresh_interval_hours(interval_hours)
 
         embed = discord.Embed(
             title="✅ Debug: Penny's Shop Interval Updated",
             description=f"The refresh interval for Penny's Treasures has been changed from {current_interval} hours "
                         f"to **{interval_hours} hours**.",
-            color=discord.Color.green()
+            color=_COLOR_GREEN
         )
         await ctx.send(embed=embed)
 
@@ -2922,43 +2948,49 @@ class ARG(commands.Cog):
         await ctx.send(embed=discord.Embed(title="⚙️ Debug: Dave's Shop Refresh",
                                            description="Forcing an immediate refresh of Crazy Dave's Twiddydinkies "
                                                        "stock...",
-                                           color=discord.Color.orange()))
+                                           color=_COLOR_ORANGE))
 
         await self.shop_helper.refresh_dave_shop_if_needed(self.logger, force=True)
 
         await self.logger.log_to_discord(f"Debug: Dave's Shop manually refreshed by {ctx.author.name}.", "INFO")
         await ctx.send(embed=discord.Embed(title="✅ Debug: Dave's Shop Refreshed",
                                            description="Crazy Dave's stock has been successfully refreshed.",
-                                           color=discord.Color.green()))
+                                           color=_COLOR_GREEN))
 
     @cmd_debug_group.command(name="unlockbg")
     async def debug_unlockbg_command(self, ctx: commands.Context, target_user: discord.Member, *, background_name: str):
         """Unlocks a specific garden background for a user."""
 
-        target_bg_def = None
-        for bg_def in self.background_helper.all_backgrounds:
-            if bg_def.name.lower() == background_name.lower():
-                target_bg_def = bg_def
-                break
+        matching_bgs = self.background_helper.resolve_background(background_name)
 
-        if not target_bg_def:
+        if not matching_bgs:
             await ctx.send(embed=discord.Embed(
                 title="❌ Background Not Found",
                 description=f"No background with the name '{background_name}' could be found in the loaded data.",
-                color=discord.Color.red()
+                color=_COLOR_RED
             ))
             return
 
+        if len(matching_bgs) > 1:
+            match_names = "\n".join(f"➢ {bg.name}" for bg in matching_bgs)
+            await ctx.send(embed=discord.Embed(
+                title="❌ Ambiguous Background Name",
+                description=f"'{background_name}' matches several backgrounds. Please be more specific:\n{match_names}",
+                color=_COLOR_RED
+            ))
+            return
+
+        target_bg_def = matching_bgs[0]
+
         profile = self.garden_helper.get_user_profile_view(target_user.id)
-        unlocked_bgs = profile.unlocked_backgrounds
         bg_id_to_unlock = target_bg_def.id
 
-        if bg_id_to_unlock in unlocked_bgs:
+        if bg_id_to_unlock in profile.unlocked_backgrounds_set:
             await ctx.send(embed=discord.Embed(
                 title="⚙️ Debug: Background Already Unlocked",
                 description=f"User {target_user.mention} already has the **{target_bg_def.name}** background "
                             f"unlocked.",
-                color=discord.Color.blue()
+                color=_COLOR_BLUE
             ))
             return
 
@@ -2967,7 +2999,7 @@ class ARG(commands.Cog):
         embed = discord.Embed(
             title="✅ Debug: Background Unlocked",
             description=f"Successfully unlocked the **{target_bg_def.name}** background for {target_user.mention}.",
-            color=discord.Color.green()
+            color=_COLOR_GREEN
         )
         embed.set_footer(text="Penny - Administrative Override Systems")
         await ctx.send(embed=embed)
@@ -2985,7 +3017,7 @@ class ARG(commands.Cog):
             embed = discord.Embed(
                 title="⚙️ Debug: Game State Dump",
                 description="The current in-memory game state has been successfully serialized.",
-                color=discord.Color.green()
+                color=_COLOR_GREEN
             )
             embed.set_footer(text="Penny - Administrative Data Systems")
             await ctx.send(embed=embed, file=file)
@@ -2994,7 +3026,7 @@ class ARG(commands.Cog):
             embed = discord.Embed(
                 title="❌ Error During Data Dump",
                 description=f"An unexpected error occurred during data serialization:\n`{e}`",
-                color=discord.Color.red()
+                color=_COLOR_RED
             )
             embed.set_footer(text="Penny - Administrative Data Systems")
             await ctx.send(embed=embed)
@@ -3007,7 +3039,7 @@ class ARG(commands.Cog):
             embed = discord.Embed(
                 title="❌ Missing Attachment",
                 description="Please attach the `data.json` file when running this command.",
-                color=discord.Color.red()
+                color=_COLOR_RED
             )
             await ctx.send(embed=embed)
             return
@@ -3017,7 +3049,7 @@ class ARG(commands.Cog):
             embed = discord.Embed(
                 title="❌ Invalid File Type",
                 description="The attached file must be a `.json` file.",
-                color=discord.Color.red()
+                color=_COLOR_RED
             )
             await ctx.send(embed=embed)
             return
@@ -3026,7 +3058,7 @@ class ARG(commands.Cog):
             status_embed = discord.Embed(
                 title="⚙️ System Operation in Progress",
                 description="Halting the main game loop to ensure data integrity...",
-                color=discord.Color.orange()
+                color=_COLOR_ORANGE
             )
             await ctx.send(embed=status_embed)
             self.growth_task.cancel()
@@ -3043,7 +3075,7 @@ class ARG(commands.Cog):
             success_embed = discord.Embed(
                 title="✅ Data Overwritten Successfully",
                 description="The new game state has been validated and saved to disk.",
-                color=discord.Color.green()
+                color=_COLOR_GREEN
             )
             await ctx.send(embed=success_embed)
 
@@ -3054,7 +3086,7 @@ class ARG(commands.Cog):
                     "An error occurred during the data loading process. No changes have been committed to memory.\n"
                     "However, the game loop has been **paused** as a safety precaution."
                 ),
-                color=discord.Color.red()
+                color=_COLOR_RED
             )
             failure_embed.add_field(name="Error Details", value=f"```{type(e).__name__}: {e}```")
             await ctx.send(embed=failure_embed)
@@ -3063,7 +3095,7 @@ class ARG(commands.Cog):
             reload_notice_embed = discord.Embed(
                 title="🔴 Manual Action Required",
                 description="The data operation has concluded, and the game loop is now stopped. To resume normal functionality, the cog **must be reloaded**.",
-                color=discord.Color.orange()
+                color=_COLOR_ORANGE
             )
             reload_notice_embed.add_field(
                 name="Required Command",
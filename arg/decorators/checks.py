@@ -10,17 +10,18 @@ def is_not_locked():
     If a lock is found but has existed for more than 60 seconds, it is automatically cleared.
     """
     async def predicate(ctx: commands.Context):
-        if not hasattr(ctx.cog, 'lock_helper'):
+        lock_helper = getattr(ctx.cog, 'lock_helper', None)
+        if lock_helper is None:
             return True
 
         user_id = ctx.author.id
-        lock = ctx.cog.lock_helper.get_user_lock(user_id)
+        lock = lock_helper.get_user_lock(user_id)
 
         if lock:
             lock_age = time.time() - lock.get("timestamp", 0)
 
             if lock_age >= 60.0:
-                ctx.cog.lock_helper.remove_lock_for_user(user_id)
+                lock_helper.remove_lock_for_user(user_id)
                 expired_embed = discord.Embed(
                     title="⏰ Previous Action Expired",
                     description=f"Your previous pending action timed out and was automatically cleared. "
@@ -1,4 +1,7 @@
-from typing import Dict, List, Optional
+from bisect import bisect_left
+from collections import defaultdict
+from itertools import islice
+from typing import AbstractSet, Dict, Iterable, List, Optional
 
 from ..models import Background
 
@@ -9,26 +12,87 @@ class BackgroundHelper:
     def __init__(self, backgrounds_list: List[Background]):
         self.all_backgrounds: List[Background] = backgrounds_list
         self.backgrounds_by_id: Dict[str, Background] = {bg.id: bg for bg in backgrounds_list}
+        self._catalog_position: Dict[str, int] = {bg.id: i for i, bg in enumerate(backgrounds_list)}
+        self.backgrounds_by_lower_name: Dict[str, Background] = {}
+
+        self.backgrounds_by_required_fusion: Dict[str, List[Background]] = defaultdict(list)
+
+        for bg in backgrounds_list:
+            self.backgrounds_by_lower_name.setdefault(bg.name.lower(), bg)
+            for fusion_id in bg.required_fusions_set:
+                self.backgrounds_by_required_fusion[fusion_id].append(bg)
+
+        self._sorted_lower_names: List[str] = sorted(self.backgrounds_by_lower_name)
 
     def get_background_by_id(self, bg_id: str) -> Optional[Background]:
         return self.backgrounds_by_id.get(bg_id)
 
-    def check_for_unlocks(self, user_fusions: List[str], user_unlocked_bgs: List[str]) -> List[Background]:
+    def get_background_by_name(self, name: str) -> Optional[Background]:
+        """Looks up a background by its display name, case-insensitively."""
+        return self.backgrounds_by_lower_name.get(name.lower())
+
+    def resolve_background(self, query: str) -> List[Background]:
+        """
+        Resolves a user-typed background name. An exact case-insensitive match wins,
+        otherwise every background whose name starts with the query is returned.
+        """
+
+        query_lower = query.lower()
+        exact_match = self.backgrounds_by_lower_name.get(query_lower)
+        if exact_match:
+            return [exact_match]
+
+        matches: List[Background] = []
+        start = bisect_left(self._sorted_lower_names, query_lower)
+        for lower_name in islice(self._sorted_lower_names, start, None):
+            if not lower_name.startswith(query_lower):
+                break
+            matches.append(self.backgrounds_by_lower_name[lower_name])
+        return matches
+
+    def get_backgrounds_in_catalog_order(self, bg_ids: Iterable[str]) -> List[Background]:
+        """Resolves background IDs to definitions, skipping unknown IDs and keeping the catalog's display order."""
+        known_ids = sorted((bg_id for bg_id in bg_ids if bg_id in self._catalog_position),
+                           key=self._catalog_position.__getitem__)
+        return [self.backgrounds_by_id[bg_id] for bg_id in known_ids]
+
+    def check_for_unlocks(self, user_fusions: AbstractSet[str], user_unlocked_bgs: AbstractSet[str]) -> List[Background]:
         """
         Checks all defined backgrounds against a user's discovered fusions
         and returns a list of newly unlocked Background objects.
+        Both arguments are sets, e.g. the ones cached on UserProfileView.
         """
 
         newly_unlocked: List[Background] = []
-        user_fusions_set = set(user_fusions)
-        user_unlocked_bgs_set = set(user_unlocked_bgs)
 
         for bg_def in self.all_backgrounds:
-            if bg_def.id in user_unlocked_bgs_set:
+            if bg_def.id in user_unlocked_bgs:
+                continue
+
+            required_set = bg_def.required_fusions_set
+            if not required_set or len(required_set) > len(user_fusions):
+                continue
+
+            if required_set.issubset(user_fusions):
+                newly_unlocked.append(bg_def)
+
+        return newly_unlocked
+
+    def check_for_unlocks_incremental(self, new_fusion_id: str, user_fusions: AbstractSet[str],
+                                      user_unlocked_bgs: AbstractSet[str]) -> List[Background]:
+        """
+        Like check_for_unlocks, but only considers backgrounds that require the newly discovered fusion.
+        user_fusions must already include new_fusion_id.
+        """
+
+        newly_unlocked: List[Background] = []
+
+        for bg_def in self.backgrounds_by_required_fusion.get(new_fusion_id, ()):
+            if bg_def.id in user_unlocked_bgs:
                 continue
 
-            required_set = set(bg_def.required_fusions)
-            if required_set and required_set.issubset(user_fusions_set):
+            required_set = bg_def.required_fusions_set
+            if len(required_set) <= len(user_fusions) and required_set.issubset(user_fusions):
                 newly_unlocked.append(bg_def)
 
-        return newly_unlocked
\ No newline at end of file
+        return newly_unlocked
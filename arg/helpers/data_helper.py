@@ -1,6 +1,12 @@
+import asyncio
+import dataclasses
 import json
+import operator
+import os
 import pathlib
-from typing import Any, Dict, List
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, TypeVar
 
 from ..models import (
     BasePlant,
@@ -11,6 +17,82 @@ from ..models import (
 )
 from .logging_helper import LoggingHelper
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+_MAX_LOAD_WORKERS = 8
+# Unpickling skips __post_init__, so the field layout of every cached model is part of the cache key.
+_PARSE_CACHE_MODEL_SHAPE = tuple(
+    (cls.__qualname__, tuple(f.name for f in dataclasses.fields(cls))) for cls in (BasePlant, FusionRecipe, Background)
+)
+
+T = TypeVar("T")
+
+
+def _make_positional_builder(cls: Type[T]) -> Callable[[Dict[str, Any]], T]:
+    """
+    Returns a function that builds cls from a dict by passing its init fields positionally, which is cheaper
+    than cls(**data) in the catalog load loops. Keys that are not fields are logged as a warning and ignored.
+    Factory defaults are evaluated once, so they must be immutable.
+    """
+
+    required_names: List[str] = []
+    optional_fields: List[Tuple[str, Any]] = []
+    for f in dataclasses.fields(cls):
+        if not f.init:
+            continue
+        if f.default is not dataclasses.MISSING:
+            optional_fields.append((f.name, f.default))
+        elif f.default_factory is not dataclasses.MISSING:
+            optional_fields.append((f.name, f.default_factory()))
+        else:
+            required_names.append(f.name)
+
+    if len(required_names) > 1:
+        get_required = operator.itemgetter(*required_names)
+    else:
+        def get_required(data: Dict[str, Any]) -> Tuple[Any, ...]:
+            return tuple(data[name] for name in required_names)
+
+    field_names = frozenset(required_names).union(name for name, _ in optional_fields)
+
+    def build(data: Dict[str, Any], logger: LoggingHelper, log_prefix: str) -> T:
+        unexpected_keys = data.keys() - field_names
+        if unexpected_keys:
+            logger.init_log(f"{log_prefix}Ignoring unexpected keys {sorted(unexpected_keys)} in entry "
+                            f"'{data.get('id')}'.", "WARNING")
+        return cls(*get_required(data), *[data.get(name, default) for name, default in optional_fields])
+
+    return build
+
+
+def _loads_json_bytes(raw: bytes) -> Any:
+    """Parses UTF-8 JSON bytes, using orjson when it is installed."""
+
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _parse_json_file(file_path: pathlib.Path) -> Tuple[Any, Optional[Exception]]:
+    """Reads and parses one JSON file. Errors are returned rather than raised so they can be logged by the caller."""
+
+    try:
+        return _loads_json_bytes(file_path.read_bytes()), None
+    except Exception as e:
+        return None, e
+
+
+_build_base_plant = _make_positional_builder(BasePlant)
+_build_fusion_recipe = _make_positional_builder(FusionRecipe)
+_build_background = _make_positional_builder(Background)
+_build_shop_item = _make_positional_builder(ShopItemDefinition)
+
 
 class DataHelper:
     """
@@ -19,8 +101,10 @@ class DataHelper:
     It operates in a read-only manner on the data path.
     """
 
-    def __init__(self, data_path_obj: pathlib.Path, logger: LoggingHelper):
+    def __init__(self, data_path_obj: pathlib.Path, logger: LoggingHelper,
+                 cache_path_obj: Optional[pathlib.Path] = None):
         self.data_path = data_path_obj
+        self.cache_path = cache_path_obj
         self.logger = logger
 
         self.rux_shop_data: Dict[str, ShopItemDefinition] = {}
@@ -28,81 +112,165 @@ class DataHelper:
         self.dave_shop_data: Dict[str, ShopItemDefinition] = {}
         self.fusion_plants: List[FusionRecipe] = []
         self.materials_data: Dict[str, str] = {}
+        self.materials_id_lower_map: Dict[str, str] = {}
+        self.material_lookup_map: Dict[str, str] = {}
         self.base_plants: List[BasePlant] = []
         self.sales_prices: Dict[str, int] = {}
         self.seedlings_data: List[SeedlingDefinition] = []
         self.backgrounds_data: List[Background] = []
 
-    def load_all_data(self):
-        """Master method to load all data files and populate helper classes."""
+        self._directory_entries: Dict[pathlib.Path, Optional[Dict[str, os.DirEntry]]] = {}
+        self._source_errors = 0
+
+    async def load_all_data(self):
+        """Master method to load all data files and populate helper classes. Runs in a worker thread."""
+        await asyncio.to_thread(self._load_all_data_sync)
 
+    def _load_all_data_sync(self):
         self.logger.init_log("Data loading process initiated.", "INFO")
+        self._directory_entries.clear()
 
-        self.base_plants = self._load_base_plants_data()
+        self.base_plants = self._load_cached_or_parse(
+            "base_plants", self._list_json_files("base_plants"), self._load_base_plants_data)
         self.seedlings_data = self._load_seedlings_data()
-        self.fusion_plants = self._load_fusion_data()
-        self.backgrounds_data = self._load_backgrounds_data()
+        self.fusion_plants = self._load_cached_or_parse(
+            "fusions", self._list_json_files("fusions"), self._load_fusion_data)
+        self.backgrounds_data = self._load_cached_or_parse(
+            "backgrounds", [self.data_path / "backgrounds.json"], self._load_backgrounds_data)
         self.rux_shop_data = self._load_rux_shop_data()
         self.penny_shop_data = self._load_penny_shop_data()
         self.dave_shop_data = self._load_dave_shop_data()
         self.materials_data = self._load_materials_data()
+        self.materials_id_lower_map = {mat_id.lower(): mat_id for mat_id in self.materials_data}
+        if len(self.materials_id_lower_map) != len(self.materials_data) or any(
+                mat_id_lower != mat_id for mat_id_lower, mat_id in self.materials_id_lower_map.items()):
+            self.logger.init_log("Data Load (materials.json): Material IDs should be unique and lowercase.", "WARNING")
+        self.material_lookup_map = {name.lower(): mat_id for mat_id, name in self.materials_data.items()}
+        self.material_lookup_map.update(self.materials_id_lower_map)
         self.sales_prices = self._load_sales_prices_data()
 
+        self._directory_entries.clear()
         self.logger.init_log("All data files loaded and processed.", "INFO")
 
+    def _scan_directory(self, directory_path: pathlib.Path) -> Optional[Dict[str, os.DirEntry]]:
+        """Lists a directory once per load so repeated lookups avoid extra stat calls. None if it is missing."""
+
+        if directory_path not in self._directory_entries:
+            try:
+                with os.scandir(directory_path) as it:
+                    self._directory_entries[directory_path] = {entry.name: entry for entry in it}
+            except (FileNotFoundError, NotADirectoryError):
+                self._directory_entries[directory_path] = None
+        return self._directory_entries[directory_path]
+
+    def _scan_json_files(self, dir_name: str) -> Optional[List[pathlib.Path]]:
+        entries = self._scan_directory(self.data_path / dir_name)
+        if entries is None:
+            return None
+        return [pathlib.Path(entry.path) for entry in entries.values()
+                if entry.name.endswith(".json") and entry.is_file()]
+
+    def _list_json_files(self, dir_name: str) -> List[pathlib.Path]:
+        return sorted(self._scan_json_files(dir_name) or [])
+
+    def _load_cached_or_parse(self, cache_name: str, source_paths: List[pathlib.Path], parser_fn: Callable[[], T]) -> T:
+        """
+        Returns the result of parser_fn, reusing a pickled copy from the cache directory when none of the
+        source files have changed since it was written. Any cache problem falls back to parsing.
+        Results from a parse that hit file errors are never cached, so those errors are reported on every load.
+        """
+
+        if self.cache_path is None:
+            return parser_fn()
+
+        try:
+            cache_key = (_PARSE_CACHE_MODEL_SHAPE, tuple(
+                (path.name, stat.st_mtime_ns, stat.st_size) for path in source_paths for stat in (path.stat(),)
+            ))
+        except OSError:
+            return parser_fn()
+
+        log_prefix = f"Data Load ({cache_name} cache): "
+        cache_file = self.cache_path / f"{cache_name}.pkl"
+        try:
+            cached_key, cached_data = pickle.loads(cache_file.read_bytes())
+            if cached_key == cache_key:
+                self.logger.init_log(f"{log_prefix}Reused {len(cached_data)} parsed entries.", "INFO")
+                return cached_data
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            self.logger.init_log(f"{log_prefix}Failed to read: {e}. Reparsing.", "WARNING")
+
+        errors_before = self._source_errors
+        data = parser_fn()
+        try:
+            if self._source_errors != errors_before:
+                cache_file.unlink(missing_ok=True)
+                return data
+            self.cache_path.mkdir(parents=True, exist_ok=True)
+            cache_file.write_bytes(pickle.dumps((cache_key, data), protocol=pickle.HIGHEST_PROTOCOL))
+        except Exception as e:
+            self.logger.init_log(f"{log_prefix}Failed to write: {e}.", "WARNING")
+        return data
+
     def _load_json_file(self, filename: str, default_data: Any) -> Any:
         """Generic JSON file loader with validation and logging. Does not write to disk."""
 
         file_path = self.data_path / filename
         log_prefix = f"Data Load ({filename}): "
+        entries = self._scan_directory(file_path.parent)
         try:
-            if file_path.exists():
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-
-                if data:
-                    self.logger.init_log(f"{log_prefix}Successfully loaded {len(data)} entries.", "INFO")
-                    return data
-                else:
-                    self.logger.init_log(f"{log_prefix}File is empty. Using default fallback data.", "WARNING")
-                    return default_data
-            else:
-                self.logger.init_log(
-                    f"{log_prefix}File not found. This is a critical error if not intended. "
-                    "Using default fallback data.", "ERROR"
-                )
-                return default_data
+            if not entries or file_path.name not in entries:
+                raise FileNotFoundError(file_path)
+            data = _loads_json_bytes(file_path.read_bytes())
+        except FileNotFoundError:
+            self._source_errors += 1
+            self.logger.init_log(
+                f"{log_prefix}File not found. This is a critical error if not intended. "
+                "Using default fallback data.", "ERROR"
+            )
+            return default_data
         except (json.JSONDecodeError, Exception) as e:
+            self._source_errors += 1
             self.logger.init_log(f"{log_prefix}Failed to load or parse: {e}. Using default fallback data.", "ERROR")
             return default_data
 
+        if data:
+            self.logger.init_log(f"{log_prefix}Successfully loaded {len(data)} entries.", "INFO")
+            return data
+        else:
+            self.logger.init_log(f"{log_prefix}File is empty. Using default fallback data.", "WARNING")
+            return default_data
+
     def _load_and_compile_json_from_directory(self, dir_name: str) -> List[Dict[str, Any]]:
         """Loads all JSON files from a subdirectory and compiles them into a single list."""
 
         compiled_data = []
-        directory_path = self.data_path / dir_name
         log_prefix = f"Data Load ({dir_name}/): "
 
-        if not directory_path.is_dir():
+        json_files = self._scan_json_files(dir_name)
+        if json_files is None:
             self.logger.init_log(f"{log_prefix}Directory not found. Skipping load for this category.", "WARNING")
             return []
 
-        json_files = list(directory_path.glob("*.json"))
         if not json_files:
             self.logger.init_log(f"{log_prefix}No JSON files found in the directory.", "WARNING")
             return []
 
-        for file_path in json_files:
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                if isinstance(data, list):
-                    compiled_data.extend(data)
-                else:
-                    self.logger.init_log(f"{log_prefix}File '{file_path.name}' does not contain a JSON list. Skipping.",
-                                         "WARNING")
-            except (json.JSONDecodeError, Exception) as e:
-                self.logger.init_log(f"{log_prefix}Failed to load or parse '{file_path.name}': {e}.", "ERROR")
+        with ThreadPoolExecutor(max_workers=min(len(json_files), _MAX_LOAD_WORKERS)) as executor:
+            results = list(executor.map(_parse_json_file, json_files))
+
+        for file_path, (data, error) in zip(json_files, results):
+            if error is not None:
+                self._source_errors += 1
+                self.logger.init_log(f"{log_prefix}Failed to load or parse '{file_path.name}': {error}.", "ERROR")
+            elif isinstance(data, list):
+                compiled_data.extend(data)
+            else:
+                self._source_errors += 1
+                self.logger.init_log(f"{log_prefix}File '{file_path.name}' does not contain a JSON list. Skipping.",
+                                     "WARNING")
 
         self.logger.init_log(
             f"{log_prefix}Successfully loaded and compiled {len(compiled_data)} entries from {len(json_files)} file(s).",
@@ -120,7 +288,7 @@ class DataHelper:
         for plant_dict in data:
             if 'name' not in plant_dict:
                 plant_dict['name'] = plant_dict['id']
-            plants.append(BasePlant(**plant_dict))
+            plants.append(_build_base_plant(plant_dict, self.logger, "Data Load (base_plants/): "))
         return plants
 
     def _load_seedlings_data(self) -> List[SeedlingDefinition]:
@@ -139,7 +307,7 @@ class DataHelper:
             if 'name' not in f_dict:
                 f_dict['name'] = f_dict['id']
             f_dict['recipe'] = tuple(f_dict.get('recipe', []))
-            fusions.append(FusionRecipe(**f_dict))
+            fusions.append(_build_fusion_recipe(f_dict, self.logger, "Data Load (fusions/): "))
         return fusions
 
     def _load_backgrounds_data(self) -> List[Background]:
@@ -149,20 +317,26 @@ class DataHelper:
         backgrounds = []
         for bg_dict in data:
             bg_dict['required_fusions'] = tuple(bg_dict.get('required_fusions', []))
-            backgrounds.append(Background(**bg_dict))
+            backgrounds.append(_build_background(bg_dict, self.logger, "Data Load (backgrounds.json): "))
         return backgrounds
 
+    def _load_shop_data(self, filename: str) -> Dict[str, ShopItemDefinition]:
+        data = self._load_json_file(filename, {})
+
+        items = {}
+        for item_id, details in data.items():
+            details['id'] = item_id
+            items[item_id] = _build_shop_item(details, self.logger, f"Data Load ({filename}): ")
+        return items
+
     def _load_rux_shop_data(self) -> Dict[str, ShopItemDefinition]:
-        data = self._load_json_file("shop/rux.json", {})
-        return {item_id: ShopItemDefinition(id=item_id, **details) for item_id, details in data.items()}
+        return self._load_shop_data("shop/rux.json")
 
     def _load_penny_shop_data(self) -> Dict[str, ShopItemDefinition]:
-        data = self._load_json_file("shop/penny.json", {})
-        return {item_id: ShopItemDefinition(id=item_id, **details) for item_id, details in data.items()}
+        return self._load_shop_data("shop/penny.json")
 
     def _load_dave_shop_data(self) -> Dict[str, ShopItemDefinition]:
-        data = self._load_json_file("shop/dave.json", {})
-        return {item_id: ShopItemDefinition(id=item_id, **details) for item_id, details in data.items()}
+        return self._load_shop_data("shop/dave.json")
 
     def _load_materials_data(self) -> Dict[str, str]:
         return self._load_json_file("materials.json", {})
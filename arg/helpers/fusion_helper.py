@@ -1,12 +1,13 @@
-import dataclasses
 import re
 from collections import Counter
 from typing import Any, Dict, List, Optional, Tuple
 
-from ..models import PlantedSeedling, UserProfileView
+from ..models import PlantedPlant, UserProfileView
 from ..models import FusionRecipe
 from .plant_helper import PlantHelper
 
+_FILTER_SPLIT_RE = re.compile(r'\s+(?=\w+:)')
+
 
 class FusionHelper:
     """Encapsulates all logic related to plant and item fusion using dataclasses for definitions."""
@@ -15,34 +16,64 @@ class FusionHelper:
         self.all_fusions: List[FusionRecipe] = fusions_list
         self.all_materials: Dict[str, str] = materials_data
         self.all_materials_by_name: set[str] = set(materials_data.values())
+        self._material_ids_by_lower_name: Dict[str, str] = {v.lower(): k for k, v in materials_data.items()}
         self.plant_helper: PlantHelper = plant_helper
+        self._base_plant_names: set[str] = {p.name for p in plant_helper.base_plants}
 
         self.all_fusions_by_id: Dict[str, FusionRecipe] = {f.id: f for f in fusions_list}
         self.all_fusions_by_name: Dict[str, FusionRecipe] = {f.name: f for f in fusions_list}
-
-        self.visible_fusions: List[FusionRecipe] = []
+        self.recipe_counters_by_id: Dict[str, Counter] = {f.id: Counter(f.recipe) for f in fusions_list}
+
+        # Columns aligned with all_fusions, looked up by almanac filters for catalog entries.
+        self._fusion_index_by_id: Dict[str, int] = {f.id: i for i, f in enumerate(fusions_list)}
+        self._fusion_names_lower: List[str] = [f.name.lower() for f in fusions_list]
+        self._fusion_types_lower: List[str] = [f.type.lower() for f in fusions_list]
+        self._fusion_indices_by_type_lower: Dict[str, set[int]] = {}
+        for i, type_lower in enumerate(self._fusion_types_lower):
+            self._fusion_indices_by_type_lower.setdefault(type_lower, set()).add(i)
+        self._fusion_indices_by_component: Dict[str, set[int]] = {}
+        for i, f in enumerate(fusions_list):
+            for component in f.recipe:
+                self._fusion_indices_by_component.setdefault(component, set()).add(i)
+        self._fusion_recipes_lower: List[Tuple[str, ...]] = [
+            tuple(component.lower() for component in f.recipe) for f in fusions_list
+        ]
+
+        self._fusions_by_sorted_recipe: Dict[Tuple[str, ...], FusionRecipe] = {}
+        for f in fusions_list:
+            if f.recipe:
+                self._fusions_by_sorted_recipe.setdefault(tuple(sorted(f.recipe)), f)
+
+        self._fusions_by_lower_id: Dict[str, FusionRecipe] = {}
+        self._fusions_by_lower_name: Dict[str, FusionRecipe] = {}
+        for f in fusions_list:
+            self._fusions_by_lower_id.setdefault(f.id.lower(), f)
+            self._fusions_by_lower_name.setdefault(f.name.lower(), f)
+
+        self.visible_fusions_by_id: Dict[str, FusionRecipe] = {}
         self.hidden_fusions_by_id: Dict[str, FusionRecipe] = {}
 
         for f in self.all_fusions:
             if f.visibility == "visible":
-                self.visible_fusions.append(f)
+                self.visible_fusions_by_id[f.id] = f
             elif f.visibility == "hidden":
                 self.hidden_fusions_by_id[f.id] = f
 
-    def find_defined_fusion(self, query: str) -> Optional[FusionRecipe]:
-        """Searches for a fusion definition by ID or name (case-insensitive)."""
+        self.visible_fusions: Tuple[FusionRecipe, ...] = tuple(
+            f for f in self.all_fusions if f.visibility == "visible"
+        )
 
-        query_lower = query.lower()
+        self._deconstruct_cache: Dict[Tuple[Any, Any, Any], Tuple[Tuple[str, ...], Counter]] = {}
 
-        for f_def in self.all_fusions:
-            if f_def.id.lower() == query_lower:
-                return f_def
+        self._decomp_size: Dict[str, int] = {
+            f.id: len(self.deconstruct_plant({"id": f.id, "name": f.name, "type": f.type})[0]) for f in fusions_list
+        }
 
-        for f_def in self.all_fusions:
-            if f_def.name.lower() == query_lower:
-                return f_def
+    def find_defined_fusion(self, query: str) -> Optional[FusionRecipe]:
+        """Searches for a fusion definition by ID or name (case-insensitive)."""
 
-        return None
+        query_lower = query.lower()
+        return self._fusions_by_lower_id.get(query_lower) or self._fusions_by_lower_name.get(query_lower)
 
     def format_recipe_string(self, recipe_ids: Tuple[str, ...]) -> str:
         """Formats a tuple of component IDs into a displayable string like '`PlantA` + `PlantB`'."""
@@ -70,16 +101,24 @@ class FusionHelper:
     ) -> Tuple[List[str], List[str]]:
         """
         Recursively deconstructs a plant instance (dictionary) into its base material and plant component names.
+        Error-free results are memoized by the plant's id, name and type; results with errors depend on the
+        recursion path and are always recomputed.
         """
-        if path is None:
-            path = set()
+        key = (plant_data.get("id"), plant_data.get("name"), plant_data.get("type"))
+        if cached := self._deconstruct_cache.get(key):
+            return list(cached[0]), []
 
+        components, errors = self._deconstruct_plant_uncached(plant_data, set() if path is None else path)
+        if not errors:
+            self._deconstruct_cache[key] = (tuple(components), Counter(components))
+        return components, errors
+
+    def _deconstruct_plant_uncached(self, plant_data: Dict[str, Any], path: set) -> Tuple[List[str], List[str]]:
         plant_id = plant_data.get("id")
         plant_name = plant_data.get("name", plant_id)
 
         if plant_id in path:
             return [], [f"Infinite recursion detected involving '{plant_name}'."]
-        path.add(plant_id)
 
         if plant_data.get("type") == "material" or plant_name in self.all_materials_by_name:
             return [plant_name], []
@@ -94,38 +133,62 @@ class FusionHelper:
         final_components: List[str] = []
         errors: List[str] = []
 
-        all_base_plants_by_name = {p.name: p for p in self.plant_helper.base_plants}
-
-        for component_name in fusion_def.recipe:
-            if component_name in all_base_plants_by_name:
-                final_components.append(component_name)
-            elif component_name in self.all_materials_by_name:
-                final_components.append(component_name)
-            elif component_name in self.all_fusions_by_name:
-                next_fusion_def = self.all_fusions_by_name[component_name]
-                sub_components, sub_errors = self.deconstruct_plant(
-                    {"id": next_fusion_def.id, "name": next_fusion_def.name, "type": next_fusion_def.type},
-                    path.copy()
-                )
-                final_components.extend(sub_components)
-                errors.extend(sub_errors)
-            else:
-                errors.append(f"Recipe for '{plant_name}' contains unknown component: '{component_name}'.")
+        # path holds the ids of the fusions currently being expanded; it is shared down the recursion.
+        path.add(plant_id)
+        try:
+            for component_name in fusion_def.recipe:
+                if component_name in self._base_plant_names:
+                    final_components.append(component_name)
+                elif component_name in self.all_materials_by_name:
+                    final_components.append(component_name)
+                elif component_name in self.all_fusions_by_name:
+                    next_fusion_def = self.all_fusions_by_name[component_name]
+                    sub_components, sub_errors = self.deconstruct_plant(
+                        {"id": next_fusion_def.id, "name": next_fusion_def.name, "type": next_fusion_def.type},
+                        path
+                    )
+                    final_components.extend(sub_components)
+                    errors.extend(sub_errors)
+                else:
+                    errors.append(f"Recipe for '{plant_name}' contains unknown component: '{component_name}'.")
+        finally:
+            path.discard(plant_id)
 
         return final_components, errors
 
-    def find_fusion_match(self, components: List[str]) -> Optional[FusionRecipe]:
-        """Given a list of base component names, finds a matching fusion recipe."""
+    def deconstruct_plant_cached(self, plant_data: Dict[str, Any]) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        """Tuple form of deconstruct_plant that avoids copying memoized results."""
 
-        input_recipe_counter = Counter(components)
+        key = (plant_data.get("id"), plant_data.get("name"), plant_data.get("type"))
+        if cached := self._deconstruct_cache.get(key):
+            return cached[0], ()
 
-        for fusion_def in self.all_fusions:
-            recipe_counter = Counter(fusion_def.recipe)
+        components, errors = self.deconstruct_plant(plant_data)
+        return tuple(components), tuple(errors)
 
-            if recipe_counter and recipe_counter == input_recipe_counter:
-                return fusion_def
+    def get_component_counter(self, plant_data: Dict[str, Any]) -> Optional[Counter]:
+        """
+        Shared Counter of an asset's base components, or None if it cannot be deconstructed.
+        The Counter is memoized and must not be mutated.
+        """
+
+        key = (plant_data.get("id"), plant_data.get("name"), plant_data.get("type"))
+        if not (cached := self._deconstruct_cache.get(key)):
+            if self.deconstruct_plant(plant_data)[1]:
+                return None
+            cached = self._deconstruct_cache[key]
+        return cached[1]
+
+    def _get_decomp_size(self, plant_data: Dict[str, Any]) -> int:
+        """Number of base components an asset deconstructs into, used to order find_crafting_plan."""
 
-        return None
+        if plant_data.get("type") in ("material", "base_plant") or plant_data.get("name") in self.all_materials_by_name:
+            return 1
+        return self._decomp_size.get(plant_data.get("id"), 0)
+
+    def find_fusion_match(self, components: List[str]) -> Optional[FusionRecipe]:
+        """Given a list of base component names, finds a matching fusion recipe."""
+        return self._fusions_by_sorted_recipe.get(tuple(sorted(components)))
 
     def parse_almanac_args(self, full_args: str) -> Dict[str, Any]:
         """Parses filters and a page number from a single string."""
@@ -144,7 +207,7 @@ class FusionHelper:
         if not filter_string:
             return {'filters': filters, 'page': page}
 
-        filter_parts = re.split(r'\s+(?=\w+:)', filter_string)
+        filter_parts = _FILTER_SPLIT_RE.split(filter_string)
 
         for part in filter_parts:
             if ":" in part:
@@ -159,57 +222,75 @@ class FusionHelper:
         if not filters:
             return fusions_list
 
-        filtered_results = list(fusions_list)
-        mat_names_to_ids = {v.lower(): k for k, v in self.all_materials.items()}
+        # Each entry pairs a passed fusion with its (index, name, type, recipe) lowercase row.
+        filtered_entries = [(f, self._get_filter_row(f)) for f in fusions_list]
         plans_by_fusion_id = kwargs.get("plans_by_fusion_id", {})
 
         for f_filter in filters:
             key, value = f_filter['key'], f_filter['value']
 
             if key == 'name':
-                filtered_results = [f for f in filtered_results if value in f.name.lower()]
+                filtered_entries = [(f, row) for f, row in filtered_entries if value in row[1]]
             elif key == 'contains':
-                temp_results = []
+                temp_entries = []
                 searched_fusion = self.find_defined_fusion(value)
 
                 if searched_fusion:
-                    search_recipe_counter = Counter(searched_fusion.recipe)
-
-                    for f in filtered_results:
-                        recipe_counter = Counter(f.recipe)
+                    search_recipe_counter = self.recipe_counters_by_id[searched_fusion.id]
+                    component_index_sets = sorted(
+                        (self._fusion_indices_by_component.get(item, set()) for item in search_recipe_counter), key=len
+                    )
+                    candidates = set.intersection(*component_index_sets) if component_index_sets else None
+
+                    for f, row in filtered_entries:
+                        if row[0] is not None:
+                            if candidates is not None and row[0] not in candidates:
+                                continue
+                            recipe_counter = self.recipe_counters_by_id[f.id]
+                        else:
+                            recipe_counter = Counter(f.recipe)
                         is_subset = all(recipe_counter[item] >= count for item, count in search_recipe_counter.items())
                         if is_subset:
-                            temp_results.append(f)
+                            temp_entries.append((f, row))
                 else:
-                    for f in filtered_results:
-                        for component_name in f.recipe:
-                            if value in component_name.lower():
-                                temp_results.append(f)
+                    for f, row in filtered_entries:
+                        for component_lower in row[3]:
+                            if value in component_lower:
+                                temp_entries.append((f, row))
                                 break
 
-                            component_id = mat_names_to_ids.get(component_name.lower())
+                            component_id = self._material_ids_by_lower_name.get(component_lower)
                             if component_id and value in component_id:
-                                temp_results.append(f)
+                                temp_entries.append((f, row))
                                 break
-                filtered_results = temp_results
+                filtered_entries = temp_entries
             elif key == 'discovered':
                 is_true = value == 'true'
-                filtered_results = [f for f in filtered_results if (f.id in discovered_ids) == is_true]
+                filtered_entries = [(f, row) for f, row in filtered_entries if (f.id in discovered_ids) == is_true]
             elif key == 'storage':
                 if not plans_by_fusion_id:
                     continue
                 if value == 'false':
-                    temp_results = [f for f in filtered_results if
-                                    f.id in plans_by_fusion_id and not any(
-                                        asset.get("source") == "storage" for asset in plans_by_fusion_id[f.id])]
-                    filtered_results = temp_results
+                    filtered_entries = [(f, row) for f, row in filtered_entries if
+                                        f.id in plans_by_fusion_id and not any(
+                                            asset.get("source") == "storage" for asset in plans_by_fusion_id[f.id])]
             elif key == 'tier':
                 normalized_value = "tier" + value.lower().replace("infinity", "∞").replace("inf", "∞").replace("tier", "")
-                filtered_results = [f for f in filtered_results if f.type.lower() == normalized_value]
+                tier_indices = self._fusion_indices_by_type_lower.get(normalized_value, frozenset())
+                filtered_entries = [(f, row) for f, row in filtered_entries if
+                                    (row[0] in tier_indices if row[0] is not None else row[2] == normalized_value)]
             elif key == 'missing':
                 pass
 
-        return filtered_results
+        return [f for f, _ in filtered_entries]
+
+    def _get_filter_row(self, f: FusionRecipe) -> Tuple[Optional[int], str, str, Tuple[str, ...]]:
+        """Returns the lowercase filter columns for a fusion, computing them if it is not a catalog entry."""
+
+        i = self._fusion_index_by_id.get(f.id)
+        if i is not None and self.all_fusions[i] is f:
+            return i, self._fusion_names_lower[i], self._fusion_types_lower[i], self._fusion_recipes_lower[i]
+        return None, f.name.lower(), f.type.lower(), tuple(component.lower() for component in f.recipe)
 
     def get_user_whole_assets_with_source(self, profile: UserProfileView) -> List[dict]:
         """
@@ -221,12 +302,18 @@ class FusionHelper:
         assets = []
 
         for i, plant in enumerate(profile.garden):
-            if plant and not isinstance(plant, PlantedSeedling):
-                assets.append({**dataclasses.asdict(plant), "source": "garden", "index": i})
+            if isinstance(plant, PlantedPlant):
+                asset = plant.to_dict()
+                asset["source"] = "garden"
+                asset["index"] = i
+                assets.append(asset)
 
         for i, plant in enumerate(profile.storage_shed):
             if plant:
-                assets.append({**dataclasses.asdict(plant), "source": "storage", "index": i})
+                asset = plant.to_dict()
+                asset["source"] = "storage"
+                asset["index"] = i
+                assets.append(asset)
 
         for item_id, count in profile.inventory.items():
             if item_name := self.all_materials.get(item_id):
@@ -251,6 +338,14 @@ class FusionHelper:
                 validated_assets.append(asset)
         return validated_assets
 
+    def get_component_name_set(self, assets_list: List[dict]) -> set:
+        """Returns the union of base component names that the given assets deconstruct into."""
+
+        component_names = set()
+        for asset in self.get_valid_crafting_components(assets_list):
+            component_names.update(self.deconstruct_plant_cached(asset)[0])
+        return component_names
+
     def find_crafting_plan(
             self,
             recipe_counter: Counter,
@@ -265,16 +360,22 @@ class FusionHelper:
         effective_assets = self.get_valid_crafting_components(temp_assets)
         needed = recipe_counter.copy()
 
-        sorted_assets = sorted(effective_assets, key=lambda x: len(self.deconstruct_plant(x)[0]), reverse=True)
+        sorted_assets = sorted(effective_assets, key=self._get_decomp_size, reverse=True)
         plan = []
 
         for asset in sorted_assets:
-            asset_components, errors = self.deconstruct_plant(asset)
-            if errors:
+            if not needed:
+                break
+
+            asset_counter = self.get_component_counter(asset)
+            if asset_counter is None:
                 continue
-            asset_counter = Counter(asset_components)
             if all(needed.get(item, 0) >= count for item, count in asset_counter.items()):
-                needed -= asset_counter
+                for item, count in asset_counter.items():
+                    if needed[item] == count:
+                        del needed[item]
+                    else:
+                        needed[item] -= count
                 plan.append(asset)
 
         remaining_needs = Counter({k: v for k, v in needed.items() if v > 0})
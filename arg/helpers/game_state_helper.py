@@ -54,6 +54,18 @@ class GameStateHelper:
     def set_global_state(self, key: str, value: Any):
         self.game_state["global_state"][key] = value
 
+    def get_growth_duration_minutes(self) -> int:
+        return self.get_global_state("plant_growth_duration_minutes", 240)
+
+    def set_growth_duration_minutes(self, minutes: int):
+        self.set_global_state("plant_growth_duration_minutes", minutes)
+
+    def get_penny_refresh_interval_hours(self) -> int:
+        return self.get_global_state("treasure_shop_refresh_interval_hours", 1)
+
+    def set_penny_refresh_interval_hours(self, hours: int):
+        self.set_global_state("treasure_shop_refresh_interval_hours", hours)
+
     def get_rux_stock(self, item_id: str) -> int:
         return self.get_global_state(f"{item_id}_stock", 0)
 
@@ -1,6 +1,6 @@
 import dataclasses
 from collections import Counter
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 from types import MappingProxyType
 
 from .game_state_helper import GameStateHelper
@@ -23,6 +23,8 @@ class GardenHelper:
     def __init__(self, game_state_helper: GameStateHelper):
         self.game_state_helper = game_state_helper  # Use a short alias for convenience
         self._user_cache: Dict[int, UserProfile] = {}
+        self._view_cache: Dict[int, UserProfileView] = {}
+        self._unlocked_mask_cache: Dict[int, int] = {}
 
     @staticmethod
     def _dict_to_slot_item(item_dict: Optional[Dict[str, Any]]) -> SlotItem:
@@ -71,6 +73,7 @@ class GardenHelper:
         serializable_data.pop('user_id')
 
         self.game_state_helper.set_user_data(user_profile.user_id, serializable_data)
+        self._view_cache.pop(user_profile.user_id, None)
 
     def _get_or_create_user_profile(self, user_id: int) -> UserProfile:
         if user_id in self._user_cache:
@@ -84,8 +87,13 @@ class GardenHelper:
         return user_profile
 
     def get_user_profile_view(self, user_id: int) -> UserProfileView:
+        """Returns the user's read-only view, reusing the cached one until the profile is next saved."""
+
+        if user_id in self._view_cache:
+            return self._view_cache[user_id]
+
         user_profile = self._get_or_create_user_profile(user_id)
-        return UserProfileView(
+        profile_view = UserProfileView(
             user_id=user_profile.user_id,
             balance=user_profile.balance,
             sun_mastery=user_profile.sun_mastery,
@@ -98,6 +106,9 @@ class GardenHelper:
             discovered_fusions=tuple(user_profile.discovered_fusions),
             unlocked_backgrounds=tuple(user_profile.unlocked_backgrounds),
         )
+        self._view_cache[user_id] = profile_view
+
+        return profile_view
 
     def get_all_user_ids(self) -> List[int]:
         all_users = self.game_state_helper.get_all_user_data()
@@ -109,6 +120,32 @@ class GardenHelper:
 
         return f"plot_{slot_1_indexed}" in profile.inventory
 
+    def get_unlocked_slot_mask(self, user_id: int) -> int:
+        """Returns a bitmask of the user's unlocked plots, where bit i is set if plot i + 1 is unlocked."""
+
+        mask = self._unlocked_mask_cache.get(user_id)
+
+        if mask is None:
+            profile = self._get_or_create_user_profile(user_id)
+            mask = 0
+
+            for i in range(len(profile.garden)):
+                if self.is_slot_unlocked(profile, i + 1):
+                    mask |= 1 << i
+
+            self._unlocked_mask_cache[user_id] = mask
+
+        return mask
+
+    @staticmethod
+    def iter_slot_indices(mask: int) -> Iterator[int]:
+        """Yields the 0-based indices of the set bits in a slot mask, lowest first."""
+
+        while mask:
+            low_bit = mask & -mask
+            yield low_bit.bit_length() - 1
+            mask ^= low_bit
+
     def update_seedling_progress(self, user_id: int, plot_index_0based: int, progress_increase: float):
         profile = self._get_or_create_user_profile(user_id)
 
@@ -189,56 +226,102 @@ class GardenHelper:
 
         return display_lines, occupied, capacity
 
-    def store_plant(self, user_id: int, plot_index_0based: int) -> Tuple[bool, str]:
+    def store_plants(self, user_id: int, plot_indices_0based: Iterable[int]) -> Tuple[List[str], List[str]]:
+        """
+        Validates and moves the plants in the given plots into free storage slots, saving the profile once.
+        Returns the summaries of the moved plants and the error messages for the plots that were skipped.
+        """
+
         profile = self._get_or_create_user_profile(user_id)
-        profile_view = self.get_user_profile_view(user_id)
-        capacity = self.get_storage_capacity(profile_view)
+        capacity = self.get_storage_capacity(profile)
+        moved_plants_summary: List[str] = []
+        error_messages: List[str] = []
 
-        if sum(1 for s in profile.storage_shed[:capacity] if s is not None) >= capacity:
-            return False, "Insufficient storage shed capacity."
+        for plot_index_0based in sorted(plot_indices_0based):
+            plot_num = plot_index_0based + 1
 
-        plant_to_move = profile.garden[plot_index_0based]
-        first_empty_slot = next((i for i, s in enumerate(profile.storage_shed) if s is None), -1)
+            if not (0 <= plot_index_0based < len(profile.garden)):
+                error_messages.append(f"Plot {plot_num}: Invalid designation (must be 1-12).")
+                continue
 
-        if first_empty_slot == -1 or first_empty_slot >= capacity:
-            return False, "Internal Error: Could not find an empty storage slot."
+            plant_to_move = profile.garden[plot_index_0based]
+            if not isinstance(plant_to_move, PlantedPlant):
+                error_messages.append(f"Plot {plot_num}: Is empty or contains a non-storable seedling.")
+                continue
 
-        profile.storage_shed[first_empty_slot] = plant_to_move
-        profile.garden[plot_index_0based] = None
-        self._save_user_profile(profile)
-        return True, f"**{plant_to_move.name}** (plot {plot_index_0based + 1}) -> storage slot {first_empty_slot + 1}"
+            first_empty_slot = next((i for i, s in enumerate(profile.storage_shed[:capacity]) if s is None), -1)
+            if first_empty_slot == -1:
+                error_messages.append(f"Plot {plot_num}: Failed to store. Reason: Insufficient storage shed capacity.")
+                continue
 
-    def unstore_plant(self, user_id: int, storage_index_0based: int) -> Tuple[bool, str]:
-        profile = self._get_or_create_user_profile(user_id)
-        profile_view = self.get_user_profile_view(user_id)
+            profile.storage_shed[first_empty_slot] = plant_to_move
+            profile.garden[plot_index_0based] = None
+            moved_plants_summary.append(
+                f"**{plant_to_move.name}** (plot {plot_num}) -> storage slot {first_empty_slot + 1}")
 
-        open_plots = [i for i, s in enumerate(profile_view.garden) if
-                      self.is_slot_unlocked(profile_view, i + 1) and s is None]
+        if moved_plants_summary:
+            self._save_user_profile(profile)
 
-        if not open_plots:
-            return False, "Insufficient garden capacity."
+        return moved_plants_summary, error_messages
 
-        plant_to_move = profile.storage_shed[storage_index_0based]
-        target_plot_idx = open_plots[0]
-        profile.garden[target_plot_idx] = plant_to_move
-        profile.storage_shed[storage_index_0based] = None
-        self._save_user_profile(profile)
-        return True, f"**{plant_to_move.name}** (storage {storage_index_0based + 1}) -> garden plot {target_plot_idx + 1}"
+    def unstore_plants(self, user_id: int, storage_indices_0based: Iterable[int]) -> Tuple[List[str], List[str]]:
+        """
+        Validates and moves the plants in the given storage slots into open garden plots, saving the profile once.
+        Returns the summaries of the retrieved plants and the error messages for the slots that were skipped.
+        """
 
-    def set_balance(self, user_id: int, amount: int):
+        profile = self._get_or_create_user_profile(user_id)
+        capacity = self.get_storage_capacity(profile)
+        unlocked_mask = self.get_unlocked_slot_mask(user_id)
+        retrieved_plants_summary: List[str] = []
+        error_messages: List[str] = []
+
+        for storage_index_0based in sorted(storage_indices_0based):
+            slot_num = storage_index_0based + 1
+
+            if not (0 <= storage_index_0based < capacity):
+                error_messages.append(f"Storage Slot {slot_num}: Invalid or inaccessible (Capacity: {capacity}).")
+                continue
+
+            plant_to_move = profile.storage_shed[storage_index_0based]
+            if plant_to_move is None:
+                error_messages.append(f"Storage Slot {slot_num}: Is empty.")
+                continue
+
+            target_plot_idx = next(
+                (i for i in self.iter_slot_indices(unlocked_mask) if profile.garden[i] is None), -1)
+            if target_plot_idx == -1:
+                error_messages.append(
+                    f"Storage Slot {slot_num}: Failed to retrieve. Reason: Insufficient garden capacity.")
+                continue
+
+            profile.garden[target_plot_idx] = plant_to_move
+            profile.storage_shed[storage_index_0based] = None
+            retrieved_plants_summary.append(
+                f"**{plant_to_move.name}** (storage {slot_num}) -> garden plot {target_plot_idx + 1}")
+
+        if retrieved_plants_summary:
+            self._save_user_profile(profile)
+
+        return retrieved_plants_summary, error_messages
+
+    def set_balance(self, user_id: int, amount: int) -> int:
         profile = self._get_or_create_user_profile(user_id)
         profile.balance = max(0, amount)
         self._save_user_profile(profile)
+        return profile.balance
 
-    def set_sun_mastery(self, user_id: int, level: int):
+    def set_sun_mastery(self, user_id: int, level: int) -> int:
         profile = self._get_or_create_user_profile(user_id)
         profile.sun_mastery = max(0, level)
         self._save_user_profile(profile)
+        return profile.sun_mastery
 
-    def set_time_mastery(self, user_id: int, level: int):
+    def set_time_mastery(self, user_id: int, level: int) -> int:
         profile = self._get_or_create_user_profile(user_id)
         profile.time_mastery = max(0, level)
         self._save_user_profile(profile)
+        return profile.time_mastery
 
     def add_balance(self, user_id: int, amount: int):
         if amount > 0:
@@ -252,13 +335,13 @@ class GardenHelper:
             profile.balance = max(0, profile.balance - amount)
             self._save_user_profile(profile)
 
-    def add_item_to_inventory(self, user_id: int, item_id: str, quantity: int = 1):
-        profile = self._get_or_create_user_profile(user_id)
+    def _add_to_inventory(self, profile: UserProfile, item_id: str, quantity: int = 1):
         profile.inventory[item_id] = profile.inventory.get(item_id, 0) + quantity
-        self._save_user_profile(profile)
 
-    def remove_item_from_inventory(self, user_id: int, item_id: str, quantity: int = 1) -> bool:
-        profile = self._get_or_create_user_profile(user_id)
+        if item_id.startswith("plot_"):
+            self._unlocked_mask_cache.pop(profile.user_id, None)
+
+    def _remove_from_inventory(self, profile: UserProfile, item_id: str, quantity: int = 1) -> bool:
         current_amount = profile.inventory.get(item_id, 0)
 
         if current_amount < quantity:
@@ -270,9 +353,96 @@ class GardenHelper:
         else:
             profile.inventory[item_id] = new_amount
 
+        if item_id.startswith("plot_"):
+            self._unlocked_mask_cache.pop(profile.user_id, None)
+
+        return True
+
+    def add_item_to_inventory(self, user_id: int, item_id: str, quantity: int = 1):
+        profile = self._get_or_create_user_profile(user_id)
+        self._add_to_inventory(profile, item_id, quantity)
+        self._save_user_profile(profile)
+
+    def remove_item_from_inventory(self, user_id: int, item_id: str, quantity: int = 1) -> bool:
+        profile = self._get_or_create_user_profile(user_id)
+
+        if not self._remove_from_inventory(profile, item_id, quantity):
+            return False
+
         self._save_user_profile(profile)
         return True
 
+    def apply_purchase(self, user_id: int, price: int, plot_index_0based: Optional[int] = None,
+                       slot_item: SlotItem = None, item_id: Optional[str] = None):
+        """Debits a purchase and delivers it to a garden plot and/or the inventory in a single profile save."""
+
+        profile = self._get_or_create_user_profile(user_id)
+
+        if price > 0:
+            profile.balance = max(0, profile.balance - price)
+
+        if plot_index_0based is not None and 0 <= plot_index_0based < len(profile.garden):
+            profile.garden[plot_index_0based] = slot_item
+
+        if item_id is not None:
+            self._add_to_inventory(profile, item_id)
+
+        self._save_user_profile(profile)
+
+    def apply_garden_changes(self, user_id: int, plot_updates: Dict[int, SlotItem],
+                             inventory_delta: Optional[Dict[str, int]] = None) -> bool:
+        """
+        Applies plot assignments and inventory deltas to a single user's profile, saving it once.
+        Returns False without changing anything if the inventory cannot cover a removal.
+        """
+
+        profile = self._get_or_create_user_profile(user_id)
+        inventory_delta = inventory_delta or {}
+
+        if any(profile.inventory.get(item_id, 0) < -delta for item_id, delta in inventory_delta.items() if delta < 0):
+            return False
+
+        for item_id, delta in inventory_delta.items():
+            if delta > 0:
+                self._add_to_inventory(profile, item_id, delta)
+            elif delta < 0:
+                self._remove_from_inventory(profile, item_id, -delta)
+
+        for plot_index_0based, slot_item in plot_updates.items():
+            if 0 <= plot_index_0based < len(profile.garden):
+                profile.garden[plot_index_0based] = slot_item
+
+        self._save_user_profile(profile)
+        return True
+
+    def apply_trade_changes(self, changes: Dict[str, Any]):
+        """Applies the change plan of an executed trade, saving each affected profile once."""
+
+        touched_user_ids = set()
+
+        for update in changes.get("balance_updates", ()):
+            profile = self._get_or_create_user_profile(update["user_id"])
+            profile.balance = max(0, profile.balance + update["amount"])
+            touched_user_ids.add(profile.user_id)
+
+        for move in changes.get("plant_moves", ()):
+            from_profile = self._get_or_create_user_profile(move["from_user_id"])
+            to_profile = self._get_or_create_user_profile(move["to_user_id"])
+            from_profile.garden[move["from_plot_idx"]] = None
+            to_profile.garden[move["to_plot_idx"]] = move["plant_data"]
+            touched_user_ids.update((from_profile.user_id, to_profile.user_id))
+
+        for transfer in changes.get("item_transfers", ()):
+            from_profile = self._get_or_create_user_profile(transfer["from_user_id"])
+            to_profile = self._get_or_create_user_profile(transfer["to_user_id"])
+
+            if self._remove_from_inventory(from_profile, transfer["item_id"], transfer["quantity"]):
+                self._add_to_inventory(to_profile, transfer["item_id"], transfer["quantity"])
+                touched_user_ids.update((from_profile.user_id, to_profile.user_id))
+
+        for user_id in touched_user_ids:
+            self._save_user_profile(self._get_or_create_user_profile(user_id))
+
     def set_last_daily(self, user_id: int, date_str: str):
         profile = self._get_or_create_user_profile(user_id)
         profile.last_daily = date_str
@@ -1,5 +1,7 @@
+import asyncio
 import io
 import pathlib
+import threading
 from typing import Dict, Optional, Tuple, Set
 
 import discord
@@ -36,6 +38,9 @@ class ImageHelper:
         self._is_ready = False
 
         self.image_cache: Dict[str, Image.Image] = {}
+        self._png_bytes_cache: Dict[str, bytes] = {}
+        self._png_encode_lock = threading.Lock()
+        self._png_encode_tasks: Dict[str, asyncio.Task] = {}
         self.progress_font: Optional[ImageFont.FreeTypeFont] = None
 
         for r_idx in range(self._GRID_ROWS):
@@ -47,29 +52,92 @@ class ImageHelper:
     def _sanitize_id_for_filename(self, plant_id: str) -> str:
         return plant_id.replace(" ", "_")
 
-    def get_image_file_for_plant(self, plant_id: str) -> Optional[discord.File]:
-        if not plant_id:
-            return None
+    def _get_plant_png_bytes(self, sanitized_filename: str) -> Optional[bytes]:
+        """Returns the encoded PNG for a cached plant image, encoding it on first use."""
 
-        sanitized_filename = f"{self._sanitize_id_for_filename(plant_id)}.png"
+        if (png_bytes := self._png_bytes_cache.get(sanitized_filename)) is not None:
+            return png_bytes
 
-        if cached_image := self.image_cache.get(sanitized_filename):
+        cached_image = self.image_cache.get(sanitized_filename)
+        if not cached_image:
+            return None
+
+        # PIL images are not safe to encode from two threads at once, and this also runs in worker threads.
+        with self._png_encode_lock:
+            if (png_bytes := self._png_bytes_cache.get(sanitized_filename)) is not None:
+                return png_bytes
             try:
                 buffer = io.BytesIO()
                 cached_image.save(buffer, format='PNG')
-                buffer.seek(0)
-                return discord.File(buffer, filename=sanitized_filename)
+                png_bytes = self._png_bytes_cache[sanitized_filename] = buffer.getvalue()
+                return png_bytes
             except Exception as e:
-                self.logger.log_to_discord(
+                self.logger.init_log(
                     f"DEBUG: Failed to create discord.File from cached image {sanitized_filename}: {e}", "WARNING")
 
         return None
 
+    def _get_png_encode_task(self, sanitized_filename: str) -> Optional[asyncio.Task]:
+        """Returns the in-flight encode for an uncached image, starting one if needed."""
+
+        if sanitized_filename in self._png_bytes_cache or sanitized_filename not in self.image_cache:
+            return None
+
+        task = self._png_encode_tasks.get(sanitized_filename)
+        if task is None:
+            task = asyncio.create_task(asyncio.to_thread(self._get_plant_png_bytes, sanitized_filename))
+            self._png_encode_tasks[sanitized_filename] = task
+
+            def forget_task(done_task: asyncio.Task):
+                if self._png_encode_tasks.get(sanitized_filename) is done_task:
+                    del self._png_encode_tasks[sanitized_filename]
+
+            task.add_done_callback(forget_task)
+        return task
+
+    def get_image_file_for_plant(self, plant_id: str) -> Optional[discord.File]:
+        if not plant_id:
+            return None
+
+        sanitized_filename = f"{self._sanitize_id_for_filename(plant_id)}.png"
+
+        if png_bytes := self._get_plant_png_bytes(sanitized_filename):
+            return discord.File(io.BytesIO(png_bytes), filename=sanitized_filename)
+
+        return None
+
+    async def get_image_file_for_plant_async(self, plant_id: str) -> Optional[discord.File]:
+        """Like get_image_file_for_plant, but encodes uncached images in a worker thread."""
+
+        if not plant_id:
+            return None
+
+        sanitized_filename = f"{self._sanitize_id_for_filename(plant_id)}.png"
+
+        png_bytes = self._png_bytes_cache.get(sanitized_filename)
+        if png_bytes is None and (task := self._get_png_encode_task(sanitized_filename)):
+            png_bytes = await asyncio.shield(task)
+
+        if png_bytes:
+            return discord.File(io.BytesIO(png_bytes), filename=sanitized_filename)
+
+        return None
+
+    def warm_plant_image(self, plant_id: str):
+        """Starts encoding a plant image in the background so a later send finds it cached."""
+
+        if not plant_id:
+            return
+
+        self._get_png_encode_task(f"{self._sanitize_id_for_filename(plant_id)}.png")
+
     def load_assets(self):
         if not PIL_AVAILABLE:
             return
 
         self.image_cache.clear()
+        self._png_bytes_cache.clear()
+        self._png_encode_tasks.clear()
         image_dir = self.data_path / "images"
 
         if not image_dir.is_dir():
@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime, timezone
 from typing import Optional, List, Tuple
 import discord
@@ -52,16 +53,26 @@ class LoggingHelper:
         """
         Synchronous logger for use during cog initialization. Queues logs to be sent
         once the bot is ready. Also prints to console immediately.
+        Safe to call from worker threads.
         """
 
         timestamp = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')
         print(f"[INIT_LOG|{level.upper()}|{timestamp}] {message}")
 
         if self.bot and hasattr(self.bot, 'loop') and self.bot.loop.is_running():
-            self.bot.loop.create_task(self.log_to_discord(message, level=level))
+            if self._on_bot_loop():
+                self.bot.loop.create_task(self.log_to_discord(message, level=level))
+            else:
+                asyncio.run_coroutine_threadsafe(self.log_to_discord(message, level=level), self.bot.loop)
         else:
             self._init_log_queue.append((message, level))
 
+    def _on_bot_loop(self) -> bool:
+        try:
+            return asyncio.get_running_loop() is self.bot.loop
+        except RuntimeError:
+            return False
+
     async def flush_init_log_queue(self):
         """Sends any queued logs generated before the bot was ready."""
 
@@ -1,6 +1,8 @@
+import functools
 import random
+import time
 from datetime import datetime, timedelta
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from .game_state_helper import GameStateHelper
 from .logging_helper import LoggingHelper
@@ -28,11 +30,13 @@ class ShopHelper:
         self.dave_shop_catalog = dave_shop_catalog
         self.materials_catalog = materials_catalog
 
-    def get_all_item_definitions(self) -> Dict[str, Any]:
-        """
-        Returns a consolidated dictionary of all known items from all shops and materials.
-        """
+        self._all_item_definitions: Dict[str, Any] = self._build_all_item_definitions()
+        self._item_id_lower_index: Dict[str, str] = {}
 
+        for item_id in self._all_item_definitions:
+            self._item_id_lower_index.setdefault(item_id.lower(), item_id)
+
+    def _build_all_item_definitions(self) -> Dict[str, Any]:
         all_items = {}
         all_items.update(self.rux_shop_catalog)
         all_items.update(self.penny_shop_catalog)
@@ -44,14 +48,36 @@ class ShopHelper:
 
         return all_items
 
-    def get_next_penny_refresh_time(self, current_est_time: datetime) -> datetime:
-        """Calculates the next scheduled refresh time for Penny's Treasures."""
+    def get_all_item_definitions(self) -> Dict[str, Any]:
+        """
+        Returns a consolidated dictionary of all known items from all shops and materials.
+        The catalogs are static, so the dictionary is built once and must not be mutated by callers.
+        """
+
+        return self._all_item_definitions
+
+    def resolve_item_id(self, item_id: str) -> Optional[str]:
+        """Returns the canonical item ID matching the given ID case-insensitively, or None if unknown."""
+
+        if item_id in self._all_item_definitions:
+            return item_id
+
+        return self._item_id_lower_index.get(item_id.lower())
 
-        interval = self.game_state_helper.get_global_state("treasure_shop_refresh_interval_hours", 1)
+    def _get_penny_refresh_interval(self) -> int:
+        """Returns the configured Penny refresh interval, falling back to hourly if it is invalid."""
+
+        interval = self.game_state_helper.get_penny_refresh_interval_hours()
 
         if not isinstance(interval, int) or interval <= 0 or 24 % interval != 0:
             interval = 1
 
+        return interval
+
+    @staticmethod
+    def _compute_next_penny_refresh(current_est_time: datetime, interval: int) -> datetime:
+        """Calculates the first refresh boundary after the given time for a validated interval."""
+
         refresh_hours = list(range(0, 24, interval))
 
         for h in refresh_hours:
@@ -64,6 +90,32 @@ class ShopHelper:
             hour=first_refresh_hour_of_day, minute=0, second=0, microsecond=0
         )
 
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _cached_penny_next_refresh(minute_bucket: int, interval: int) -> datetime:
+        """Memoizes the next Penny refresh time for a single minute bucket."""
+
+        current_est_time = datetime.fromtimestamp(minute_bucket * 60, tz=TimeHelper.EST)
+        return ShopHelper._compute_next_penny_refresh(current_est_time, interval)
+
+    def get_next_penny_refresh_time(self, current_est_time: datetime) -> datetime:
+        """Calculates the next scheduled refresh time for Penny's Treasures."""
+
+        return self._compute_next_penny_refresh(current_est_time, self._get_penny_refresh_interval())
+
+    def get_cached_next_penny_refresh_time(self) -> datetime:
+        """Returns the next Penny refresh time for the current minute, recomputing it at most once per minute."""
+
+        return self._cached_penny_next_refresh(int(time.time() // 60), self._get_penny_refresh_interval())
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def get_next_dave_refresh_time(last_refresh_ts: float) -> datetime:
+        """Calculates the top of the hour following Dave's last refresh. Memoized until the next refresh."""
+
+        last_refresh_dt = datetime.fromtimestamp(last_refresh_ts, tz=TimeHelper.EST)
+        return (last_refresh_dt + timedelta(hours=1)).replace(minute=0, second=0, microsecond=0)
+
     def _generate_new_penny_stock(self) -> List[Dict[str, Any]]:
         """Generates a new random stock for Penny's Treasures."""
 
@@ -164,8 +216,7 @@ class ShopHelper:
         if not needs_refresh and last_refresh_ts is None:
             needs_refresh = True
         elif not needs_refresh:
-            last_refresh_dt = datetime.fromtimestamp(last_refresh_ts, tz=TimeHelper.EST)
-            next_refresh = (last_refresh_dt + timedelta(hours=1)).replace(minute=0, second=0, microsecond=0)
+            next_refresh = self.get_next_dave_refresh_time(last_refresh_ts)
             needs_refresh = now_est >= next_refresh
 
         if needs_refresh:
@@ -1,3 +1,5 @@
+import asyncio
+import time
 from collections import Counter
 from typing import Any, Dict, Optional, Tuple
 
@@ -10,15 +12,48 @@ from .lock_helper import LockHelper
 class TradeHelper:
     """Manages the state and execution of all user-to-user trades, including locking."""
 
+    DM_BLOCKED_TTL_SECONDS = 3600
+    DM_BLOCKED_MAX_ENTRIES = 10_000
+
     def __init__(self, lock_helper: LockHelper):
         self.lock_helper = lock_helper
         self.pending_trades: Dict[str, Dict[str, Any]] = {}
+        self._resolution_events: Dict[str, asyncio.Event] = {}
+        self._dm_blocked_until: Dict[int, float] = {}
+
+    def is_dm_blocked(self, user_id: int) -> bool:
+        """Returns True if a recent trade DM to this user was rejected by Discord."""
+
+        blocked_until = self._dm_blocked_until.get(user_id)
+        if blocked_until is None:
+            return False
+
+        if blocked_until <= time.monotonic():
+            del self._dm_blocked_until[user_id]
+            return False
+
+        return True
+
+    def mark_dm_blocked(self, user_id: int):
+        """Remembers that this user rejected a trade DM, so proposals skip them until the TTL expires."""
+
+        now = time.monotonic()
+        # Re-inserting keeps the dict in expiry order, so expired and excess entries are always at the front.
+        self._dm_blocked_until.pop(user_id, None)
+        self._dm_blocked_until[user_id] = now + self.DM_BLOCKED_TTL_SECONDS
+
+        while self._dm_blocked_until:
+            oldest_user_id, blocked_until = next(iter(self._dm_blocked_until.items()))
+            if blocked_until > now and len(self._dm_blocked_until) <= self.DM_BLOCKED_MAX_ENTRIES:
+                break
+            del self._dm_blocked_until[oldest_user_id]
 
     def propose_trade(self, sender: discord.User, recipient: discord.User, trade_details: Dict[str, Any]) -> str:
         """Adds a new trade to the pending trades dictionary and locks both users."""
 
         trade_id = trade_details["id"]
         self.pending_trades[trade_id] = trade_details
+        self._resolution_events[trade_id] = asyncio.Event()
 
         sender_lock_msg = f"Awaiting a response from {recipient.mention} for your proposal (`{trade_id}`)."
         recipient_lock_msg = f"Awaiting your response for a proposal from {sender.mention} (`{trade_id}`). " \
@@ -35,8 +70,44 @@ class TradeHelper:
         if trade:
             self.lock_helper.remove_lock_for_user(trade["sender_id"])
             self.lock_helper.remove_lock_for_user(trade["recipient_id"])
+
+        resolution_event = self._resolution_events.pop(trade_id, None)
+        if resolution_event:
+            resolution_event.set()
+
         return trade
 
+    def try_resolve_trade(self, trade_id: str, requester_id: int,
+                          allow_sender: bool = False) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """
+        Resolves a trade on behalf of a participant in one step.
+        Returns ("ok", trade), ("not_found", None) or ("not_yours", None).
+        """
+
+        trade = self.pending_trades.get(trade_id)
+        if trade is None:
+            return "not_found", None
+
+        is_recipient = trade.get("recipient_id") == requester_id
+        is_sender = allow_sender and trade.get("sender_id") == requester_id
+        if not (is_recipient or is_sender):
+            return "not_yours", None
+
+        return "ok", self.resolve_trade(trade_id)
+
+    async def wait_for_resolution(self, trade_id: str, timeout: float) -> bool:
+        """Waits until the trade is resolved or the timeout elapses. Returns True if it was resolved in time."""
+
+        resolution_event = self._resolution_events.get(trade_id)
+        if resolution_event is None:
+            return True
+
+        try:
+            await asyncio.wait_for(resolution_event.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
     def execute_plant_trade(
             self,
             trade_data: Dict[str, Any],
@@ -71,7 +142,7 @@ class TradeHelper:
             "balance_updates": [
                 {"user_id": trade_data["sender_id"], "amount": -money_to_give},
                 {"user_id": trade_data["recipient_id"], "amount": money_to_give},
-            ],
+            ] if money_to_give else [],
             "plant_moves": [],
         }
 
@@ -122,7 +193,7 @@ class TradeHelper:
             "balance_updates": [
                 {"user_id": trade_data["sender_id"], "amount": -sun_to_give},
                 {"user_id": trade_data["recipient_id"], "amount": sun_to_give},
-            ],
+            ] if sun_to_give else [],
             "item_transfers": [],
         }
 
@@ -1,7 +1,11 @@
+import sys
 from dataclasses import dataclass, field
-from typing import Tuple, Optional
+from typing import FrozenSet, Tuple, Optional
 
-@dataclass(frozen=True)
+# Catalog definitions live for the whole process, so drop the per-instance __dict__ where supported.
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(frozen=True, **_SLOTS)
 class BasePlant:
     """Represents a single plant definition from base_plants.json."""
     id: str
@@ -10,7 +14,7 @@ class BasePlant:
     category: str
     shop: bool = False
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class SeedlingDefinition:
     """Represents a seedling definition from seedlings.json."""
     id: str
@@ -19,7 +23,7 @@ class SeedlingDefinition:
     stock: int
     growth_multiplier: float = 1.0
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class FusionRecipe:
     """Represents a fusion recipe from fusions.json."""
     id: str
@@ -27,16 +31,24 @@ class FusionRecipe:
     type: str
     recipe: Tuple[str, ...]
     visibility: str = "visible"
+    recipe_set: FrozenSet[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "recipe_set", frozenset(self.recipe))
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class Background:
     """Represents a garden background from backgrounds.json."""
     id: str
     name: str
     image_file: str
     required_fusions: Tuple[str, ...] = field(default_factory=tuple)
+    required_fusions_set: FrozenSet[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "required_fusions_set", frozenset(self.required_fusions))
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class ShopItemDefinition:
     """A generic definition for an item sold in any shop."""
     id: str
@@ -1,6 +1,6 @@
 from dataclasses import dataclass, field
 from types import MappingProxyType
-from typing import Tuple, Optional, List, Union, Dict
+from typing import Tuple, Optional, List, Union, Dict, FrozenSet
 
 
 @dataclass
@@ -22,6 +22,10 @@ class PlantedPlant:
     name: str
     type: str
 
+    def to_dict(self) -> Dict[str, str]:
+        """Shallow dict form, equivalent to dataclasses.asdict for this flat model."""
+        return {"id": self.id, "name": self.name, "type": self.type}
+
 
 SlotItem = Union[PlantedSeedling, PlantedPlant, None]
 
@@ -56,4 +60,10 @@ class UserProfileView:
     storage_shed: Tuple[Optional[PlantedPlant], ...]
     inventory: MappingProxyType[str, int]
     discovered_fusions: Tuple[str, ...]
-    unlocked_backgrounds: Tuple[str, ...]
\ No newline at end of file
+    unlocked_backgrounds: Tuple[str, ...]
+    discovered_fusions_set: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    unlocked_backgrounds_set: FrozenSet[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "discovered_fusions_set", frozenset(self.discovered_fusions))
+        object.__setattr__(self, "unlocked_backgrounds_set", frozenset(self.unlocked_backgrounds))
\ No newline at end of file
@@ -0,0 +1,3 @@
+from .confirm import ConfirmView
+
+__all__ = ["ConfirmView"]
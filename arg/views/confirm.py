@@ -0,0 +1,48 @@
+from typing import Optional
+
+import discord
+
+
+class ConfirmView(discord.ui.View):
+    """A Confirm/Cancel button pair that only the invoking user can press."""
+
+    def __init__(self, author_id: int, timeout: float = 60.0):
+        super().__init__(timeout=timeout)
+        self.author_id: int = author_id
+        self.value: Optional[bool] = None
+        self.message: Optional[discord.Message] = None
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        """Rejects presses from anyone other than the invoking user."""
+
+        if interaction.user.id != self.author_id:
+            await interaction.response.send_message("This confirmation is not for you.", ephemeral=True)
+            return False
+        return True
+
+    async def _finish(self, interaction: discord.Interaction, value: bool):
+        self.value = value
+        for child in self.children:
+            child.disabled = True
+        await interaction.response.edit_message(view=self)
+        self.stop()
+
+    @discord.ui.button(label="Confirm", style=discord.ButtonStyle.green, emoji="✅")
+    async def confirm(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._finish(interaction, True)
+
+    @discord.ui.button(label="Cancel", style=discord.ButtonStyle.grey, emoji="❌")
+    async def cancel(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._finish(interaction, False)
+
+    async def on_timeout(self):
+        """Disables the buttons on the original message once the view expires."""
+
+        if self.message is None:
+            return
+        for child in self.children:
+            child.disabled = True
+        try:
+            await self.message.edit(view=self)
+        except discord.HTTPException:
+            pass